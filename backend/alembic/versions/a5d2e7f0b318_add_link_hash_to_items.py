@@ -0,0 +1,33 @@
+"""add_link_hash_to_items
+
+Revision ID: a5d2e7f0b318
+Revises: f4a1c8e93d27
+Create Date: 2026-10-17 15:06:44.218903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5d2e7f0b318'
+down_revision: Union[str, Sequence[str], None] = 'f4a1c8e93d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add 64-bit canonical link hash to items.
+
+    Existing rows are filled by ``python -m backend.scripts.backfill_link_hash``.
+    """
+    op.add_column('items', sa.Column('link_hash', sa.BigInteger(), nullable=True))
+    op.create_index(op.f('ix_items_link_hash'), 'items', ['link_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove link_hash from items."""
+    op.drop_index(op.f('ix_items_link_hash'), table_name='items')
+    op.drop_column('items', 'link_hash')
@@ -0,0 +1,30 @@
+"""reset_items_content_hash
+
+Revision ID: a9e3d5c71b28
+Revises: f7c2a4e8b913
+Create Date: 2026-10-17 23:05:31.804126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e3d5c71b28'
+down_revision: Union[str, Sequence[str], None] = 'f7c2a4e8b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade data: Clear content hashes computed before text normalization.
+
+    The next collection only fills NULL hashes in, so changing the hash
+    formula does not mark every stored item as edited.
+    """
+    op.execute("UPDATE items SET content_hash = NULL WHERE content_hash IS NOT NULL")
+
+
+def downgrade() -> None:
+    """Downgrade data: Nothing to restore (hashes are refilled on collection)."""
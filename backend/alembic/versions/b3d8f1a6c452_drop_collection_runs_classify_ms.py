@@ -0,0 +1,28 @@
+"""drop_collection_runs_classify_ms
+
+Revision ID: b3d8f1a6c452
+Revises: a9e3d5c71b28
+Create Date: 2026-10-17 23:48:19.260741
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d8f1a6c452'
+down_revision: Union[str, Sequence[str], None] = 'a9e3d5c71b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Drop collection_runs.classify_ms (classification left collect_source)."""
+    op.drop_column('collection_runs', 'classify_ms')
+
+
+def downgrade() -> None:
+    """Downgrade schema: Re-add collection_runs.classify_ms."""
+    op.add_column('collection_runs', sa.Column('classify_ms', sa.Float(), nullable=True))
@@ -0,0 +1,34 @@
+"""add_content_hash_to_items
+
+Revision ID: b6e3f1a2c947
+Revises: a5d2e7f0b318
+Create Date: 2026-10-17 16:22:17.604531
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e3f1a2c947'
+down_revision: Union[str, Sequence[str], None] = 'a5d2e7f0b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add entry content hash to items and updated_items to collection_runs.
+
+    Existing items keep content_hash NULL; collection fills it the next time
+    the entry is seen, without treating it as a change.
+    """
+    op.add_column('items', sa.Column('content_hash', sa.BigInteger(), nullable=True))
+    op.add_column('collection_runs', sa.Column('updated_items', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove content hash columns."""
+    op.drop_column('collection_runs', 'updated_items')
+    op.drop_column('items', 'content_hash')
@@ -0,0 +1,34 @@
+"""add_fetch_validators_to_sources
+
+Revision ID: b7d41e0c9a21
+Revises: 9cc660270c3d
+Create Date: 2026-10-17 09:12:40.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e0c9a21'
+down_revision: Union[str, Sequence[str], None] = '9cc660270c3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add conditional GET validators (ETag/Last-Modified) to sources."""
+    op.add_column('sources', sa.Column('etag', sa.String(length=255), nullable=True))
+    op.add_column('sources', sa.Column('last_modified', sa.String(length=64), nullable=True))
+    op.add_column('sources', sa.Column('last_fetched_at', sa.DateTime(), nullable=True))
+    op.add_column('sources', sa.Column('last_status', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove conditional GET validators from sources."""
+    op.drop_column('sources', 'last_status')
+    op.drop_column('sources', 'last_fetched_at')
+    op.drop_column('sources', 'last_modified')
+    op.drop_column('sources', 'etag')
@@ -0,0 +1,32 @@
+"""add_classification_status_to_items
+
+Revision ID: c3e8f5a17b42
+Revises: b7d41e0c9a21
+Create Date: 2026-10-17 10:03:27.540916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8f5a17b42'
+down_revision: Union[str, Sequence[str], None] = 'b7d41e0c9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add classification_status to items."""
+    # Existing items were classified inline at ingestion time
+    op.add_column('items', sa.Column('classification_status', sa.String(length=20), nullable=False, server_default='done'))
+    op.alter_column('items', 'classification_status', server_default=None)
+    op.create_index(op.f('ix_items_classification_status'), 'items', ['classification_status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove classification_status from items."""
+    op.drop_index(op.f('ix_items_classification_status'), table_name='items')
+    op.drop_column('items', 'classification_status')
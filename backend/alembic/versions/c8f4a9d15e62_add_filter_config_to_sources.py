@@ -0,0 +1,64 @@
+"""add_filter_config_to_sources
+
+Revision ID: c8f4a9d15e62
+Revises: b6e3f1a2c947
+Create Date: 2026-10-17 17:48:30.127764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f4a9d15e62'
+down_revision: Union[str, Sequence[str], None] = 'b6e3f1a2c947'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Filters previously hardcoded in RSSCollector._source_entry_filter
+GOOGLE_DEEPMIND_FILTER = {
+    "category_terms": ["google deepmind"],
+    "include_keywords": ["deepmind"],
+    "keyword_fields": ["title", "description"],
+    "url_patterns": ["/technology/google-deepmind/"],
+}
+AI_KEYWORDS_FILTER = {
+    "include_keywords": [
+        "ai", "artificial intelligence", "machine learning", "ml", "deep learning",
+        "neural network", "llm", "gpt", "chatgpt", "openai", "anthropic", "claude",
+        "gemini", "transformer", "language model", "computer vision", "nlp",
+        "robotics", "autonomous", "algorithm", "data science", "big data",
+        "neural", "automation", "intelligent", "smart", "cognitive",
+    ],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add filter_config to sources and seed the existing filters."""
+    op.add_column('sources', sa.Column('filter_config', sa.JSON(), nullable=True))
+
+    sources = sa.table(
+        'sources',
+        sa.column('feed_url', sa.String),
+        sa.column('filter_config', sa.JSON),
+    )
+    op.execute(
+        sources.update()
+        .where(sa.func.lower(sa.func.trim(sources.c.feed_url)) == 'https://blog.google/feed/')
+        .values(filter_config=GOOGLE_DEEPMIND_FILTER)
+    )
+    op.execute(
+        sources.update()
+        .where(sa.or_(
+            sa.func.lower(sources.c.feed_url).like('%wired.com%'),
+            sa.func.lower(sources.c.feed_url).like('%theverge.com%'),
+        ))
+        .values(filter_config=AI_KEYWORDS_FILTER)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove filter_config from sources."""
+    op.drop_column('sources', 'filter_config')
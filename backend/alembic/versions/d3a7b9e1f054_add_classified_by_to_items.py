@@ -0,0 +1,28 @@
+"""add_classified_by_to_items
+
+Revision ID: d3a7b9e1f054
+Revises: c8f4a9d15e62
+Create Date: 2026-10-17 19:05:12.408311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a7b9e1f054'
+down_revision: Union[str, Sequence[str], None] = 'c8f4a9d15e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add classified_by to items (llm | local | heuristic)."""
+    op.add_column('items', sa.Column('classified_by', sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove classified_by from items."""
+    op.drop_column('items', 'classified_by')
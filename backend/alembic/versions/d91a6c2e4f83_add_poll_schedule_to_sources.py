@@ -0,0 +1,35 @@
+"""add_poll_schedule_to_sources
+
+Revision ID: d91a6c2e4f83
+Revises: c3e8f5a17b42
+Create Date: 2026-10-17 11:20:05.774312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91a6c2e4f83'
+down_revision: Union[str, Sequence[str], None] = 'c3e8f5a17b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add adaptive polling schedule to sources."""
+    op.add_column('sources', sa.Column('next_poll_at', sa.DateTime(), nullable=True))
+    op.add_column('sources', sa.Column('poll_interval_minutes', sa.Integer(), nullable=True))
+    op.add_column('sources', sa.Column('unchanged_streak', sa.Integer(), nullable=False, server_default='0'))
+    op.alter_column('sources', 'unchanged_streak', server_default=None)
+    op.create_index(op.f('ix_sources_next_poll_at'), 'sources', ['next_poll_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove adaptive polling schedule from sources."""
+    op.drop_index(op.f('ix_sources_next_poll_at'), table_name='sources')
+    op.drop_column('sources', 'unchanged_streak')
+    op.drop_column('sources', 'poll_interval_minutes')
+    op.drop_column('sources', 'next_poll_at')
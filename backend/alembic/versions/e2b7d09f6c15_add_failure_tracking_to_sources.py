@@ -0,0 +1,35 @@
+"""add_failure_tracking_to_sources
+
+Revision ID: e2b7d09f6c15
+Revises: d91a6c2e4f83
+Create Date: 2026-10-17 12:02:51.093418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7d09f6c15'
+down_revision: Union[str, Sequence[str], None] = 'd91a6c2e4f83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add failure tracking (backoff / circuit breaker) to sources."""
+    op.add_column('sources', sa.Column('consecutive_failures', sa.Integer(), nullable=False, server_default='0'))
+    op.alter_column('sources', 'consecutive_failures', server_default=None)
+    op.add_column('sources', sa.Column('last_error', sa.Text(), nullable=True))
+    op.add_column('sources', sa.Column('last_success_at', sa.DateTime(), nullable=True))
+    op.add_column('sources', sa.Column('last_failure_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove failure tracking from sources."""
+    op.drop_column('sources', 'last_failure_at')
+    op.drop_column('sources', 'last_success_at')
+    op.drop_column('sources', 'last_error')
+    op.drop_column('sources', 'consecutive_failures')
@@ -0,0 +1,34 @@
+"""add_entity_status_to_items
+
+Revision ID: e5b1c7d20a69
+Revises: d3a7b9e1f054
+Create Date: 2026-10-17 20:11:46.902153
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b1c7d20a69'
+down_revision: Union[str, Sequence[str], None] = 'd3a7b9e1f054'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add entity_status and entity_attempts to items."""
+    # Existing items are not queued for extraction; set them to 'pending' to backfill
+    op.add_column('items', sa.Column('entity_status', sa.String(length=20), nullable=False, server_default='skipped'))
+    op.alter_column('items', 'entity_status', server_default=None)
+    op.add_column('items', sa.Column('entity_attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.create_index(op.f('ix_items_entity_status'), 'items', ['entity_status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: Remove entity_status and entity_attempts from items."""
+    op.drop_index(op.f('ix_items_entity_status'), table_name='items')
+    op.drop_column('items', 'entity_attempts')
+    op.drop_column('items', 'entity_status')
@@ -0,0 +1,53 @@
+"""add_collection_runs_table
+
+Revision ID: f4a1c8e93d27
+Revises: e2b7d09f6c15
+Create Date: 2026-10-17 13:41:08.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a1c8e93d27'
+down_revision: Union[str, Sequence[str], None] = 'e2b7d09f6c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Create collection_runs telemetry table."""
+    op.create_table(
+        'collection_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('source_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('http_status', sa.Integer(), nullable=True),
+        sa.Column('bytes', sa.Integer(), nullable=True),
+        sa.Column('entries_seen', sa.Integer(), nullable=True),
+        sa.Column('new_items', sa.Integer(), nullable=True),
+        sa.Column('fetch_ms', sa.Float(), nullable=True),
+        sa.Column('parse_ms', sa.Float(), nullable=True),
+        sa.Column('classify_ms', sa.Float(), nullable=True),
+        sa.Column('commit_ms', sa.Float(), nullable=True),
+        sa.Column('total_ms', sa.Float(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['source_id'], ['sources.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_collection_runs_id'), 'collection_runs', ['id'], unique=False)
+    op.create_index(op.f('ix_collection_runs_source_id'), 'collection_runs', ['source_id'], unique=False)
+    op.create_index('ix_collection_runs_created_at', 'collection_runs', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: Drop collection_runs table."""
+    op.drop_index('ix_collection_runs_created_at', table_name='collection_runs')
+    op.drop_index(op.f('ix_collection_runs_source_id'), table_name='collection_runs')
+    op.drop_index(op.f('ix_collection_runs_id'), table_name='collection_runs')
+    op.drop_table('collection_runs')
@@ -0,0 +1,76 @@
+"""make_items_link_hash_unique
+
+Revision ID: f7c2a4e8b913
+Revises: e5b1c7d20a69
+Create Date: 2026-10-17 22:40:12.517390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.app.core.link_utils import link_hash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c2a4e8b913'
+down_revision: Union[str, Sequence[str], None] = 'e5b1c7d20a69'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+items = sa.table(
+    'items',
+    sa.column('id', sa.Integer),
+    sa.column('link', sa.String),
+    sa.column('link_hash', sa.BigInteger),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema: Backfill items.link_hash and make it unique.
+
+    Rows whose canonical link duplicates an older row (e.g. links differing
+    only in utm_* params) keep link_hash NULL; the oldest row owns the hash,
+    so re-collecting either variant conflicts with it.
+    """
+    bind = op.get_bind()
+    # Hashes filled by the old backfill script may already collide: oldest row wins
+    bind.execute(sa.text(
+        "UPDATE items SET link_hash = NULL WHERE link_hash IS NOT NULL AND id NOT IN "
+        "(SELECT MIN(id) FROM items WHERE link_hash IS NOT NULL GROUP BY link_hash)"
+    ))
+    taken = {row[0] for row in bind.execute(sa.text("SELECT link_hash FROM items WHERE link_hash IS NOT NULL"))}
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(items.c.id, items.c.link)
+            .where(items.c.link_hash.is_(None), items.c.id > last_id)
+            .order_by(items.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        updates = []
+        for row in rows:
+            value = link_hash(row.link)
+            if value not in taken:
+                taken.add(value)
+                updates.append({'row_id': row.id, 'value': value})
+        if updates:
+            bind.execute(
+                items.update().where(items.c.id == sa.bindparam('row_id')).values(link_hash=sa.bindparam('value')),
+                updates,
+            )
+
+    op.drop_index(op.f('ix_items_link_hash'), table_name='items')
+    op.create_index(op.f('ix_items_link_hash'), 'items', ['link_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema: Make items.link_hash non-unique again (values are kept)."""
+    op.drop_index(op.f('ix_items_link_hash'), table_name='items')
+    op.create_index(op.f('ix_items_link_hash'), 'items', ['link_hash'], unique=False)
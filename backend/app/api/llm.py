@@ -0,0 +1,24 @@
+"""LLM usage API endpoints."""
+from fastapi import APIRouter
+
+from backend.app.services.classification_cache import get_classification_cache
+from backend.app.services.classifier import PROMPT_VERSION
+from backend.app.services.llm_gateway import llm_gateway_stats
+from backend.app.services.model_health import get_model_health
+
+router = APIRouter(prefix="/api/llm", tags=["llm"])
+
+
+@router.get("/stats")
+async def get_llm_stats():
+    """LLM 모델별 상태/지연 시간, 게이트웨이 및 분류 캐시 통계 조회.
+
+    Returns:
+        dict: models (모델별 성공률·지연 시간·서킷 상태), gateway, cache
+    """
+    cache = get_classification_cache(PROMPT_VERSION)
+    return {
+        "models": get_model_health().snapshot(),
+        "gateway": llm_gateway_stats(),
+        "cache": cache.stats() if cache is not None else None,
+    }
@@ -1,11 +1,21 @@
 """Sources API endpoints."""
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from backend.app.core.database import get_db
 from backend.app.models.source import Source
-from backend.app.schemas.source import SourceResponse, SourceCreate, SourceUpdate
+from backend.app.models.collection_run import CollectionRun
+from backend.app.schemas.source import (
+    SourceResponse,
+    SourceCreate,
+    SourceUpdate,
+    SourceStatsResponse,
+    SlowSourceResponse,
+)
+from backend.app.services.collection_stats import percentile, summarize_runs
 
 router = APIRouter(prefix="/api/sources", tags=["sources"])
 
@@ -83,6 +93,84 @@ async def get_source(
     return source
 
 
+@router.get("/stats/slowest", response_model=List[SlowSourceResponse])
+async def get_slowest_sources(
+    hours: int = Query(24, ge=1, le=24 * 14, description="집계 기간 (시간)"),
+    limit: int = Query(20, ge=1, le=200, description="반환할 소스 수"),
+    db: Session = Depends(get_db)
+):
+    """수집 시간이 가장 긴 소스 조회 (p95 total_ms 기준).
+    
+    Args:
+        hours: 집계 기간 (시간)
+        limit: 반환할 소스 수
+        db: Database session
+        
+    Returns:
+        List[SlowSourceResponse]: p95 수집 시간 내림차순 소스 목록
+    """
+    since = datetime.utcnow() - timedelta(hours=hours)
+    rows = (
+        db.query(CollectionRun.source_id, CollectionRun.total_ms, CollectionRun.status)
+        .filter(CollectionRun.created_at >= since)
+        .all()
+    )
+    totals = defaultdict(list)
+    errors = defaultdict(int)
+    for source_id, total_ms, status in rows:
+        totals[source_id].append(total_ms)
+        if status == "error":
+            errors[source_id] += 1
+    
+    titles = dict(db.query(Source.id, Source.title).filter(Source.id.in_(list(totals))).all()) if totals else {}
+    ranked = [
+        SlowSourceResponse(
+            source_id=source_id,
+            title=titles.get(source_id, ""),
+            runs=len(values),
+            errors=errors[source_id],
+            p50_total_ms=percentile(values, 50),
+            p95_total_ms=percentile(values, 95),
+        )
+        for source_id, values in totals.items()
+    ]
+    ranked.sort(key=lambda r: r.p95_total_ms or 0.0, reverse=True)
+    return ranked[:limit]
+
+
+@router.get("/{source_id}/stats", response_model=SourceStatsResponse)
+async def get_source_stats(
+    source_id: int,
+    runs: int = Query(100, ge=1, le=1000, description="집계할 최근 수집 횟수"),
+    db: Session = Depends(get_db)
+):
+    """소스 수집 통계 조회 (최근 수집의 단계별 p50/p95 시간).
+    
+    Args:
+        source_id: 소스 ID
+        runs: 집계할 최근 수집 횟수
+        db: Database session
+        
+    Returns:
+        SourceStatsResponse: fetch/parse/commit/total 시간의 p50/p95 및 평균 건수
+        
+    Raises:
+        HTTPException: 소스를 찾을 수 없을 때
+    """
+    source = db.query(Source).filter(Source.id == source_id).first()
+    if not source:
+        raise HTTPException(status_code=404, detail="Source not found")
+    
+    recent = (
+        db.query(CollectionRun)
+        .filter(CollectionRun.source_id == source_id)
+        .order_by(CollectionRun.created_at.desc())
+        .limit(runs)
+        .all()
+    )
+    return SourceStatsResponse(source_id=source_id, **summarize_runs(recent))
+
+
 @router.put("/{source_id}", response_model=SourceResponse)
 async def update_source(
     source_id: int,
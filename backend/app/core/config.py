@@ -28,6 +28,80 @@ class Settings(BaseSettings):
 
     # RSS Collection
     RSS_COLLECTION_INTERVAL_MINUTES: int = 20
+    # Adaptive polling: each source is polled on its own cadence within [min, max]
+    RSS_SCHEDULER_TICK_MINUTES: int = 1
+    RSS_POLL_MIN_MINUTES: int = 10
+    RSS_POLL_MAX_MINUTES: int = 720
+    RSS_POLL_JITTER_RATIO: float = 0.1
+    # Failing sources: exponential backoff, then circuit breaker with periodic probes
+    RSS_FAILURE_BACKOFF_BASE_MINUTES: int = 10
+    RSS_FAILURE_BACKOFF_MAX_MINUTES: int = 360
+    RSS_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    RSS_CIRCUIT_OPEN_MINUTES: int = 720
+    # Days of per-run collection telemetry (collection_runs) to keep
+    COLLECTION_RUNS_RETENTION_DAYS: int = 14
+    RSS_FETCH_MAX_CONNECTIONS: int = 50  # shared keep-alive pool size
+    RSS_FETCH_PER_HOST_LIMIT: int = 4  # concurrent requests per publisher host
+    RSS_FETCH_TIMEOUT_SECONDS: float = 15.0
+    # Stop streaming a feed after this many consecutive already-stored entries (0 = full parse)
+    RSS_STREAM_STOP_AFTER_KNOWN: int = 3
+    # Worker processes for feedparser parsing (0 = parse in the collection threads)
+    RSS_PARSE_PROCESSES: int = 0
+    # Bloom filter of stored link hashes (skips DB lookups for definitely-new entries)
+    RSS_LINK_BLOOM_ENABLED: bool = True
+    RSS_LINK_BLOOM_CAPACITY: int = 1_000_000
+    RSS_LINK_BLOOM_ERROR_RATE: float = 0.01
+    RSS_LINK_BLOOM_REBUILD_MINUTES: int = 360
+    # Directory for the raw feed archive (empty = archiving disabled)
+    FEED_ARCHIVE_DIR: str = ""
+
+    # Classification stage (runs separately from ingestion)
+    CLASSIFICATION_INTERVAL_MINUTES: int = 2
+    CLASSIFICATION_BATCH_SIZE: int = 50
+    CLASSIFICATION_MAX_WORKERS: int = 4
+    # Batched LLM classification: prompt token budget and max items per call
+    CLASSIFIER_BATCH_TOKEN_BUDGET: int = 4000
+    CLASSIFIER_BATCH_MAX_ITEMS: int = 20
+    # Shared LLM gateway: rate limits, concurrency cap and retries for all OpenAI calls
+    LLM_RPM_LIMIT: int = 500
+    LLM_TPM_LIMIT: int = 200_000
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_MAX_RETRIES: int = 4
+    LLM_RETRY_BASE_SECONDS: float = 1.0
+    LLM_RETRY_MAX_SECONDS: float = 30.0
+    LLM_REQUEST_TIMEOUT_SECONDS: float = 60.0
+    # Skip a model for LLM_MODEL_COOLDOWN_SECONDS after this many consecutive failures
+    LLM_MODEL_FAILURE_THRESHOLD: int = 3
+    LLM_MODEL_COOLDOWN_SECONDS: int = 300
+    # Batched entity extraction (runs before incremental grouping)
+    ENTITY_EXTRACTION_ENABLED: bool = True
+    ENTITY_BATCH_SIZE: int = 50
+    ENTITY_ITEMS_PER_CALL: int = 10
+    ENTITY_MAX_WORKERS: int = 4
+    ENTITY_MAX_ATTEMPTS: int = 3
+    # Process-wide entity name -> id LRU used by bulk entity saves
+    ENTITY_ID_CACHE_SIZE: int = 50_000
+    # Local gazetteer tagging of known entity names at ingestion; items with fewer
+    # hits (or sampled at GAZETTEER_LLM_SAMPLE_RATE) still go to LLM extraction
+    GAZETTEER_ENABLED: bool = True
+    GAZETTEER_REBUILD_MINUTES: int = 30
+    GAZETTEER_MIN_ENTITIES: int = 2
+    GAZETTEER_LLM_SAMPLE_RATE: float = 0.1
+    # Local fast-tier classifier (joblib file; empty = disabled) and its confidence cutoff
+    LOCAL_CLASSIFIER_PATH: str = ""
+    LOCAL_CLASSIFIER_THRESHOLD: float = 0.85
+    # Persistent classification label cache (SQLite file; empty = disabled)
+    CLASSIFICATION_CACHE_PATH: str = ""
+    CLASSIFICATION_CACHE_MAX_ENTRIES: int = 200_000
+    CLASSIFICATION_CACHE_TTL_DAYS: int = 90
+    # MinHash LSH candidate index for grouping (DEDUP_LSH_PATH: .npz file; empty = rebuilt
+    # from the DB per process). 64 bands x 2 rows: pairs at Jaccard 0.3 are found ~99.8%
+    # Off until scripts/evaluate_dedup_lsh shows acceptable recall on production data
+    DEDUP_LSH_ENABLED: bool = False
+    DEDUP_LSH_PATH: str = ""
+    DEDUP_LSH_BANDS: int = 64
+    DEDUP_LSH_ROWS: int = 2
+    DEDUP_LSH_HORIZON_DAYS: int = 30
 
     # Grouping reference date (UTC midnight) in YYYY-MM-DD, empty means use today's UTC date
     REF_DATE: str = ""
@@ -11,15 +11,36 @@ PRD_RSS_SOURCES: List[Dict[str, str]] = [
     {"title": "TechCrunch", "feed_url": "https://techcrunch.com/feed/", "site_url": "https://techcrunch.com"},
     {"title": "VentureBeat – AI", "feed_url": "https://venturebeat.com/category/ai/feed/", "site_url": "https://venturebeat.com"},
     {"title": "MarkTechPost", "feed_url": "https://www.marktechpost.com/feed/", "site_url": "https://www.marktechpost.com"},
-    {"title": "WIRED (All)", "feed_url": "https://www.wired.com/feed/rss", "site_url": "https://www.wired.com"},
-    {"title": "The Verge (All)", "feed_url": "https://www.theverge.com/rss/index.xml", "site_url": "https://www.theverge.com"},
+    {"title": "WIRED (All)", "feed_url": "https://www.wired.com/feed/rss", "site_url": "https://www.wired.com", "filter_preset": "ai_keywords"},
+    {"title": "The Verge (All)", "feed_url": "https://www.theverge.com/rss/index.xml", "site_url": "https://www.theverge.com", "filter_preset": "ai_keywords"},
     {"title": "IEEE Spectrum – AI", "feed_url": "https://spectrum.ieee.org/rss/fulltext", "site_url": "https://spectrum.ieee.org"},
     {"title": "AITimes", "feed_url": "https://www.aitimes.com/rss/allArticle.xml", "site_url": "https://www.aitimes.com"},
     {"title": "arXiv – cs.AI", "feed_url": "http://export.arxiv.org/rss/cs.AI", "site_url": "https://arxiv.org/list/cs.AI/recent"},
     {"title": "OpenAI News", "feed_url": "https://openai.com/blog/rss.xml", "site_url": "https://openai.com"},
-    {"title": "The Keyword (Google DeepMind filtered)", "feed_url": "https://blog.google/feed/", "site_url": "https://blog.google/technology/google-deepmind/"},
+    {"title": "The Keyword (Google DeepMind filtered)", "feed_url": "https://blog.google/feed/", "site_url": "https://blog.google/technology/google-deepmind/", "filter_preset": "google_deepmind"},
 ]
 
+# Source.filter_config presets (see services.entry_filter)
+SOURCE_FILTER_PRESETS: Dict[str, Dict[str, List[str]]] = {
+    # The Keyword → only Google DeepMind items
+    "google_deepmind": {
+        "category_terms": ["google deepmind"],
+        "include_keywords": ["deepmind"],
+        "keyword_fields": ["title", "description"],
+        "url_patterns": ["/technology/google-deepmind/"],
+    },
+    # General tech outlets (WIRED, The Verge) → AI-related items only
+    "ai_keywords": {
+        "include_keywords": [
+            "ai", "artificial intelligence", "machine learning", "ml", "deep learning",
+            "neural network", "llm", "gpt", "chatgpt", "openai", "anthropic", "claude",
+            "gemini", "transformer", "language model", "computer vision", "nlp",
+            "robotics", "autonomous", "algorithm", "data science", "big data",
+            "neural", "automation", "intelligent", "smart", "cognitive",
+        ],
+    },
+}
+
 # Field categories for news items (분야)
 FIELDS = [
     "research",
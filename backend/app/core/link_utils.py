@@ -0,0 +1,163 @@
+"""Link canonicalization and fixed-width link hashes for exact dedup.
+
+Two levels of normalization:
+
+- ``clean_link``: safe to store and show. Strips tracking parameters and
+  fragments, lowercases scheme/host, drops default ports and unwraps known
+  redirectors. The result still points at the same page.
+- ``canonical_link``: dedup key only. Also folds http/https and a leading
+  ``www.``, drops trailing slashes and sorts query parameters.
+
+``link_hash`` is a signed 64-bit BLAKE2b hash of ``canonical_link`` that fits
+a Postgres BIGINT column, so exact-duplicate checks are integer index lookups.
+``content_hash`` hashes an entry's payload the same way to detect edits.
+Fields are reduced to plain text first, so the raw descriptions of the lxml
+stream parser and feedparser's sanitized HTML hash identically.
+"""
+import hashlib
+import html
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, unquote_plus, urlsplit, urlunsplit
+
+# Query parameters that only carry tracking/attribution data
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "twclid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "mkt_tok", "oly_anon_id", "oly_enc_id",
+    "ref", "ref_src", "ref_url", "cmpid", "ncid", "sr_share", "smid", "guccounter",
+    "guce_referrer", "guce_referrer_sig", "spm",
+}
+TRACKING_PREFIXES = ("utm_", "__twitter", "ga_")
+
+# Redirector hosts -> query parameter holding the target URL
+REDIRECTORS = {
+    "www.google.com": ("url", "q"),
+    "google.com": ("url", "q"),
+    "l.facebook.com": ("u",),
+    "lm.facebook.com": ("u",),
+    "out.reddit.com": ("url",),
+    "href.li": (),
+    "www.linkedin.com": ("url",),
+}
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = unquote_plus(name).lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def _query_pairs(query: str):
+    """Split a query string into raw ``key=value`` segments (encoding preserved)."""
+    return [segment for segment in query.split("&") if segment]
+
+
+def _unwrap_redirect(url: str, max_hops: int = 3) -> str:
+    """Follow known redirector URLs that carry their target in the query string."""
+    for _ in range(max_hops):
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        if host not in REDIRECTORS:
+            return url
+        if host == "href.li":
+            # https://href.li/?https://target
+            target = parts.query
+        else:
+            if host.endswith("linkedin.com") and not parts.path.startswith("/redir"):
+                return url
+            if host.endswith("google.com") and parts.path != "/url":
+                return url
+            params = dict(parse_qsl(parts.query, keep_blank_values=True))
+            target = next((params[k] for k in REDIRECTORS[host] if params.get(k)), "")
+        if not target.startswith(("http://", "https://")):
+            return url
+        url = target
+    return url
+
+
+def clean_link(url: Optional[str]) -> str:
+    """Return the link with tracking noise removed (still a valid, equivalent URL).
+
+    Args:
+        url: Raw link from a feed entry
+
+    Returns:
+        Cleaned link; non-HTTP(S) values are returned stripped but unchanged
+    """
+    url = (url or "").strip()
+    if not url.lower().startswith(("http://", "https://")):
+        return url
+    url = _unwrap_redirect(url)
+    parts = urlsplit(url)
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    netloc = host
+    if port is not None and str(port) != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parts.username:
+        netloc = f"{parts.username}@{netloc}"
+    query = "&".join(
+        segment for segment in _query_pairs(parts.query)
+        if not _is_tracking_param(segment.split("=", 1)[0])
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def canonical_link(url: Optional[str]) -> str:
+    """Return the dedup key for a link (not meant to be displayed).
+
+    Args:
+        url: Raw or cleaned link
+
+    Returns:
+        Canonical form: https, no ``www.``, no trailing slash, sorted query
+    """
+    url = clean_link(url)
+    if not url.startswith(("http://", "https://")):
+        return url
+    parts = urlsplit(url)
+    netloc = parts.netloc
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    path = parts.path.rstrip("/") or "/"
+    query = "&".join(sorted(_query_pairs(parts.query)))
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def link_hash(url: Optional[str]) -> int:
+    """Return a signed 64-bit hash of the canonical link (fits BIGINT).
+
+    Args:
+        url: Raw or cleaned link
+
+    Returns:
+        Signed 64-bit integer
+    """
+    digest = hashlib.blake2b(canonical_link(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def plain_text(value: Optional[str]) -> str:
+    """Return text with HTML tags removed, entities decoded and whitespace collapsed."""
+    text = html.unescape(_TAG_RE.sub(" ", value or ""))
+    return " ".join(text.split())
+
+
+def content_hash(*fields: Optional[str]) -> int:
+    """Return a signed 64-bit hash of an item's normalized payload fields.
+
+    Used to detect edited feed entries (title, summary, thumbnail, author)
+    without comparing the stored text column by column. Fields go through
+    ``plain_text``, so markup and whitespace differences between parsers
+    are not seen as edits.
+    """
+    payload = "\x1f".join(plain_text(f) for f in fields)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -1,13 +1,30 @@
 """RSS collection scheduler using APScheduler."""
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
 from backend.app.core.database import SessionLocal
 from backend.app.services.rss_collector import RSSCollector
+from backend.app.services.feed_fetcher import FeedFetcher
+from backend.app.services.feed_archive import FeedArchive
+from backend.app.services.link_bloom import get_known_link_index
+from backend.app.services.gazetteer import get_gazetteer_index
+from backend.app.services.llm_gateway import shutdown_llm_gateway
 from backend.app.services.group_backfill import GroupBackfill
+from backend.app.services.classification_stage import ClassificationStage
+from backend.app.services.entity_stage import EntityStage
+from backend.app.services.collection_stats import prune_collection_runs, record_collection_run
+from backend.app.services.poll_policy import (
+    circuit_state,
+    record_source_failure,
+    record_source_success,
+    update_source_schedule,
+)
 from backend.app.models.source import Source
 from backend.app.core.config import get_settings
 
@@ -16,9 +33,27 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 scheduler = AsyncIOScheduler()
 executor = ThreadPoolExecutor(max_workers=5)
+# Optional process pool for CPU-bound feedparser work (RSS_PARSE_PROCESSES > 0)
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
 
 
-def collect_source_sync(source_id: int) -> dict:
+def get_parse_pool():
+    """Return the shared feed-parsing process pool, or None when disabled."""
+    global _parse_pool
+    processes = get_settings().RSS_PARSE_PROCESSES
+    if processes <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+
+def collect_source_sync(source_id: int, fetched: dict = None) -> dict:
     """Synchronously collect items from a source.
     
     This is a wrapper for the synchronous RSSCollector.collect_source method
@@ -26,97 +61,211 @@ def collect_source_sync(source_id: int) -> dict:
     
     Args:
         source_id: Source ID to collect from
+        fetched: Optional FeedFetcher result (raw bytes already downloaded)
         
     Returns:
         Dictionary with source_id, count, and optional error
     """
     db = SessionLocal()
+    started = time.perf_counter()
+    collector = None
     try:
         source = db.query(Source).filter(Source.id == source_id, Source.is_active == True).first()
         if not source:
             return {"source_id": source_id, "count": 0, "error": "Source not found or inactive"}
         
-        collector = RSSCollector(db)
-        count = collector.collect_source(source)
-        logger.info(f"[RSS] Collected {count} items from {source.title} (ID: {source_id})")
+        settings = get_settings()
+        link_index = get_known_link_index()
+        if link_index is not None:
+            link_index.ensure_fresh(db)
+        gazetteer_index = get_gazetteer_index()
+        if gazetteer_index is not None:
+            gazetteer_index.ensure_fresh(db)
+        collector = RSSCollector(
+            db,
+            stop_after_known=settings.RSS_STREAM_STOP_AFTER_KNOWN,
+            parse_executor=get_parse_pool(),
+            archive=FeedArchive(settings.FEED_ARCHIVE_DIR) if settings.FEED_ARCHIVE_DIR else None,
+            link_index=link_index,
+            gazetteer=gazetteer_index.gazetteer if gazetteer_index is not None else None,
+        )
+        count = collector.collect_source(source, fetched=fetched)
+        record_source_success(source)
+        update_source_schedule(db, source, count)
+        record_collection_run(db, source_id, collector.last_run, _elapsed_ms(started, fetched))
+        db.commit()
+        logger.info(
+            f"[RSS] Collected {count} items from {source.title} (ID: {source_id}), "
+            f"next poll in {source.poll_interval_minutes} min"
+        )
         return {"source_id": source_id, "count": count}
     except Exception as e:
         logger.error(f"[RSS] Error collecting source {source_id}: {e}", exc_info=True)
+        run = collector.last_run if collector else {}
+        _record_failure(db, source_id, str(e), run, _elapsed_ms(started, fetched))
         return {"source_id": source_id, "count": 0, "error": str(e)}
     finally:
         db.close()
 
 
-async def collect_all_active_sources():
-    """Collect items from all active sources.
+def _elapsed_ms(started: float, fetched: dict = None) -> float:
+    """Wall time of a run, including the async fetch done before it."""
+    elapsed = (time.perf_counter() - started) * 1000
+    if fetched and fetched.get("elapsed_ms"):
+        elapsed += fetched["elapsed_ms"]
+    return elapsed
+
+
+def _record_failure(db, source_id: int, error: str, run: dict = None, total_ms: float = None) -> None:
+    """Record a failed poll: exponential backoff, circuit opens after N failures."""
+    try:
+        db.rollback()
+        source = db.query(Source).filter(Source.id == source_id).first()
+        if source:
+            record_source_failure(source, error)
+            record_collection_run(db, source_id, run or {}, total_ms, error=error)
+            db.commit()
+            if circuit_state(source) == "open":
+                logger.warning(
+                    f"[RSS] Circuit open for {source.title} (ID: {source_id}) after "
+                    f"{source.consecutive_failures} failures; next probe at {source.next_poll_at}"
+                )
+    except Exception as e:
+        logger.error(f"[RSS] Failed to record failure for source {source_id}: {e}")
+        db.rollback()
+
+
+async def _collect_sources(sources) -> list:
+    """Fetch feeds concurrently and hand the bytes to the thread pool.
+    
+    All HTTP requests run on the event loop through one pooled FeedFetcher
+    (keep-alive, per-host limits, timeouts). Only parsing and DB writes run
+    in the thread pool, as each fetch completes.
     
-    This function runs synchronously in a thread pool to avoid blocking
-    the async event loop with SQLAlchemy operations.
+    Args:
+        sources: Source rows to collect
+        
+    Returns:
+        List of collect_source_sync results (or exceptions)
     """
     import asyncio
-    db = SessionLocal()
-    try:
-        sources = db.query(Source).filter(Source.is_active == True).all()
-        logger.info(f"[RSS] Starting collection for {len(sources)} active sources")
-        
-        # Collect all sources in parallel using thread pool
-        loop = asyncio.get_event_loop()
-        
-        # Run in thread pool for async compatibility
-        tasks = [
-            loop.run_in_executor(executor, collect_source_sync, source.id)
-            for source in sources
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Log results
-        successful = sum(1 for r in results if isinstance(r, dict) and "error" not in r)
-        failed = len(results) - successful
-        total_items = sum(r.get("count", 0) for r in results if isinstance(r, dict))
-        
-        logger.info(f"[RSS] Collection complete: {successful} successful, {failed} failed, {total_items} total items")
+    settings = get_settings()
+    loop = asyncio.get_event_loop()
+    requests = [
+        {"source_id": s.id, "url": s.feed_url, "etag": s.etag, "last_modified": s.last_modified}
+        for s in sources
+    ]
+    
+    async with FeedFetcher(
+        max_connections=settings.RSS_FETCH_MAX_CONNECTIONS,
+        per_host_limit=settings.RSS_FETCH_PER_HOST_LIMIT,
+        timeout=settings.RSS_FETCH_TIMEOUT_SECONDS,
+    ) as fetcher:
+        async def fetch_and_collect(req: dict):
+            fetched = await fetcher.fetch(
+                req["url"], etag=req["etag"], last_modified=req["last_modified"]
+            )
+            return await loop.run_in_executor(
+                executor, collect_source_sync, req["source_id"], fetched
+            )
         
-    except Exception as e:
-        logger.error(f"[RSS] Error in collect_all_active_sources: {e}", exc_info=True)
-    finally:
-        db.close()
+        return await asyncio.gather(
+            *[fetch_and_collect(req) for req in requests], return_exceptions=True
+        )
 
 
-async def collect_arxiv_sources():
-    """Collect items from arXiv sources only.
+async def collect_due_sources():
+    """Collect items from active sources whose next poll time has come.
     
-    arXiv feeds are updated once daily at midnight EST, so we check
-    them less frequently than other sources.
+    Each source carries its own next_poll_at, computed from its publish
+    cadence by poll_policy (busy feeds often, dormant feeds such as arXiv
+    rarely, with jitter). Sources never polled before are due immediately.
     """
-    import asyncio
+    from datetime import datetime
+    from sqlalchemy import or_
+    
     db = SessionLocal()
     try:
-        # Filter arXiv sources (feed_url contains 'arxiv')
+        now = datetime.utcnow()
         sources = db.query(Source).filter(
             Source.is_active == True,
-            Source.feed_url.ilike("%arxiv%")
+            or_(Source.next_poll_at.is_(None), Source.next_poll_at <= now),
         ).all()
         
         if not sources:
-            logger.debug("[RSS] No active arXiv sources found")
+            logger.debug("[RSS] No sources due for polling")
             return
         
-        logger.info(f"[RSS] Starting arXiv collection for {len(sources)} sources")
+        logger.info(f"[RSS] Starting collection for {len(sources)} due sources")
         
-        loop = asyncio.get_event_loop()
-        tasks = [
-            loop.run_in_executor(executor, collect_source_sync, source.id)
-            for source in sources
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await _collect_sources(sources)
         
         successful = sum(1 for r in results if isinstance(r, dict) and "error" not in r)
+        failed = len(results) - successful
         total_items = sum(r.get("count", 0) for r in results if isinstance(r, dict))
         
-        logger.info(f"[RSS] arXiv collection complete: {successful} successful, {total_items} items")
+        logger.info(f"[RSS] Due collection complete: {successful} successful, {failed} failed, {total_items} total items")
         
     except Exception as e:
-        logger.error(f"[RSS] Error in collect_arxiv_sources: {e}", exc_info=True)
+        logger.error(f"[RSS] Error in collect_due_sources: {e}", exc_info=True)
+    finally:
+        db.close()
+
+
+def run_classification_stage_sync() -> dict:
+    """Synchronously classify items ingested as pending.
+    
+    Runs separately from RSS collection so slow LLM calls never hold
+    a collection transaction open.
+    """
+    settings = get_settings()
+    db = SessionLocal()
+    try:
+        stage = ClassificationStage(
+            db,
+            batch_size=settings.CLASSIFICATION_BATCH_SIZE,
+            max_workers=settings.CLASSIFICATION_MAX_WORKERS,
+        )
+        processed = stage.run()
+        if processed:
+            logger.info(f"[Classify] Classified {processed} pending items")
+        return {"processed": processed}
+    except Exception as e:
+        logger.error(f"[Classify] Error in classification stage: {e}", exc_info=True)
+        return {"processed": 0, "error": str(e)}
+    finally:
+        db.close()
+
+
+async def run_classification_stage():
+    """Run the classification stage asynchronously."""
+    import asyncio
+    loop = asyncio.get_event_loop()
+    result = await loop.run_in_executor(executor, run_classification_stage_sync)
+    return result
+
+
+def run_entity_stage_sync() -> dict:
+    """Synchronously extract entities for items ingested as pending."""
+    settings = get_settings()
+    if not settings.ENTITY_EXTRACTION_ENABLED or not settings.OPENAI_API_KEY:
+        return {"done": 0, "skipped": True}
+    db = SessionLocal()
+    try:
+        stage = EntityStage(
+            db,
+            batch_size=settings.ENTITY_BATCH_SIZE,
+            items_per_call=settings.ENTITY_ITEMS_PER_CALL,
+            max_workers=settings.ENTITY_MAX_WORKERS,
+            max_attempts=settings.ENTITY_MAX_ATTEMPTS,
+        )
+        counts = stage.run()
+        if any(counts.values()):
+            logger.info(f"[Entities] Entity extraction: {counts}")
+        return counts
+    except Exception as e:
+        logger.error(f"[Entities] Error in entity stage: {e}", exc_info=True)
+        return {"done": 0, "error": str(e)}
     finally:
         db.close()
 
@@ -125,10 +274,12 @@ def run_incremental_grouping_sync() -> dict:
     """Synchronously run incremental grouping for items from last 30 minutes.
     
     This processes items that were collected but not yet grouped.
-    Runs after RSS collection to group newly collected items.
+    Runs after RSS collection to group newly collected items. Entity
+    extraction runs first so the dedup entity-overlap bonus sees new items.
     """
     from datetime import datetime, timezone, timedelta
     
+    run_entity_stage_sync()
     db = SessionLocal()
     try:
         # Process items from last 30 minutes (incremental)
@@ -182,40 +333,56 @@ async def run_daily_backfill():
     return result
 
 
+def prune_collection_runs_sync() -> dict:
+    """Delete collection telemetry older than the retention window."""
+    settings = get_settings()
+    db = SessionLocal()
+    try:
+        deleted = prune_collection_runs(db, settings.COLLECTION_RUNS_RETENTION_DAYS)
+        logger.info(f"[RSS] Pruned {deleted} collection runs")
+        return {"deleted": deleted}
+    except Exception as e:
+        logger.error(f"[RSS] Error pruning collection runs: {e}", exc_info=True)
+        db.rollback()
+        return {"deleted": 0, "error": str(e)}
+    finally:
+        db.close()
+
+
+async def prune_collection_runs_job():
+    """Prune collection telemetry asynchronously."""
+    import asyncio
+    loop = asyncio.get_event_loop()
+    result = await loop.run_in_executor(executor, prune_collection_runs_sync)
+    return result
+
+
 def start_scheduler():
     """Start the RSS collection and grouping scheduler.
     
     Sets up jobs:
-    1. General sources: Collect every 20 minutes (configurable)
-    2. arXiv sources: Collect twice daily (at 00:00 and 12:00 EST)
-    3. Incremental grouping: Run every 20 minutes (after RSS collection)
-    4. Daily backfill: Run once daily at UTC 00:00
+    1. RSS sources: Every tick, collect sources whose adaptive next_poll_at is due
+       (arXiv included; its daily cadence is learned from its publish batches)
+    2. Incremental grouping: Run every 20 minutes (after RSS collection),
+       preceded by batched entity extraction for pending items
+    3. Daily backfill: Run once daily at UTC 00:00
+    4. Classification stage: Classify pending items every few minutes
+    5. Telemetry pruning: Drop old collection_runs rows daily at UTC 00:30
     """
     settings = get_settings()
     interval_minutes = settings.RSS_COLLECTION_INTERVAL_MINUTES
     
-    # Job 1: Collect all active sources at regular intervals
+    # Job 1: Collect sources that are due (adaptive per-source schedule)
     scheduler.add_job(
-        collect_all_active_sources,
-        trigger=IntervalTrigger(minutes=interval_minutes),
-        id="rss_collection_all",
-        name="Collect all active RSS sources",
+        collect_due_sources,
+        trigger=IntervalTrigger(minutes=settings.RSS_SCHEDULER_TICK_MINUTES),
+        id="rss_collection_due",
+        name="Collect RSS sources due for polling",
         replace_existing=True,
         max_instances=1,  # Prevent overlapping executions
     )
     
-    # Job 2: Collect arXiv sources twice daily
-    # Note: CronTrigger uses server timezone, adjust if needed
-    scheduler.add_job(
-        collect_arxiv_sources,
-        trigger=CronTrigger(hour="0,12", minute=0),  # 00:00 and 12:00
-        id="rss_collection_arxiv",
-        name="Collect arXiv RSS sources",
-        replace_existing=True,
-        max_instances=1,
-    )
-    
-    # Job 3: Incremental grouping (run after RSS collection)
+    # Job 2: Incremental grouping (run after RSS collection)
     # Process items from last 30 minutes
     scheduler.add_job(
         run_incremental_grouping,
@@ -226,7 +393,7 @@ def start_scheduler():
         max_instances=1,
     )
     
-    # Job 4: Daily backfill grouping (run at UTC 00:00)
+    # Job 3: Daily backfill grouping (run at UTC 00:00)
     scheduler.add_job(
         run_daily_backfill,
         trigger=CronTrigger(hour=0, minute=0, timezone="UTC"),  # UTC 00:00
@@ -236,18 +403,47 @@ def start_scheduler():
         max_instances=1,
     )
     
+    # Job 4: Classification stage for items ingested as pending
+    scheduler.add_job(
+        run_classification_stage,
+        trigger=IntervalTrigger(minutes=settings.CLASSIFICATION_INTERVAL_MINUTES),
+        id="classification_stage",
+        name="Classify pending items",
+        replace_existing=True,
+        max_instances=1,
+    )
+    
+    # Job 5: Prune collection telemetry
+    scheduler.add_job(
+        prune_collection_runs_job,
+        trigger=CronTrigger(hour=0, minute=30, timezone="UTC"),
+        id="collection_runs_prune",
+        name="Prune old collection runs",
+        replace_existing=True,
+        max_instances=1,
+    )
+    
     scheduler.start()
-    logger.info(f"[RSS] Scheduler started with interval: {interval_minutes} minutes")
-    logger.info("[RSS] arXiv collection scheduled at 00:00 and 12:00 daily")
+    logger.info(
+        f"[RSS] Scheduler started: tick {settings.RSS_SCHEDULER_TICK_MINUTES} min, "
+        f"per-source interval {settings.RSS_POLL_MIN_MINUTES}-{settings.RSS_POLL_MAX_MINUTES} min"
+    )
     logger.info(f"[Grouping] Incremental grouping scheduled every {interval_minutes} minutes")
     logger.info("[Grouping] Daily backfill scheduled at UTC 00:00")
+    logger.info(f"[Classify] Classification stage scheduled every {settings.CLASSIFICATION_INTERVAL_MINUTES} minutes")
 
 
 def stop_scheduler():
     """Stop the RSS collection scheduler."""
+    global _parse_pool
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("[RSS] Scheduler stopped")
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
+    shutdown_llm_gateway()
 
 
 def is_scheduler_running() -> bool:
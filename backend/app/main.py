@@ -14,6 +14,7 @@ from backend.app.api import bookmarks
 from backend.app.api import watch_rules
 from backend.app.api import insights
 from backend.app.api import constants
+from backend.app.api import llm
 from backend.app.core.scheduler import start_scheduler, stop_scheduler, is_scheduler_running
 
 # Configure logging (development/production aware)
@@ -77,6 +78,7 @@ app.include_router(bookmarks.router)
 app.include_router(watch_rules.router)
 app.include_router(insights.router)
 app.include_router(constants.router)
+app.include_router(llm.router)
 
 
 @app.get("/")
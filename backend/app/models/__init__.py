@@ -8,6 +8,7 @@ from backend.app.models.watch_rule import WatchRule
 from backend.app.models.bookmark import Bookmark
 from backend.app.models.entity import Entity, EntityType
 from backend.app.models.item_entity import item_entities
+from backend.app.models.collection_run import CollectionRun
 
 __all__ = [
     "Base",
@@ -21,4 +22,5 @@ __all__ = [
     "Entity",
     "EntityType",
     "item_entities",
+    "CollectionRun",
 ]
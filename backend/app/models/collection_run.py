@@ -0,0 +1,27 @@
+"""Collection run model for per-source collection telemetry."""
+from sqlalchemy import Column, String, Integer, ForeignKey, Float, Text, Index
+
+from backend.app.models.base import BaseModel
+
+
+class CollectionRun(BaseModel):
+    """One collect_source run with its stage timings (created_at = run time)."""
+
+    __tablename__ = "collection_runs"
+    __table_args__ = (Index("ix_collection_runs_created_at", "created_at"),)
+
+    source_id = Column(Integer, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(String(20), nullable=False)  # success, not_modified, error
+    http_status = Column(Integer, nullable=True)
+    bytes = Column(Integer, nullable=True)
+    entries_seen = Column(Integer, nullable=True)
+    new_items = Column(Integer, nullable=True)
+    updated_items = Column(Integer, nullable=True)  # known entries whose content changed
+
+    # Stage timings in milliseconds (None when a stage did not run)
+    fetch_ms = Column(Float, nullable=True)
+    parse_ms = Column(Float, nullable=True)
+    commit_ms = Column(Float, nullable=True)
+    total_ms = Column(Float, nullable=True)
+
+    error = Column(Text, nullable=True)
@@ -1,10 +1,16 @@
 """Item model for collected news items."""
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, String, Text, Integer, BigInteger, ForeignKey, DateTime, JSON
 from sqlalchemy.orm import relationship
 
+from backend.app.core.link_utils import link_hash
 from backend.app.models.base import BaseModel
 
 
+def _default_link_hash(context) -> int:
+    """Compute link_hash from the row's link when it is not given explicitly."""
+    return link_hash(context.get_current_parameters().get("link"))
+
+
 class Item(BaseModel):
     """News item model."""
 
@@ -14,6 +20,11 @@ class Item(BaseModel):
     title = Column(String(512), nullable=False, index=True)
     summary_short = Column(Text, nullable=True)
     link = Column(String(1024), unique=True, nullable=False, index=True)
+    # Signed 64-bit hash of the canonical link (see core.link_utils); unique, the
+    # ingestion ON CONFLICT target. NULL only on legacy rows that duplicate an older one.
+    link_hash = Column(BigInteger, nullable=True, unique=True, index=True, default=_default_link_hash)
+    # Hash of the normalized entry payload; detects edited feed entries
+    content_hash = Column(BigInteger, nullable=True)
     published_at = Column(DateTime, nullable=False, index=True)
     author = Column(Text, nullable=True)
     thumbnail_url = Column(String(1024), nullable=True)
@@ -26,6 +37,14 @@ class Item(BaseModel):
     iab_categories = Column(JSON, default=list, nullable=False)
     custom_tags = Column(JSON, default=list, nullable=False)
 
+    # Classification pipeline state: pending | classifying | done | failed
+    classification_status = Column(String(20), default="pending", nullable=False, index=True)
+    # Which tier produced the labels: llm | local | heuristic (null for legacy rows)
+    classified_by = Column(String(16), nullable=True)
+    # Entity extraction state: pending | extracting | done | failed | skipped
+    entity_status = Column(String(20), default="pending", nullable=False, index=True)
+    entity_attempts = Column(Integer, default=0, nullable=False)
+
     # Deduplication grouping
     dup_group_id = Column(Integer, nullable=True, index=True)
 
@@ -1,5 +1,5 @@
 """Source model for RSS feeds."""
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, JSON
 from sqlalchemy.orm import relationship
 
 from backend.app.models.base import BaseModel
@@ -16,7 +16,25 @@ class Source(BaseModel):
     category = Column(String(100), nullable=True)
     lang = Column(String(10), default="en", nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+    # Entry filter definition (see services.entry_filter); None keeps every entry
+    filter_config = Column(JSON, nullable=True)
+
+    # Conditional GET validators and last fetch metadata
+    etag = Column(String(255), nullable=True)
+    last_modified = Column(String(64), nullable=True)
+    last_fetched_at = Column(DateTime, nullable=True)
+    last_status = Column(Integer, nullable=True)
+
+    # Adaptive polling schedule
+    next_poll_at = Column(DateTime, nullable=True, index=True)
+    poll_interval_minutes = Column(Integer, nullable=True)
+    unchanged_streak = Column(Integer, default=0, nullable=False)
+
+    # Failure tracking for backoff / circuit breaker
+    consecutive_failures = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    last_success_at = Column(DateTime, nullable=True)
+    last_failure_at = Column(DateTime, nullable=True)
 
     # Relationships
     items = relationship("Item", back_populates="source", cascade="all, delete-orphan")
-
@@ -1,7 +1,14 @@
 """Source API schemas."""
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, HttpUrl
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, HttpUrl, field_validator
+
+from backend.app.services.entry_filter import validate_filter_config
+
+
+def _check_filter_config(value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    validate_filter_config(value)
+    return value
 
 
 class SourceResponse(BaseModel):
@@ -13,6 +20,14 @@ class SourceResponse(BaseModel):
     category: Optional[str] = None
     lang: str = "en"
     is_active: bool = True
+    filter_config: Optional[Dict[str, List[str]]] = None
+    last_fetched_at: Optional[datetime] = None
+    last_status: Optional[int] = None
+    next_poll_at: Optional[datetime] = None
+    poll_interval_minutes: Optional[int] = None
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+    last_success_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     
@@ -28,6 +43,9 @@ class SourceCreate(BaseModel):
     category: Optional[str] = None
     lang: str = "en"
     is_active: bool = True
+    filter_config: Optional[Dict[str, List[str]]] = None
+    
+    _validate_filter_config = field_validator("filter_config")(_check_filter_config)
 
 
 class SourceUpdate(BaseModel):
@@ -38,4 +56,34 @@ class SourceUpdate(BaseModel):
     category: Optional[str] = None
     lang: Optional[str] = None
     is_active: Optional[bool] = None
+    filter_config: Optional[Dict[str, List[str]]] = None
+    
+    _validate_filter_config = field_validator("filter_config")(_check_filter_config)
+
 
+
+class StageTiming(BaseModel):
+    """Rolling percentile timing (ms) of one collection stage."""
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+
+
+class SourceStatsResponse(BaseModel):
+    """Collection telemetry summary for one source."""
+    source_id: int
+    runs: int
+    errors: int
+    not_modified: int
+    last_run_at: Optional[datetime] = None
+    timings: Dict[str, StageTiming]
+    averages: Dict[str, Optional[float]]
+
+
+class SlowSourceResponse(BaseModel):
+    """Source ranked by p95 total collection time."""
+    source_id: int
+    title: str
+    runs: int
+    errors: int
+    p50_total_ms: Optional[float] = None
+    p95_total_ms: Optional[float] = None
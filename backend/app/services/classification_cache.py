@@ -0,0 +1,164 @@
+"""Persistent cache of LLM classification labels.
+
+Entries are keyed by a hash of (prompt version, model chain, title, summary),
+so syndicated copies of a story, re-runs of ``update_items_field`` and items
+re-inserted after cleanup reuse earlier LLM answers instead of paying for a
+new call. Bumping ``PROMPT_VERSION`` in the classifier changes every key; rows
+written under other prompt versions are purged when the cache is opened.
+
+The store is a local SQLite file (WAL mode, shared by threads through one
+connection). Entries expire after ``ttl_days`` and the least recently used
+entries are evicted once the table grows past ``max_entries``. The entry
+count is tracked in memory (re-counted only when an eviction runs), so
+``set`` never scans the table.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from backend.app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Evict at least this fraction of max_entries at once, so eviction runs rarely
+_EVICT_FRACTION = 0.1
+
+
+def cache_key(prompt_version: str, models: Sequence[str], title: str, summary: str) -> str:
+    """Return the cache key for one classification input."""
+    raw = json.dumps([prompt_version, list(models), title or "", summary or ""], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+    """SQLite-backed LRU/TTL cache of classification labels with hit/miss counters."""
+
+    def __init__(self, path: str, prompt_version: str, max_entries: int = 200_000, ttl_days: float = 90):
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+            prompt_version: Current classifier prompt version; other versions are purged
+            max_entries: LRU capacity
+            ttl_days: Entry lifetime
+        """
+        self.path = path
+        self.prompt_version = prompt_version
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = ttl_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS classification_cache ("
+                " key TEXT PRIMARY KEY,"
+                " prompt_version TEXT NOT NULL,"
+                " labels TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_classification_cache_accessed_at"
+                " ON classification_cache (accessed_at)"
+            )
+            purged = self._conn.execute(
+                "DELETE FROM classification_cache WHERE prompt_version != ?", (prompt_version,)
+            ).rowcount
+            self._count = self._conn.execute("SELECT COUNT(*) FROM classification_cache").fetchone()[0]
+        if purged:
+            logger.info(f"[Classify] Cache purged {purged} entries from older prompt versions")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return cached labels for a key, or None (expired entries count as misses)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT labels, created_at FROM classification_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._count -= self._conn.execute(
+                        "DELETE FROM classification_cache WHERE key = ?", (key,)
+                    ).rowcount
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE classification_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, labels: Dict) -> None:
+        """Store labels for a key, evicting least recently used entries when full."""
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM classification_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO classification_cache (key, prompt_version, labels, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, self.prompt_version, json.dumps(labels, ensure_ascii=False), now, now),
+            )
+            if exists is None:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries down to max_entries (caller holds the lock)."""
+        # Other processes may share the file: re-count before deciding how much to drop
+        self._count = self._conn.execute("SELECT COUNT(*) FROM classification_cache").fetchone()[0]
+        if self._count <= self.max_entries:
+            return
+        self._count -= self._conn.execute(
+            "DELETE FROM classification_cache WHERE key IN ("
+            " SELECT key FROM classification_cache ORDER BY accessed_at ASC LIMIT ?)",
+            (max(self._count - self.max_entries, int(self.max_entries * _EVICT_FRACTION)),),
+        ).rowcount
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the current entry count."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM classification_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ClassificationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_classification_cache(prompt_version: str) -> Optional[ClassificationCache]:
+    """Return this process's ClassificationCache, or None when disabled."""
+    global _cache
+    settings = get_settings()
+    if not settings.CLASSIFICATION_CACHE_PATH:
+        return None
+    with _cache_lock:
+        if _cache is None or _cache.prompt_version != prompt_version:
+            _cache = ClassificationCache(
+                settings.CLASSIFICATION_CACHE_PATH,
+                prompt_version=prompt_version,
+                max_entries=settings.CLASSIFICATION_CACHE_MAX_ENTRIES,
+                ttl_days=settings.CLASSIFICATION_CACHE_TTL_DAYS,
+            )
+        return _cache
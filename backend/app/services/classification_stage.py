@@ -0,0 +1,192 @@
+"""Batched classification stage, decoupled from RSS ingestion.
+
+Ingestion inserts items with classification_status="pending". This stage:
+1. Claims a batch of pending items in a short transaction (FOR UPDATE SKIP LOCKED).
+2. Classifies them with no DB transaction open: several items per LLM call
+   when the classifier supports ``classify_batch``, otherwise one call per
+   item with bounded concurrency.
+3. Writes field/custom_tags/iptc_topics/iab_categories/classified_by back in
+   one bulk UPDATE, skipping items re-enqueued while they were classified.
+
+Items stuck in "classifying" (e.g. worker crashed) are reclaimed after
+``stale_after_minutes``.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, bindparam, or_, update
+from sqlalchemy.orm import Session
+
+from backend.app.models.item import Item
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLASSIFICATION = {"field": "research", "iptc_topics": [], "iab_categories": [], "custom_tags": []}
+
+
+class ClassificationStage:
+    """Pull pending items in batches, classify them and write results in bulk."""
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = 50,
+        max_workers: int = 4,
+        stale_after_minutes: int = 30,
+        classifier=None,
+    ):
+        """Initialize the stage.
+
+        Args:
+            db: SQLAlchemy database session
+            batch_size: Items claimed per batch
+            max_workers: Concurrent classify calls
+            stale_after_minutes: Reclaim "classifying" items older than this
+            classifier: Optional ClassifierService (created lazily otherwise)
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.max_workers = max(1, max_workers)
+        self.stale_after_minutes = stale_after_minutes
+        self._classifier = classifier
+
+    @property
+    def classifier(self):
+        if self._classifier is None:
+            from backend.app.services.classifier import ClassifierService
+
+            self._classifier = ClassifierService()
+        return self._classifier
+
+    def claim_batch(self) -> List[Dict]:
+        """Mark up to ``batch_size`` pending items as "classifying" and return them.
+
+        Returns:
+            List of {"id", "title", "summary"} dicts
+        """
+        stale_cutoff = datetime.utcnow() - timedelta(minutes=self.stale_after_minutes)
+        rows = (
+            self.db.query(Item.id, Item.title, Item.summary_short)
+            .filter(
+                or_(
+                    Item.classification_status == "pending",
+                    and_(Item.classification_status == "classifying", Item.updated_at < stale_cutoff),
+                )
+            )
+            .order_by(Item.id.asc())
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not rows:
+            self.db.commit()
+            return []
+
+        now = datetime.utcnow()
+        self.db.execute(
+            update(Item),
+            [{"id": r.id, "classification_status": "classifying", "updated_at": now} for r in rows],
+        )
+        self.db.commit()
+        return [{"id": r.id, "title": r.title or "", "summary": r.summary_short or ""} for r in rows]
+
+    def classify_rows(self, rows: List[Dict]) -> List[Dict]:
+        """Classify claimed rows with bounded concurrency (no DB access).
+
+        Returns:
+            List of {"id", "status", "result"} dicts in input order
+        """
+        classify_batch = getattr(self.classifier, "classify_batch", None)
+        if classify_batch is not None and len(rows) > 1:
+            try:
+                results = classify_batch(rows, max_workers=self.max_workers)
+                return [{"id": r["id"], "status": "done", "result": res} for r, res in zip(rows, results)]
+            except Exception as e:
+                logger.warning(f"[Classify] Batch classification failed, classifying per item: {e}")
+
+        def classify_one(row: Dict) -> Dict:
+            try:
+                result = self.classifier.classify(row["title"], row["summary"])
+                return {"id": row["id"], "status": "done", "result": result}
+            except Exception as e:
+                logger.warning(f"[Classify] Failed to classify item {row['id']}: {e}")
+                return {"id": row["id"], "status": "failed", "result": dict(DEFAULT_CLASSIFICATION)}
+
+        if self.max_workers == 1 or len(rows) <= 1:
+            return [classify_one(r) for r in rows]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(rows))) as pool:
+            return list(pool.map(classify_one, rows))
+
+    def write_results(self, results: List[Dict]) -> int:
+        """Write classification results back in one executemany UPDATE.
+
+        Only items still "classifying" are written: an item re-enqueued as
+        "pending" meanwhile (e.g. its feed entry was edited) keeps that status
+        and is classified again from its new text.
+
+        Returns:
+            Number of items written
+        """
+        if not results:
+            return 0
+        now = datetime.utcnow()
+        items = Item.__table__
+        stmt = (
+            update(items)
+            .where(items.c.id == bindparam("b_id"), items.c.classification_status == "classifying")
+            .values(
+                field=bindparam("b_field"),
+                iptc_topics=bindparam("b_iptc_topics"),
+                iab_categories=bindparam("b_iab_categories"),
+                custom_tags=bindparam("b_custom_tags"),
+                classified_by=bindparam("b_classified_by"),
+                classification_status=bindparam("b_status"),
+                updated_at=now,
+            )
+        )
+        written = self.db.execute(
+            stmt,
+            [
+                {
+                    "b_id": r["id"],
+                    "b_field": r["result"].get("field"),
+                    "b_iptc_topics": r["result"].get("iptc_topics", []),
+                    "b_iab_categories": r["result"].get("iab_categories", []),
+                    "b_custom_tags": r["result"].get("custom_tags", []),
+                    "b_classified_by": r["result"].get("classified_by"),
+                    "b_status": r["status"],
+                }
+                for r in results
+            ],
+        ).rowcount
+        self.db.commit()
+        if 0 <= written < len(results):
+            logger.info(f"[Classify] {len(results) - written} items were re-enqueued while classifying, skipped")
+        return written
+
+    def run(self, max_batches: Optional[int] = None) -> int:
+        """Process pending items until none remain (or ``max_batches`` reached).
+
+        Returns:
+            Number of items classified
+        """
+        processed = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            rows = self.claim_batch()
+            if not rows:
+                break
+            results = self.classify_rows(rows)
+            self.write_results(results)
+            processed += len(results)
+            batches += 1
+            if len(rows) < self.batch_size:
+                break
+        cache = getattr(self._classifier, "cache", None)
+        if processed and cache is not None:
+            logger.info(f"[Classify] Classification cache: {cache.stats()}")
+        return processed
@@ -1,14 +1,32 @@
 """Classifier service for IPTC, IAB, and custom AI tags.
 
 Updated: LLM-first strategy with heuristic fallback.
+- Local tier: when a trained local model is configured (LOCAL_CLASSIFIER_PATH),
+  its prediction is used if confidence >= LOCAL_CLASSIFIER_THRESHOLD and the
+  item is escalated to the LLM otherwise (see services.local_classifier).
 - Primary: Use gpt-5-mini to classify (title + summary) into custom_tags, IPTC, IAB.
 - Fallback: If LLM fails or returns empty, use keyword heuristics and minimal mappings.
+- Batch: classify_batch packs many items into one prompt (sized by a token
+  budget) and falls back per item for anything missing from the response.
+- Cache: LLM labels are cached by (PROMPT_VERSION, models, title, summary)
+  when CLASSIFICATION_CACHE_PATH is set; bump PROMPT_VERSION whenever the
+  prompts or label schema change.
+- Model health: models whose calls keep failing are skipped for a cooldown,
+  and the fastest healthy model is tried first (see services.model_health).
 """
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
 from backend.app.core.config import get_settings
 from backend.app.core.constants import FIELDS
+from backend.app.services.classification_cache import cache_key, get_classification_cache
+from backend.app.services.keyword_matcher import KeywordMatcher
+from backend.app.services.llm_gateway import get_llm_gateway
+from backend.app.services.local_classifier import get_local_classifier
+from backend.app.services.model_health import get_model_health
 
 
 CUSTOM_KEYWORDS = {
@@ -45,22 +63,77 @@ FIELD_KEYWORDS = {
 }
 
 
+# Compiled once; whole-token matching (see services.keyword_matcher)
+CUSTOM_MATCHER = KeywordMatcher(CUSTOM_KEYWORDS)
+FIELD_MATCHER = KeywordMatcher(FIELD_KEYWORDS)
+
+LLM_MODELS = ["gpt-4.1-mini", "gpt-4o-mini", "gpt-5-mini"]
+# Part of the classification cache key; bump when prompts or labels change
+PROMPT_VERSION = "2026-10-17"
+SYSTEM_PROMPT = "You are a classification assistant. Respond ONLY with valid minified JSON."
+LABEL_SCHEMA = (
+    '  "custom_tags": ["agents","world_models","non_transformer","neuro_symbolic","foundational_models","inference_infra"],\n'
+    '  "iptc_topics": ["technology > artificial intelligence", ...],\n'
+    '  "iab_categories": ["Technology > Computing", ...]\n'
+)
+# Rough chars-per-token ratio used to size batches without a tokenizer
+CHARS_PER_TOKEN = 4
+# Output tokens reserved per item in a batch response
+BATCH_OUTPUT_TOKENS_PER_ITEM = 80
+# Summary chars sent per item in batch prompts
+BATCH_SUMMARY_CHARS = 600
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _extract_json(raw: str, open_char: str, close_char: str):
+    """Parse JSON, or the outermost open_char..close_char span if there is extra text."""
+    try:
+        return json.loads(raw)
+    except Exception:
+        start = raw.find(open_char)
+        end = raw.rfind(close_char)
+        if start != -1 and end != -1 and end > start:
+            return json.loads(raw[start : end + 1])
+        raise
+
+
+def _has_labels(llm: Optional[Dict]) -> bool:
+    return bool(llm) and bool(llm.get("custom_tags") or llm.get("iptc_topics") or llm.get("iab_categories"))
+
+
+def _labels(data: Dict) -> Dict:
+    return {
+        "custom_tags": list(data.get("custom_tags", []) or []),
+        "iptc_topics": list(data.get("iptc_topics", []) or []),
+        "iab_categories": list(data.get("iab_categories", []) or []),
+    }
+
+
 class ClassifierService:
     """LLM-first classifier with heuristic fallback; IPTC/IAB placeholders."""
 
-    def __init__(self):
+    def __init__(self, priority: str = "live"):
+        """Initialize the classifier.
+
+        Args:
+            priority: LLM gateway lane ("live" for ingestion, "backfill" for scripts)
+        """
         self._settings = get_settings()
         self._client = None
         try:
             if self._settings.OPENAI_API_KEY:
-                from openai import OpenAI
-
-                self._client = OpenAI(api_key=self._settings.OPENAI_API_KEY)
+                self._client = get_llm_gateway().client(priority)
         except Exception:
             self._client = None
+        self.cache = get_classification_cache(PROMPT_VERSION)
+        self._health = get_model_health()
+        self._local = get_local_classifier()
 
     def classify(self, title: str, summary: str) -> Dict:
-        """Return dict with field, iptc_topics, iab_categories, custom_tags."""
+        """Return dict with field, iptc_topics, iab_categories, custom_tags, classified_by."""
         text = f"{title} {summary}".strip()
         try:
             print(f"[Classifier] title_len={len(title)}, summary_len={len(summary)}")
@@ -71,20 +144,49 @@ class ClassifierService:
         lower_text = text.lower()
         field = self._infer_field(lower_text)
 
-        # Try LLM first when client is available
+        # Confident local prediction: no network call
+        if self._local is not None and text:
+            labels, confidence = self._local.predict(lower_text)
+            # A confident but empty prediction is escalated like an unconfident one
+            if confidence >= self._settings.LOCAL_CLASSIFIER_THRESHOLD and _has_labels(labels):
+                return self._result(lower_text, field, labels, "local")
+
+        # Try LLM first when client is available (cached answers skip the call)
         if self._client and text:
-            llm = self._classify_with_llm(title, summary)
-            if llm and (
-                llm.get("custom_tags") or llm.get("iptc_topics") or llm.get("iab_categories")
-            ):
-                return {
-                    "field": field,
-                    "iptc_topics": llm.get("iptc_topics", []),
-                    "iab_categories": llm.get("iab_categories", []),
-                    "custom_tags": llm.get("custom_tags", []),
-                }
+            return self._result(lower_text, field, self._llm_labels(title, summary))
 
         # Fallback to heuristics
+        return self._heuristic_result(lower_text, field)
+
+    def _cache_key(self, title: str, summary: str) -> str:
+        return cache_key(PROMPT_VERSION, LLM_MODELS, title, summary)
+
+    def _llm_labels(self, title: str, summary: str, use_cache: bool = True) -> Optional[Dict]:
+        """LLM labels for one item, read from and written to the cache when enabled."""
+        key = self._cache_key(title, summary) if self.cache else None
+        if key and use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        llm = self._classify_with_llm(title, summary)
+        if key and _has_labels(llm):
+            self.cache.set(key, llm)
+        return llm
+
+    def _result(self, lower_text: str, field: Optional[str], llm: Optional[Dict], source: str = "llm") -> Dict:
+        """Combine model labels with the inferred field, or fall back to heuristics."""
+        if _has_labels(llm):
+            return {
+                "field": field,
+                "iptc_topics": llm.get("iptc_topics", []),
+                "iab_categories": llm.get("iab_categories", []),
+                "custom_tags": llm.get("custom_tags", []),
+                "classified_by": source,
+            }
+        return self._heuristic_result(lower_text, field)
+
+    def _heuristic_result(self, lower_text: str, field: Optional[str]) -> Dict:
+        """Keyword-based classification used when the LLM is unavailable or empty."""
         custom_tags = self._infer_custom_tags(lower_text)
         iptc_topics = self._map_iptc_from_custom(custom_tags)
         iab_categories = self._map_iab_from_custom(custom_tags)
@@ -93,55 +195,174 @@ class ClassifierService:
             "iptc_topics": iptc_topics,
             "iab_categories": iab_categories,
             "custom_tags": custom_tags,
+            "classified_by": "heuristic",
         }
 
+    def plan_batches(self, items: List[Dict]) -> List[List[Dict]]:
+        """Split items into batches that fit the prompt token budget.
+
+        Args:
+            items: Dicts with "id", "title", "summary"
+
+        Returns:
+            List of item batches, in input order
+        """
+        budget = self._settings.CLASSIFIER_BATCH_TOKEN_BUDGET
+        max_items = max(1, self._settings.CLASSIFIER_BATCH_MAX_ITEMS)
+        batches: List[List[Dict]] = []
+        current: List[Dict] = []
+        used = 0
+        for item in items:
+            cost = (
+                _estimate_tokens((item.get("title") or "") + (item.get("summary") or "")[:BATCH_SUMMARY_CHARS])
+                + BATCH_OUTPUT_TOKENS_PER_ITEM
+            )
+            if current and (used + cost > budget or len(current) >= max_items):
+                batches.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def classify_batch(self, items: List[Dict], max_workers: int = 1) -> List[Dict]:
+        """Classify many items with one LLM call per token-budgeted batch.
+
+        Confident local predictions and cached items are answered without a
+        call. Items missing from (or
+        malformed in) a batch response fall back to a single-item call; items
+        the LLM returns with no labels get the keyword heuristics, as in
+        ``classify``.
+
+        Args:
+            items: Dicts with "id", "title", "summary"
+            max_workers: Batches sent concurrently
+
+        Returns:
+            Classification dicts (field, iptc_topics, iab_categories, custom_tags,
+            classified_by) in input order
+        """
+        if not items:
+            return []
+        if not self._client:
+            return [self.classify(it.get("title") or "", it.get("summary") or "") for it in items]
+
+        texts = [f"{it.get('title') or ''} {it.get('summary') or ''}".strip().lower() for it in items]
+        fields = self.infer_fields(texts)
+        results: List[Optional[Dict]] = [None] * len(items)
+        if self._local is not None:
+            local_labels, confidence = self._local.predict_many(texts)
+            confident = confidence >= self._settings.LOCAL_CLASSIFIER_THRESHOLD
+        pending: List[int] = []
+        for idx, item in enumerate(items):
+            if self._local is not None and texts[idx] and confident[idx] and _has_labels(local_labels[idx]):
+                results[idx] = self._result(texts[idx], fields[idx], local_labels[idx], "local")
+                continue
+            title = item.get("title") or ""
+            summary = item.get("summary") or ""
+            cached = self.cache.get(self._cache_key(title, summary)) if self.cache else None
+            if cached is not None:
+                results[idx] = self._result(texts[idx], fields[idx], cached)
+            else:
+                pending.append(idx)
+        if not pending:
+            return results
+
+        batches = self.plan_batches([items[i] for i in pending])
+        if max_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+                batch_results = list(pool.map(self._classify_batch_with_llm, batches))
+        else:
+            batch_results = [self._classify_batch_with_llm(b) for b in batches]
+
+        positions = iter(pending)
+        for batch, llm_results in zip(batches, batch_results):
+            for item in batch:
+                title = item.get("title") or ""
+                summary = item.get("summary") or ""
+                llm = llm_results.get(str(item["id"]))
+                if llm is None:
+                    llm = self._llm_labels(title, summary, use_cache=False)
+                elif self.cache and _has_labels(llm):
+                    self.cache.set(self._cache_key(title, summary), llm)
+                idx = next(positions)
+                results[idx] = self._result(texts[idx], fields[idx], llm)
+        return results
+
+    def _classify_batch_with_llm(self, batch: List[Dict]) -> Dict[str, Dict]:
+        """Classify a batch in one completion. Returns {str(id): labels}; {} on failure."""
+        payload = [
+            {
+                "id": str(item["id"]),
+                "title": item.get("title") or "",
+                "summary": (item.get("summary") or "")[:BATCH_SUMMARY_CHARS],
+            }
+            for item in batch
+        ]
+        prompt = (
+            "다음 항목들을 각각 분류하세요. 항목마다 아래 형식의 객체를 만들고 "
+            "같은 id를 포함한 JSON 배열만 반환:\n"
+            "{\n"
+            '  "id": "<항목 id>",\n'
+            + LABEL_SCHEMA
+            + "}\n\n"
+            f"항목: {json.dumps(payload, ensure_ascii=False)}\n"
+        )
+        for model_name in self._health.order(LLM_MODELS):
+            try:
+                raw = self._complete(model_name, prompt, BATCH_OUTPUT_TOKENS_PER_ITEM * len(batch) + 50)
+                data = _extract_json(raw, "[", "]")
+                if isinstance(data, dict):
+                    data = data.get("items") or data.get("results") or []
+                results: Dict[str, Dict] = {}
+                for entry in data:
+                    if isinstance(entry, dict) and entry.get("id") is not None:
+                        results[str(entry["id"])] = _labels(entry)
+                return results
+            except Exception:
+                continue
+        return {}
+
+    def _complete(self, model_name: str, prompt: str, max_tokens: int) -> str:
+        """Run one completion, recording the model's health. Returns the reply text."""
+        started = time.perf_counter()
+        try:
+            resp = self._client.chat.completions.create(
+                model=model_name,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=max_tokens,
+                temperature=0.0,
+            )
+        except Exception as e:
+            self._health.record_failure(model_name, f"{e.__class__.__name__}: {e}")
+            raise
+        self._health.record_success(model_name, (time.perf_counter() - started) * 1000)
+        return resp.choices[0].message.content.strip()
+
     def _classify_with_llm(self, title: str, summary: str) -> Optional[Dict]:
         """Classify using LLM; try gpt-5-mini first, then gpt-4o-mini. Return JSON or None."""
         prompt = (
             "다음 텍스트를 분류하세요. JSON만 반환:\n"
             "{\n"
-            '  "custom_tags": ["agents","world_models","non_transformer","neuro_symbolic","foundational_models","inference_infra"],\n'
-            '  "iptc_topics": ["technology > artificial intelligence", ...],\n'
-            '  "iab_categories": ["Technology > Computing", ...]\n'
-            "}\n\n"
+            + LABEL_SCHEMA
+            + "}\n\n"
             f"제목: {title}\n요약: {summary}\n"
         )
-        # Prefer gpt-4.1-mini; then try gpt-4o-mini; finally gpt-5-mini
-        models_to_try = ["gpt-4.1-mini", "gpt-4o-mini", "gpt-5-mini"]
-        import json as _json
+        # Configured preference: gpt-4.1-mini, gpt-4o-mini, gpt-5-mini; healthy and fast first
+        models_to_try = self._health.order(LLM_MODELS)
 
         last_error = None
         for model_name in models_to_try:
             try:
-                resp = self._client.chat.completions.create(
-                    model=model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a classification assistant. Respond ONLY with valid minified JSON.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    # Some model variants reject response_format; rely on instruction-only JSON
-                    max_tokens=180,
-                    temperature=0.0,
-                )
-                raw = resp.choices[0].message.content.strip()
+                # Some model variants reject response_format; rely on instruction-only JSON
+                raw = self._complete(model_name, prompt, 180)
                 # Attempt strict JSON parse; if fails, try to extract first JSON object
-                try:
-                    data = _json.loads(raw)
-                except Exception:
-                    start = raw.find("{")
-                    end = raw.rfind("}")
-                    if start != -1 and end != -1 and end > start:
-                        data = _json.loads(raw[start : end + 1])
-                    else:
-                        raise
-                return {
-                    "custom_tags": list(data.get("custom_tags", []) or []),
-                    "iptc_topics": list(data.get("iptc_topics", []) or []),
-                    "iab_categories": list(data.get("iab_categories", []) or []),
-                }
+                data = _extract_json(raw, "{", "}")
+                return _labels(data)
             except Exception as e:
                 last_error = e
                 continue
@@ -149,26 +370,23 @@ class ClassifierService:
 
     def _infer_field(self, text: str) -> Optional[str]:
         """Infer field category from text using keyword matching."""
-        # Count matches for each field
-        field_scores = {}
-        for field, keywords in FIELD_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text)
-            if score > 0:
-                field_scores[field] = score
-        
+        # Count distinct keyword matches for each field
+        field_scores = FIELD_MATCHER.scores(text)
+
         if not field_scores:
             # Default to research if no matches
             return "research"
-        
-        # Return field with highest score
-        return max(field_scores.items(), key=lambda x: x[1])[0]
+
+        # Return field with highest score (ties -> FIELD_KEYWORDS order)
+        return max(FIELD_MATCHER.categories, key=lambda f: field_scores.get(f, 0))
+
+    def infer_fields(self, texts: List[str]) -> List[str]:
+        """Vectorized ``_infer_field`` for many texts (e.g. reclassification backfills)."""
+        return FIELD_MATCHER.best_categories(texts, default="research")
 
     def _infer_custom_tags(self, text: str) -> List[str]:
-        tags: List[str] = []
-        for tag, keywords in CUSTOM_KEYWORDS.items():
-            if any(kw in text for kw in keywords):
-                tags.append(tag)
-        return tags
+        hits = CUSTOM_MATCHER.match(text)
+        return [tag for tag in CUSTOM_MATCHER.categories if tag in hits]
 
     def _map_iptc_from_custom(self, custom_tags: List[str]) -> List[str]:
         """Minimal placeholder mapping. Expand with data files later."""
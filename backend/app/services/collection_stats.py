@@ -0,0 +1,113 @@
+"""Collection telemetry: record per-run timings and summarize them.
+
+Each scheduled collect_source run is stored as a CollectionRun row. Rolling
+p50/p95 timings over a source's recent runs are computed here for the
+``/api/sources/{id}/stats`` endpoint.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from backend.app.models.collection_run import CollectionRun
+
+TIMING_FIELDS = ("fetch_ms", "parse_ms", "commit_ms", "total_ms")
+COUNT_FIELDS = ("bytes", "entries_seen", "new_items", "updated_items")
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Return the q-th percentile (0-100) with linear interpolation, None if empty."""
+    data = sorted(v for v in values if v is not None)
+    if not data:
+        return None
+    if len(data) == 1:
+        return float(data[0])
+    pos = (len(data) - 1) * q / 100.0
+    lower = int(pos)
+    upper = min(lower + 1, len(data) - 1)
+    return float(data[lower] + (data[upper] - data[lower]) * (pos - lower))
+
+
+def summarize_runs(runs: List[CollectionRun]) -> Dict:
+    """Summarize collection runs into counts and p50/p95 per stage.
+
+    Args:
+        runs: CollectionRun rows (any order)
+
+    Returns:
+        Dictionary with run/error counts, p50/p95 timings and average counts
+    """
+    summary: Dict = {
+        "runs": len(runs),
+        "errors": sum(1 for r in runs if r.status == "error"),
+        "not_modified": sum(1 for r in runs if r.status == "not_modified"),
+        "last_run_at": max((r.created_at for r in runs if r.created_at), default=None),
+        "timings": {},
+        "averages": {},
+    }
+    for field in TIMING_FIELDS:
+        values = [getattr(r, field) for r in runs]
+        summary["timings"][field] = {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+    for field in COUNT_FIELDS:
+        values = [getattr(r, field) for r in runs if getattr(r, field) is not None]
+        summary["averages"][field] = (sum(values) / len(values)) if values else None
+    return summary
+
+
+def record_collection_run(
+    db: Session,
+    source_id: int,
+    run: Dict,
+    total_ms: float,
+    error: Optional[str] = None,
+) -> CollectionRun:
+    """Add a CollectionRun row for one collect_source call (caller commits).
+
+    Args:
+        db: SQLAlchemy database session
+        source_id: Collected source ID
+        run: RSSCollector.last_run timings/counters
+        total_ms: Wall time of the whole run
+        error: Error message if the run failed
+
+    Returns:
+        The (pending) CollectionRun instance
+    """
+    if error:
+        status = "error"
+    elif run.get("http_status") == 304:
+        status = "not_modified"
+    else:
+        status = "success"
+    record = CollectionRun(
+        source_id=source_id,
+        status=status,
+        http_status=run.get("http_status"),
+        bytes=run.get("bytes"),
+        entries_seen=run.get("entries_seen"),
+        new_items=run.get("new_items"),
+        updated_items=run.get("updated_items"),
+        fetch_ms=run.get("fetch_ms"),
+        parse_ms=run.get("parse_ms"),
+        commit_ms=run.get("commit_ms"),
+        total_ms=total_ms,
+        error=(error or None) and error[:2000],
+    )
+    db.add(record)
+    return record
+
+
+def prune_collection_runs(db: Session, retention_days: int) -> int:
+    """Delete collection runs older than ``retention_days`` (commits).
+
+    Returns:
+        Number of rows deleted
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    deleted = (
+        db.query(CollectionRun)
+        .filter(CollectionRun.created_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
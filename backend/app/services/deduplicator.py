@@ -3,6 +3,10 @@
 Features (MVP):
 - Exact duplicate check by link.
 - Text similarity via TF-IDF cosine (fallback to Jaccard on tokens if sklearn not available).
+  The window is vectorized once (see tfidf_index.py) and all candidates of an
+  item are scored in one sparse matrix-vector product.
+- Optional MinHash LSH candidate index (see minhash_lsh.py): candidates come
+  from bucket lookups instead of a scan of the whole lookback window.
 - Assign dup_group_id for near-duplicates within a recent lookback window.
 """
 
@@ -13,6 +17,7 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
+from backend.app.core.link_utils import link_hash
 from backend.app.models.item import Item
 from backend.app.models.dup_group_meta import DupGroupMeta
 
@@ -20,6 +25,7 @@ try:
     # Optional dependency; fallback if unavailable
     from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
     from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
+    from backend.app.services.tfidf_index import TfidfIndex
     _HAS_SKLEARN = True
 except Exception:  # pragma: no cover - only used when sklearn missing
     _HAS_SKLEARN = False
@@ -28,16 +34,38 @@ except Exception:  # pragma: no cover - only used when sklearn missing
 class Deduplicator:
     """Provides duplicate detection and grouping for Items."""
 
-    def __init__(self, db: Session, similarity_threshold: float = 0.7, lookback_days: int = 7, verbose: bool = False):
+    def __init__(
+        self,
+        db: Session,
+        similarity_threshold: float = 0.7,
+        lookback_days: int = 7,
+        verbose: bool = False,
+        lsh=None,
+    ):
         self.db = db
         self.similarity_threshold = similarity_threshold
         self.lookback_days = lookback_days
         self.verbose = verbose
+        # Optional MinHashLSH; processed items are added to it
+        self.lsh = lsh
+        # Window TF-IDF index, fitted once (fit_window or the first item) and reused
+        self.index = None
+
+    def fit_window(self, items: List[Item]) -> None:
+        """Vectorize a window of items once; later items reuse the fitted index."""
+        if not _HAS_SKLEARN:
+            return
+        self.index = TfidfIndex().fit({it.id: self._compose_text(it) for it in items if it.id is not None})
+        if self.verbose:
+            try:
+                print(f"[Dedup] TF-IDF index fitted on {len(items)} items")
+            except Exception:
+                pass
 
     # -------- Core API --------
     def check_exact_duplicate(self, link: str, exclude_id: Optional[int] = None) -> bool:
-        """Return True if an item with the same link already exists (excluding optional self id)."""
-        q = self.db.query(Item.id).filter(Item.link == link)
+        """Return True if an item with the same canonical link exists (excluding optional self id)."""
+        q = self.db.query(Item.id).filter(Item.link_hash == link_hash(link))
         if exclude_id is not None:
             q = q.filter(Item.id != exclude_id)
         exists = self.db.query(q.exists()).scalar()
@@ -67,46 +95,23 @@ class Deduplicator:
             return None
 
         cutoff = (item.published_at or datetime.utcnow()) - timedelta(days=self.lookback_days)
-        recent_items: List[Item] = (
-            self.db.query(Item)
-            .filter(Item.published_at != None)  # noqa: E711
-            .filter(Item.published_at >= cutoff)
-            .order_by(Item.published_at.desc())
-            .all()
-        )
+        target_text = self._compose_text(item)
+        recent_items = self._recent_items(item, target_text, cutoff)
         if self.verbose:
             try:
                 print(f"[Dedup] Recent candidates: {len(recent_items)} (cutoff>={cutoff.isoformat()})")
             except Exception:
                 pass
 
-        # Build candidate text corpus
-        target_text = self._compose_text(item)
-        # 1st stage candidate filtering: title 3-gram overlap and (if present) entity/tag overlap
-        target_shingles = _title_shingles(item.title or "")
-        target_entities = {getattr(e, "name", "").strip().lower() for e in getattr(item, "entities", []) if getattr(e, "name", None)} if hasattr(item, "entities") else set()
-        target_tags = set((item.custom_tags or []) if isinstance(item.custom_tags, list) else [])
-
         best_sim = 0.0
         best_item: Optional[Item] = None
 
-        for cand in recent_items:
-            if not cand.link or cand.id == (item.id or -1):
-                continue
-            # Filter by title shingles
-            cand_shingles = _title_shingles(cand.title or "")
-            if target_shingles and cand_shingles and len(target_shingles & cand_shingles) == 0:
-                continue
-            # Optional: entity/tag overlap when available
-            try:
-                cand_entities = {getattr(e, "name", "").strip().lower() for e in getattr(cand, "entities", []) if getattr(e, "name", None)}
-            except Exception:
-                cand_entities = set()
-            cand_tags = set((cand.custom_tags or []) if isinstance(cand.custom_tags, list) else [])
-            if target_entities and cand_entities and len(target_entities & cand_entities) == 0 and target_tags and cand_tags and len(target_tags & cand_tags) == 0:
-                # if both sides have signals, require at least one overlap
-                continue
-            sim = self._augmented_similarity(item, cand, target_text, self._compose_text(cand))
+        candidates = self._filter_candidates(item, recent_items)
+        # With LSH, recent_items are only the bucket hits: fit the index on the window
+        window = recent_items if self.lsh is None else None
+        bases = self._base_similarities(target_text, candidates, window, cutoff)
+        for cand, base in zip(candidates, bases):
+            sim = self._augmented_similarity(item, cand, base=base)
             if self.verbose:
                 try:
                     print(f"[Dedup] sim to cand#{cand.id} ~ {sim:.4f}")
@@ -146,6 +151,8 @@ class Deduplicator:
                     print(f"[Dedup] GROUPED item#{item.id} -> group_id={group_id} (best_sim={best_sim:.4f})")
                 except Exception:
                     pass
+            if self.lsh is not None:
+                self.lsh.add(item.id, target_text, item.published_at)
             return group_id
 
         # No near-duplicate found; do not assign group id here (could become a seed later)
@@ -170,8 +177,47 @@ class Deduplicator:
                 print(f"[Dedup] Seed/meta error for item {item.id}: {e}")
             except Exception:
                 pass
+        if self.lsh is not None and item.id is not None:
+            self.lsh.add(item.id, target_text, item.published_at)
         return item.id
 
+    # -------- Candidates --------
+    def _recent_items(self, item: Item, target_text: str, cutoff: datetime) -> List[Item]:
+        """Items of the lookback window to compare with: all of them, or only LSH bucket hits."""
+        query = self.db.query(Item).filter(Item.published_at != None).filter(Item.published_at >= cutoff)  # noqa: E711
+        if self.lsh is not None:
+            ids = self.lsh.query(target_text, exclude=item.id)
+            if not ids:
+                return []
+            query = query.filter(Item.id.in_(ids))
+        return query.order_by(Item.published_at.desc()).all()
+
+    def _filter_candidates(self, item: Item, recent_items: List[Item]) -> List[Item]:
+        """1st stage candidate filtering: title 3-gram overlap and (if present) entity/tag overlap."""
+        target_shingles = _title_shingles(item.title or "")
+        target_entities = {getattr(e, "name", "").strip().lower() for e in getattr(item, "entities", []) if getattr(e, "name", None)} if hasattr(item, "entities") else set()
+        target_tags = set((item.custom_tags or []) if isinstance(item.custom_tags, list) else [])
+
+        candidates: List[Item] = []
+        for cand in recent_items:
+            if not cand.link or cand.id == (item.id or -1):
+                continue
+            # Filter by title shingles
+            cand_shingles = _title_shingles(cand.title or "")
+            if target_shingles and cand_shingles and len(target_shingles & cand_shingles) == 0:
+                continue
+            # Optional: entity/tag overlap when available
+            try:
+                cand_entities = {getattr(e, "name", "").strip().lower() for e in getattr(cand, "entities", []) if getattr(e, "name", None)}
+            except Exception:
+                cand_entities = set()
+            cand_tags = set((cand.custom_tags or []) if isinstance(cand.custom_tags, list) else [])
+            if target_entities and cand_entities and len(target_entities & cand_entities) == 0 and target_tags and cand_tags and len(target_tags & cand_tags) == 0:
+                # if both sides have signals, require at least one overlap
+                continue
+            candidates.append(cand)
+        return candidates
+
     # -------- Helpers --------
     @staticmethod
     def _compose_text(item: Item) -> str:
@@ -180,6 +226,42 @@ class Deduplicator:
             parts.append(item.summary_short)
         return " ".join(parts).strip()
 
+    def _base_similarities(
+        self,
+        text: str,
+        candidates: List[Item],
+        window: Optional[List[Item]] = None,
+        cutoff: Optional[datetime] = None,
+    ) -> List[float]:
+        """Text similarity of ``text`` to every candidate in one sparse product.
+
+        Fits the window index on first use (on ``window``, or on the items
+        published since ``cutoff`` loaded as id/title/summary rows); falls back
+        to per-pair ``_similarity`` when sklearn is unavailable or the index fails.
+        """
+        if not candidates:
+            return []
+        texts = [self._compose_text(c) for c in candidates]
+        if _HAS_SKLEARN:
+            try:
+                if self.index is None:
+                    if window is None:
+                        window = (
+                            self.db.query(Item.id, Item.title, Item.summary_short)
+                            .filter(Item.published_at != None)  # noqa: E711
+                            .filter(Item.published_at >= cutoff)
+                            .all()
+                        ) if cutoff is not None else candidates
+                    self.fit_window(window)
+                return self.index.similarities(text, list(zip([c.id for c in candidates], texts))).tolist()
+            except Exception as e:
+                if self.verbose:
+                    try:
+                        print(f"[Dedup] TF-IDF index error: {e} -> per-pair similarity")
+                    except Exception:
+                        pass
+        return [self._similarity(text, t) for t in texts]
+
     def _similarity(self, a: str, b: str) -> float:
         """Compute similarity between two strings.
         Prefer TF-IDF + cosine; fallback to token Jaccard similarity.
@@ -221,14 +303,23 @@ class Deduplicator:
         return sim
 
     # -------- Augmented similarity (entities/tags/time) --------
-    def _augmented_similarity(self, a_item: Item, b_item: Item, a_text: Optional[str] = None, b_text: Optional[str] = None) -> float:
+    def _augmented_similarity(
+        self,
+        a_item: Item,
+        b_item: Item,
+        a_text: Optional[str] = None,
+        b_text: Optional[str] = None,
+        base: Optional[float] = None,
+    ) -> float:
         """Augment base text similarity with entities/custom_tags overlap and time proximity.
 
         This improves practical grouping of continued coverage (evolution) while
-        keeping behavior backward compatible for base similarity.
+        keeping behavior backward compatible for base similarity. ``base`` skips
+        the text similarity when the caller already computed it.
         """
-        base = self._similarity(a_text if a_text is not None else self._compose_text(a_item),
-                                b_text if b_text is not None else self._compose_text(b_item))
+        if base is None:
+            base = self._similarity(a_text if a_text is not None else self._compose_text(a_item),
+                                    b_text if b_text is not None else self._compose_text(b_item))
 
         bonus = 0.0
 
@@ -2,7 +2,10 @@
 
 MVP scope:
 - Implement OpenAI-based extractor returning a simple list of entities.
-- Provide DB save helper to upsert entities and link to items.
+- Provide DB save helpers to upsert entities and link to items (bulk, see
+  services.entity_store).
+- extract_entities_batch: several items per call, used by the entity stage
+  (services.entity_stage) before grouping.
 
 Testing strategy:
 - Unit tests will mock OpenAI client.
@@ -15,23 +18,38 @@ import json
 from sqlalchemy.orm import Session
 
 from backend.app.core.config import get_settings
-from backend.app.models.entity import Entity, EntityType
-from backend.app.models.item_entity import item_entities
+from backend.app.services.entity_store import save_entities_bulk
+from backend.app.services.llm_gateway import get_llm_gateway
+
+
+def _valid_entities(entities) -> List[Dict]:
+    """Keep {name, type} entries with a non-empty name and a known type."""
+    valid_entities: List[Dict] = []
+    for e in entities or []:
+        if not isinstance(e, dict):
+            continue
+        name = (e.get("name") or "").strip()
+        type_str = (e.get("type") or "").strip().lower()
+        if not name or type_str not in {"person", "org", "tech"}:
+            continue
+        valid_entities.append({"name": name, "type": type_str})
+    return valid_entities
 
 
 class EntityExtractor:
     """Extract entities (person/org/tech) from title + summary."""
 
-    def __init__(self):
-        """Initialize OpenAI client using configured API key."""
+    def __init__(self, priority: str = "live"):
+        """Initialize a client on the shared LLM gateway.
+
+        Args:
+            priority: LLM gateway lane ("live" for ingestion, "backfill" for scripts)
+        """
         settings = get_settings()
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is not set in environment variables")
 
-        # Deferred import to avoid dependency when not used in tests
-        from openai import OpenAI
-
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_llm_gateway().client(priority)
 
     def extract_entities(self, title: str, summary: str) -> List[Dict]:
         """Call OpenAI to extract entities as list of {name, type} dicts.
@@ -69,54 +87,70 @@ class EntityExtractor:
         except Exception:
             return []
 
-        entities = result.get("entities", [])
-        valid_entities: List[Dict] = []
-        for e in entities:
-            name = (e.get("name") or "").strip()
-            type_str = (e.get("type") or "").strip().lower()
-            if not name or type_str not in {"person", "org", "tech"}:
-                continue
-            valid_entities.append({"name": name, "type": type_str})
-        return valid_entities
+        return _valid_entities(result.get("entities", []))
+
+    def extract_entities_batch(self, items: List[Dict]) -> Dict[int, List[Dict]]:
+        """Extract entities for several items with one call.
+
+        Items missing from the response are extracted one by one.
+
+        Args:
+            items: Dicts with "id", "title", "summary"
+
+        Returns:
+            {item id: list of {name, type}}
+        """
+        if not items:
+            return {}
+        payload = [
+            {"id": str(it["id"]), "title": it.get("title") or "", "summary": (it.get("summary") or "")[:600]}
+            for it in items
+        ]
+        prompt = (
+            "다음 기사들에서 각각 중요한 엔티티를 추출하세요:\n"
+            "- 인물 (Person): 연구자, 기업가, 전문가 이름\n"
+            "- 기관 (Organization): 회사, 연구소, 대학\n"
+            "- 기술 (Technology): 기술명, 모델명, 프레임워크\n\n"
+            f"기사: {json.dumps(payload, ensure_ascii=False)}\n\n"
+            "JSON 형식으로 반환 (기사마다 같은 id 사용):\n"
+            "{\n"
+            '  "items": [\n'
+            '    {"id": "1", "entities": [{"name": "Yann LeCun", "type": "person"}, {"name": "Meta", "type": "org"}]}\n'
+            "  ]\n"
+            "}\n"
+        )
+
+        response = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            max_tokens=120 * len(items) + 50,
+            temperature=0.0,
+        )
+
+        results: Dict[int, List[Dict]] = {}
+        try:
+            data = json.loads(response.choices[0].message.content)
+            by_id = {str(it["id"]): it["id"] for it in items}
+            for entry in data.get("items", []):
+                item_id = by_id.get(str(entry.get("id")))
+                if item_id is not None:
+                    results[item_id] = _valid_entities(entry.get("entities", []))
+        except Exception:
+            pass
+
+        for it in items:
+            if it["id"] not in results:
+                results[it["id"]] = self.extract_entities(it.get("title") or "", it.get("summary") or "")
+        return results
 
     def save_entities(self, db: Session, item_id: int, entities: List[Dict]) -> None:
         """Upsert entities and create item-entity relations if missing."""
-        for entity_data in entities:
-            name = entity_data.get("name")
-            type_str = entity_data.get("type")
-            if not name or not type_str:
-                continue
-
-            entity = (
-                db.query(Entity)
-                .filter(Entity.name == name)
-                .first()
-            )
-
-            if not entity:
-                # Map string to enum; upper() matches enum names PERSON/ORGANIZATION/TECHNOLOGY
-                enum_map = {"person": "PERSON", "org": "ORGANIZATION", "tech": "TECHNOLOGY"}
-                try:
-                    entity_type = EntityType[enum_map[type_str]]
-                except Exception:
-                    # Skip unknown type
-                    continue
-
-                entity = Entity(name=name, type=entity_type)
-                db.add(entity)
-                db.flush()
-
-            existing = db.execute(
-                item_entities.select().where(
-                    (item_entities.c.item_id == item_id)
-                    & (item_entities.c.entity_id == entity.id)
-                )
-            ).first()
-
-            if not existing:
-                db.execute(
-                    item_entities.insert().values(item_id=item_id, entity_id=entity.id)
-                )
-
-        db.commit()
+        save_entities_bulk(db, {item_id: entities})
 
+    def save_entities_bulk(self, db: Session, entities_by_item: Dict[int, List[Dict]], commit: bool = True) -> int:
+        """Upsert entities and relations for many items in a few statements.
+
+        See services.entity_store.save_entities_bulk.
+        """
+        return save_entities_bulk(db, entities_by_item, commit=commit)
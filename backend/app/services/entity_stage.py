@@ -0,0 +1,185 @@
+"""Batched entity extraction stage for newly ingested items.
+
+Items are inserted with entity_status="pending" (or "done" when the ingestion
+gazetteer already covered them, see gazetteer.py). This stage:
+1. Claims a batch of pending items in a short transaction (FOR UPDATE SKIP LOCKED)
+   and counts the attempt.
+2. Extracts entities several items per LLM call, calls spread over a bounded
+   thread pool, with no DB transaction open.
+3. Saves entities/item links and marks items "done". Items whose call failed
+   go back to "pending" until ``max_attempts`` is reached, then "failed".
+
+It runs right before incremental grouping so that Deduplicator's entity
+overlap bonus sees the new items' entities. Items stuck in "extracting" are
+reclaimed after ``stale_after_minutes``.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+
+from backend.app.models.item import Item
+
+logger = logging.getLogger(__name__)
+
+
+class EntityStage:
+    """Pull pending items in batches, extract entities and record per-item status."""
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int = 50,
+        items_per_call: int = 10,
+        max_workers: int = 4,
+        max_attempts: int = 3,
+        stale_after_minutes: int = 30,
+        extractor=None,
+    ):
+        """Initialize the stage.
+
+        Args:
+            db: SQLAlchemy database session
+            batch_size: Items claimed per batch
+            items_per_call: Items sent in one extraction call
+            max_workers: Concurrent extraction calls
+            max_attempts: Attempts before an item is marked "failed"
+            stale_after_minutes: Reclaim "extracting" items older than this
+            extractor: Optional EntityExtractor (created lazily otherwise)
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.items_per_call = max(1, items_per_call)
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self.stale_after_minutes = stale_after_minutes
+        self._extractor = extractor
+
+    @property
+    def extractor(self):
+        if self._extractor is None:
+            from backend.app.services.entity_extractor import EntityExtractor
+
+            self._extractor = EntityExtractor()
+        return self._extractor
+
+    def claim_batch(self) -> List[Dict]:
+        """Mark up to ``batch_size`` pending items as "extracting" and return them.
+
+        Returns:
+            List of {"id", "title", "summary", "attempts"} dicts
+        """
+        stale_cutoff = datetime.utcnow() - timedelta(minutes=self.stale_after_minutes)
+        rows = (
+            self.db.query(Item.id, Item.title, Item.summary_short, Item.entity_attempts)
+            .filter(
+                or_(
+                    Item.entity_status == "pending",
+                    and_(Item.entity_status == "extracting", Item.updated_at < stale_cutoff),
+                )
+            )
+            .order_by(Item.id.asc())
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not rows:
+            self.db.commit()
+            return []
+
+        now = datetime.utcnow()
+        claimed = [
+            {"id": r.id, "title": r.title or "", "summary": r.summary_short or "", "attempts": (r.entity_attempts or 0) + 1}
+            for r in rows
+        ]
+        self.db.execute(
+            update(Item),
+            [
+                {"id": r["id"], "entity_status": "extracting", "entity_attempts": r["attempts"], "updated_at": now}
+                for r in claimed
+            ],
+        )
+        self.db.commit()
+        return claimed
+
+    def extract_rows(self, rows: List[Dict]) -> Dict[int, Optional[List[Dict]]]:
+        """Extract entities for claimed rows (no DB access).
+
+        Returns:
+            {item id: entities, or None when the item's call failed}
+        """
+        chunks = [rows[i : i + self.items_per_call] for i in range(0, len(rows), self.items_per_call)]
+
+        def extract_chunk(chunk: List[Dict]) -> Dict[int, Optional[List[Dict]]]:
+            try:
+                found = self.extractor.extract_entities_batch(chunk)
+            except Exception as e:
+                logger.warning(f"[Entities] Extraction failed for {len(chunk)} items: {e}")
+                found = {}
+            return {r["id"]: found.get(r["id"]) for r in chunk}
+
+        results: Dict[int, Optional[List[Dict]]] = {}
+        if self.max_workers == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                results.update(extract_chunk(chunk))
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as pool:
+                for part in pool.map(extract_chunk, chunks):
+                    results.update(part)
+        return results
+
+    def write_results(self, rows: List[Dict], extracted: Dict[int, Optional[List[Dict]]]) -> Dict[str, int]:
+        """Save extracted entities and update entity_status in one bulk UPDATE.
+
+        Returns:
+            Counts of items per resulting status
+        """
+        counts = {"done": 0, "pending": 0, "failed": 0}
+        if not rows:
+            return counts
+        found = {row["id"]: extracted[row["id"]] for row in rows if extracted.get(row["id"])}
+        if found:
+            # Entities and links for the whole batch, committed with the status update
+            self.extractor.save_entities_bulk(self.db, found, commit=False)
+        now = datetime.utcnow()
+        updates = []
+        for row in rows:
+            if extracted.get(row["id"]) is not None:
+                status = "done"
+            elif row["attempts"] < self.max_attempts:
+                status = "pending"
+            else:
+                status = "failed"
+            counts[status] += 1
+            updates.append({"id": row["id"], "entity_status": status, "updated_at": now})
+        self.db.execute(update(Item), updates)
+        self.db.commit()
+        return counts
+
+    def run(self, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """Process pending items until none remain (or ``max_batches`` reached).
+
+        Items sent back to "pending" are retried on the next run, not in this one.
+
+        Returns:
+            Counts of items per resulting status
+        """
+        totals = {"done": 0, "pending": 0, "failed": 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            rows = self.claim_batch()
+            if not rows:
+                break
+            counts = self.write_results(rows, self.extract_rows(rows))
+            for status, n in counts.items():
+                totals[status] += n
+            batches += 1
+            if len(rows) < self.batch_size or counts["pending"]:
+                # Stop before reclaiming items that just failed
+                break
+        return totals
@@ -0,0 +1,156 @@
+"""Bulk persistence of extracted entities and item-entity links.
+
+``save_entities_bulk`` stores the entities of many items in a few statements:
+
+1. Names already in the process-wide name -> id LRU cache need no query.
+2. Missing names: one ``INSERT ... ON CONFLICT (name) DO NOTHING RETURNING``.
+3. Names that already existed (conflicts return no row): one ``SELECT ... IN``.
+4. All links: one multi-row ``INSERT INTO item_entities ... ON CONFLICT DO NOTHING``.
+
+A cached id whose entity row has disappeared makes the link insert fail; the
+call then clears the cache and retries once without it.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import get_settings
+from backend.app.models.entity import Entity, EntityType
+from backend.app.models.item_entity import item_entities
+
+logger = logging.getLogger(__name__)
+
+ENTITY_TYPES = {"person": EntityType.PERSON, "org": EntityType.ORGANIZATION, "tech": EntityType.TECHNOLOGY}
+
+
+class EntityIdCache:
+    """Bounded, thread-safe LRU of entity name -> id."""
+
+    def __init__(self, max_size: int = 50_000):
+        self.max_size = max(1, max_size)
+        self._data: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, names: Iterable[str]) -> Dict[str, int]:
+        found: Dict[str, int] = {}
+        with self._lock:
+            for name in names:
+                entity_id = self._data.get(name)
+                if entity_id is not None:
+                    self._data.move_to_end(name)
+                    found[name] = entity_id
+        return found
+
+    def put_many(self, mapping: Dict[str, int]) -> None:
+        with self._lock:
+            for name, entity_id in mapping.items():
+                self._data[name] = entity_id
+                self._data.move_to_end(name)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_cache: Optional[EntityIdCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_entity_id_cache() -> EntityIdCache:
+    """Return this process's entity name -> id cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EntityIdCache(get_settings().ENTITY_ID_CACHE_SIZE)
+        return _cache
+
+
+def resolve_entity_ids(db: Session, entities: Dict[str, EntityType], cache: Optional[EntityIdCache]) -> Dict[str, int]:
+    """Return ids for entity names, inserting the ones that do not exist yet."""
+    ids = cache.get_many(entities) if cache is not None else {}
+    missing = [name for name in entities if name not in ids]
+    if missing:
+        inserted = db.execute(
+            pg_insert(Entity)
+            .values([{"name": name, "type": entities[name]} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Entity.name])
+            .returning(Entity.id, Entity.name)
+        ).all()
+        ids.update({name: entity_id for entity_id, name in inserted})
+        existing = [name for name in missing if name not in ids]
+        if existing:
+            rows = db.execute(select(Entity.id, Entity.name).where(Entity.name.in_(existing))).all()
+            ids.update({name: entity_id for entity_id, name in rows})
+        if cache is not None:
+            cache.put_many({name: ids[name] for name in missing if name in ids})
+    return ids
+
+
+def save_entities_bulk(
+    db: Session,
+    entities_by_item: Dict[int, List[Dict]],
+    cache: Optional[EntityIdCache] = None,
+    commit: bool = True,
+) -> int:
+    """Upsert entities and link them to items in a constant number of statements.
+
+    Args:
+        db: Database session
+        entities_by_item: {item id: [{"name", "type"}, ...]}; unknown types are skipped
+        cache: Name -> id cache (the process cache by default)
+        commit: Commit at the end; otherwise the statements run in a savepoint
+            and a failure rolls back only that savepoint
+
+    Returns:
+        Number of (item, entity) link rows sent (existing links are skipped by the DB)
+    """
+    cache = get_entity_id_cache() if cache is None else cache
+    entities: Dict[str, EntityType] = {}
+    pairs = set()
+    for item_id, item_entities_list in entities_by_item.items():
+        for entity in item_entities_list or []:
+            name = (entity.get("name") or "").strip()
+            entity_type = ENTITY_TYPES.get((entity.get("type") or "").strip().lower())
+            if not name or entity_type is None:
+                continue
+            entities.setdefault(name, entity_type)
+            pairs.add((item_id, name))
+    if not pairs:
+        return 0
+
+    for attempt in range(2):
+        use_cache = cache if attempt == 0 else None
+        # Without commit the caller owns the transaction: fail inside a savepoint only
+        savepoint = None if commit else db.begin_nested()
+        try:
+            ids = resolve_entity_ids(db, entities, use_cache)
+            links = [{"item_id": item_id, "entity_id": ids[name]} for item_id, name in sorted(pairs) if name in ids]
+            if links:
+                db.execute(pg_insert(item_entities).values(links).on_conflict_do_nothing())
+            if savepoint is not None:
+                savepoint.commit()
+            if commit:
+                db.commit()
+            return len(links)
+        except Exception as e:
+            if savepoint is not None:
+                savepoint.rollback()
+            else:
+                db.rollback()
+            if attempt or not len(cache):
+                raise
+            logger.warning(f"[Entities] Bulk save failed with cached ids, retrying uncached: {e}")
+            cache.clear()
+    return 0
@@ -0,0 +1,136 @@
+"""Declarative per-source entry filters.
+
+A source's ``filter_config`` (JSON) decides which feed entries are kept::
+
+    {
+        "include_keywords": ["deepmind", "machine learning"],
+        "keyword_fields": ["title", "description"],
+        "category_terms": ["google deepmind"],
+        "url_patterns": ["/technology/google-deepmind/"],
+        "exclude_keywords": ["sponsored"]
+    }
+
+An entry is kept when any include rule matches (keywords as whole words in
+``keyword_fields``, category terms as substrings of a category, URL patterns
+as substrings of the link), or when no include rule is configured, and no
+exclude keyword matches. Keyword lists are compiled once into a single
+word-boundary regex, and compiled filters are cached per source until its
+filter_config changes.
+"""
+import json
+import re
+import threading
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from backend.app.models.source import Source
+
+KEYWORD_FIELDS = ("title", "description", "link", "categories")
+FILTER_KEYS = {"include_keywords", "exclude_keywords", "keyword_fields", "category_terms", "url_patterns"}
+
+_cache: Dict[int, Tuple[str, "EntryFilter"]] = {}
+_cache_lock = threading.Lock()
+
+
+def _compile_keywords(keywords: List[str]) -> Optional[Pattern]:
+    """Compile keywords into one case-insensitive regex with word boundaries."""
+    terms = sorted({k.strip().lower() for k in keywords if k and k.strip()}, key=len, reverse=True)
+    if not terms:
+        return None
+    alternation = "|".join(re.escape(t) for t in terms)
+    return re.compile(rf"(?<![a-z0-9])(?:{alternation})(?![a-z0-9])", re.IGNORECASE)
+
+
+def validate_filter_config(config: Optional[Dict]) -> None:
+    """Check a filter_config value.
+
+    Raises:
+        ValueError: If the config has unknown keys or wrongly typed values
+    """
+    if config is None:
+        return
+    if not isinstance(config, dict):
+        raise ValueError("filter_config must be an object")
+    unknown = set(config) - FILTER_KEYS
+    if unknown:
+        raise ValueError(f"Unknown filter_config keys: {sorted(unknown)}")
+    for key, value in config.items():
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ValueError(f"filter_config.{key} must be a list of strings")
+    bad_fields = set(config.get("keyword_fields", [])) - set(KEYWORD_FIELDS)
+    if bad_fields:
+        raise ValueError(f"Unknown keyword_fields: {sorted(bad_fields)}")
+
+
+class EntryFilter:
+    """Compiled entry predicate built from a source's filter_config."""
+
+    def __init__(self, config: Dict):
+        """Compile a filter config.
+
+        Args:
+            config: filter_config dictionary (see module docstring)
+
+        Raises:
+            ValueError: If the config is invalid
+        """
+        validate_filter_config(config)
+        self.include = _compile_keywords(config.get("include_keywords", []))
+        self.exclude = _compile_keywords(config.get("exclude_keywords", []))
+        self.keyword_fields = tuple(config.get("keyword_fields") or KEYWORD_FIELDS)
+        self.category_terms = tuple(t.strip().lower() for t in config.get("category_terms", []) if t.strip())
+        self.url_patterns = tuple(p.strip().lower() for p in config.get("url_patterns", []) if p.strip())
+        self.has_include_rules = bool(self.include or self.category_terms or self.url_patterns)
+
+    @staticmethod
+    def _field_values(entry: Dict, field: str) -> List[str]:
+        if field == "categories":
+            return [c for c in (entry.get("categories") or []) if c]
+        value = entry.get(field)
+        return [value] if value else []
+
+    def _search(self, pattern: Pattern, entry: Dict, fields) -> bool:
+        return any(
+            pattern.search(value)
+            for field in fields
+            for value in self._field_values(entry, field)
+        )
+
+    def __call__(self, entry: Dict) -> bool:
+        """Return True if the entry should be kept."""
+        if self.exclude is not None and self._search(self.exclude, entry, KEYWORD_FIELDS):
+            return False
+        if not self.has_include_rules:
+            return True
+        if self.category_terms:
+            for category in entry.get("categories") or []:
+                lowered = category.lower()
+                if any(term in lowered for term in self.category_terms):
+                    return True
+        if self.url_patterns:
+            link = (entry.get("link") or "").lower()
+            if any(pattern in link for pattern in self.url_patterns):
+                return True
+        return self.include is not None and self._search(self.include, entry, self.keyword_fields)
+
+
+def get_entry_filter(source: Source) -> Optional[EntryFilter]:
+    """Return the compiled filter for a source, or None to keep every entry.
+
+    Compiled filters are cached per source id and recompiled when the
+    source's filter_config changes (``updated_at`` moves on every poll, so
+    the config itself is the cache key).
+    """
+    config = source.filter_config
+    if not config:
+        return None
+    if source.id is None:
+        return EntryFilter(config)
+    version = json.dumps(config, sort_keys=True)
+    with _cache_lock:
+        cached = _cache.get(source.id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    compiled = EntryFilter(config)
+    with _cache_lock:
+        _cache[source.id] = (version, compiled)
+    return compiled
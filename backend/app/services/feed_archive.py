@@ -0,0 +1,172 @@
+"""Content-addressed on-disk archive of fetched feed bodies.
+
+Layout under the archive root::
+
+    blobs/ab/abcdef....xml.gz   gzip-compressed body, named by SHA-256 of the raw bytes
+    index/<source_id>.jsonl     one line per fetch: fetched_at, sha256, status, validators
+
+Identical bodies are stored once. The index records every fetch in time
+order, so collection can be replayed offline (see RSSCollector.replay_archive)
+for reproducible benchmarks or to rebuild a database without re-hitting
+publishers.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+class FeedArchive:
+    """Store and replay raw feed bodies keyed by source and fetch time."""
+
+    def __init__(self, root: str, compresslevel: int = 6):
+        """Initialize the archive.
+
+        Args:
+            root: Archive directory (created on first write)
+            compresslevel: gzip compression level for blobs
+        """
+        self.root = Path(root)
+        self.compresslevel = compresslevel
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}.xml.gz"
+
+    def _index_path(self, source_id: int) -> Path:
+        return self.root / "index" / f"{source_id}.jsonl"
+
+    def store(
+        self,
+        source_id: int,
+        content: bytes,
+        fetched_at: Optional[datetime] = None,
+        url: Optional[str] = None,
+        status: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> str:
+        """Archive one fetched body and append it to the source's index.
+
+        Args:
+            source_id: Source the body was fetched for
+            content: Raw response body
+            fetched_at: Fetch time (naive UTC), defaults to utcnow
+            url: Fetched URL
+            status: HTTP status
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            SHA-256 hex digest of the body
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial blobs
+            fd, tmp = tempfile.mkstemp(dir=blob.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(gzip.compress(content, compresslevel=self.compresslevel))
+                os.replace(tmp, blob)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+
+        record = {
+            "source_id": source_id,
+            "fetched_at": (fetched_at or datetime.utcnow()).isoformat(),
+            "sha256": digest,
+            "bytes": len(content),
+            "url": url,
+            "status": status,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        index = self._index_path(source_id)
+        index.parent.mkdir(parents=True, exist_ok=True)
+        with open(index, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        return digest
+
+    def load(self, digest: str) -> bytes:
+        """Return the raw body for a digest.
+
+        Raises:
+            FileNotFoundError: If the blob is not in the archive
+        """
+        with gzip.open(self._blob_path(digest), "rb") as f:
+            return f.read()
+
+    def source_ids(self) -> List[int]:
+        """Return IDs of sources with archived fetches."""
+        index_dir = self.root / "index"
+        if not index_dir.exists():
+            return []
+        return sorted(int(p.stem) for p in index_dir.glob("*.jsonl") if p.stem.isdigit())
+
+    def records(
+        self,
+        source_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict]:
+        """Return index records for a source in fetch-time order.
+
+        Args:
+            source_id: Source ID
+            since: Only fetches at or after this time (naive UTC)
+            until: Only fetches before this time (naive UTC)
+
+        Returns:
+            List of record dicts with fetched_at parsed to datetime
+        """
+        index = self._index_path(source_id)
+        if not index.exists():
+            return []
+        records = []
+        with open(index, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                record["fetched_at"] = datetime.fromisoformat(record["fetched_at"])
+                if since is not None and record["fetched_at"] < since:
+                    continue
+                if until is not None and record["fetched_at"] >= until:
+                    continue
+                records.append(record)
+        records.sort(key=lambda r: r["fetched_at"])
+        return records
+
+    def iter_fetches(
+        self,
+        source_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[Dict]:
+        """Yield archived fetches as FeedFetcher-style result dicts.
+
+        Yields:
+            Dictionaries with url, status, content, etag, last_modified,
+            elapsed_ms (None), error (None) and fetched_at
+        """
+        for record in self.records(source_id, since=since, until=until):
+            yield {
+                "url": record.get("url"),
+                "status": record.get("status") or 200,
+                "content": self.load(record["sha256"]),
+                "etag": record.get("etag"),
+                "last_modified": record.get("last_modified"),
+                "elapsed_ms": None,
+                "error": None,
+                "fetched_at": record["fetched_at"],
+            }
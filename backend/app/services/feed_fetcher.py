@@ -0,0 +1,150 @@
+"""Async HTTP fetch layer for RSS/Atom feeds.
+
+One shared httpx.AsyncClient (keep-alive connection pool) serves every source
+in a collection cycle. Per-host semaphores cap concurrent requests to the same
+publisher, and the raw bytes are handed to the parser without a second round trip.
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+FEED_REQUEST_HEADERS = {
+    "User-Agent": "ai-trend-bot/1.0 (+https://example.com)",
+    "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+}
+
+
+class FeedFetcher:
+    """Pooled async feed fetcher with per-host concurrency limits.
+
+    Usage:
+        async with FeedFetcher() as fetcher:
+            results = await fetcher.fetch_many([{"url": ..., "etag": ...}, ...])
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        per_host_limit: int = 4,
+        timeout: float = 15.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Configure the fetcher.
+
+        Args:
+            max_connections: Size of the shared connection pool
+            per_host_limit: Maximum concurrent requests per host
+            timeout: Request timeout in seconds
+            transport: Optional httpx transport (used by tests)
+        """
+        self.max_connections = max_connections
+        self.per_host_limit = max(1, per_host_limit)
+        self.timeout = timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "FeedFetcher":
+        self._client = httpx.AsyncClient(
+            headers=FEED_REQUEST_HEADERS,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            timeout=httpx.Timeout(self.timeout),
+            follow_redirects=True,
+            transport=self._transport,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = (urlsplit(url).hostname or "").lower()
+        sem = self._host_limits.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host_limit)
+            self._host_limits[host] = sem
+        return sem
+
+    async def fetch(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Dict:
+        """Fetch a single feed, sending conditional GET headers when available.
+
+        Never raises; transport failures are reported in the ``error`` key.
+
+        Args:
+            url: Feed URL
+            etag: ETag validator from the previous fetch
+            last_modified: Last-Modified validator from the previous fetch
+
+        Returns:
+            Dictionary with url, status, content (bytes or None), etag,
+            last_modified, elapsed_ms and error (None on success or 304)
+        """
+        if self._client is None:
+            raise RuntimeError("FeedFetcher must be used as an async context manager")
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        result: Dict = {
+            "url": url,
+            "status": None,
+            "content": None,
+            "etag": None,
+            "last_modified": None,
+            "elapsed_ms": 0.0,
+            "error": None,
+        }
+        started = time.perf_counter()
+        try:
+            async with self._host_semaphore(url):
+                resp = await self._client.get(url, headers=headers)
+            result["status"] = resp.status_code
+            result["etag"] = resp.headers.get("etag")
+            result["last_modified"] = resp.headers.get("last-modified")
+            if resp.status_code == 304:
+                pass
+            elif resp.is_success:
+                result["content"] = resp.content
+            else:
+                result["error"] = f"HTTP {resp.status_code}"
+        except httpx.HTTPError as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            result["elapsed_ms"] = (time.perf_counter() - started) * 1000.0
+        return result
+
+    async def fetch_many(self, requests: List[Dict]) -> List[Dict]:
+        """Fetch many feeds concurrently from one event loop.
+
+        Args:
+            requests: Dictionaries with url and optional etag / last_modified
+
+        Returns:
+            Fetch results in the same order as ``requests``
+        """
+        return await asyncio.gather(
+            *[
+                self.fetch(r["url"], etag=r.get("etag"), last_modified=r.get("last_modified"))
+                for r in requests
+            ]
+        )
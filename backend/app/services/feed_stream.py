@@ -0,0 +1,161 @@
+"""Streaming RSS/Atom entry parser built on lxml iterparse.
+
+Entries are yielded lazily in document order (newest-first for most feeds),
+so callers can stop as soon as they reach entries they already have.
+Supports RSS 2.0, RSS 1.0 (RDF) and Atom. Malformed XML raises
+``lxml.etree.XMLSyntaxError``; callers fall back to feedparser.
+
+Descriptions go through feedparser's HTML sanitizer, so both parsers store
+the same markup.
+"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Dict, Iterator, List, Optional
+
+from feedparser.sanitizer import _sanitize_html
+from lxml import etree
+
+ENTRY_TAGS = {"item", "entry"}
+
+
+def _local(tag) -> str:
+    """Return the namespace-free tag name ('' for comments/PIs)."""
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(el) -> str:
+    return "".join(el.itertext()).strip() if el is not None else ""
+
+
+def _sanitize(markup: str) -> str:
+    """Sanitize HTML the way feedparser does for entry descriptions (plain text unchanged)."""
+    if "<" not in markup:
+        return markup
+    return _sanitize_html(markup, "utf-8", "text/html").strip()
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    """Parse RFC 822 (RSS) or ISO 8601 (Atom/dc:date) timestamps to UTC."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            from dateutil import parser as date_parser
+
+            dt = date_parser.isoparse(value)
+        except (ValueError, OverflowError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _entry_from_element(el) -> Dict:
+    """Build an entry dict (same keys as RSSCollector.parse_feed) from <item>/<entry>."""
+    children: Dict[str, List] = {}
+    for child in el:
+        children.setdefault(_local(child.tag), []).append(child)
+
+    def first(*names: str):
+        for name in names:
+            if children.get(name):
+                return children[name][0]
+        return None
+
+    # Link: RSS <link>text</link>, Atom <link rel="alternate" href="..."/>
+    link = ""
+    for link_el in children.get("link", []):
+        href = link_el.get("href")
+        if href is None:
+            link = _text(link_el)
+        elif link_el.get("rel", "alternate") == "alternate":
+            link = href.strip()
+        if link:
+            break
+    # FeedBurner keeps the publisher URL in feedburner:origLink
+    orig_link = _text(first("origLink"))
+    if orig_link:
+        link = orig_link
+    guid = _text(first("guid", "id"))
+    if not link and guid.startswith(("http://", "https://")):
+        link = guid
+
+    author_el = first("author", "creator")
+    author = None
+    if author_el is not None:
+        name_el = next((c for c in author_el if _local(c.tag) == "name"), None)
+        author = _text(name_el if name_el is not None else author_el) or None
+
+    description = _sanitize(_text(first("description", "summary", "encoded", "content")))
+
+    categories: List[str] = []
+    for cat in children.get("category", []):
+        term = cat.get("term") or _text(cat)
+        if term:
+            categories.append(term)
+
+    thumbnail_url = None
+    thumb = first("thumbnail")
+    if thumb is not None and thumb.get("url"):
+        thumbnail_url = thumb.get("url")
+    if not thumbnail_url:
+        for media in children.get("enclosure", []) + children.get("content", []):
+            if (media.get("type") or "").startswith("image/"):
+                thumbnail_url = media.get("url") or media.get("href")
+                if thumbnail_url:
+                    break
+
+    published_at = _parse_datetime(_text(first("pubDate", "published", "date", "updated", "issued")))
+
+    return {
+        "title": _text(first("title")),
+        "link": link,
+        "guid": guid or link,
+        "published_at": published_at or datetime.now(timezone.utc),
+        "author": author,
+        "description": description,
+        "thumbnail_url": thumbnail_url,
+        "categories": categories,
+    }
+
+
+def iter_feed_entries(content: bytes) -> Iterator[Dict]:
+    """Yield feed entries lazily from raw feed bytes.
+
+    Processed elements are cleared as the parser advances, so memory stays
+    flat and stopping early skips the rest of the document entirely.
+
+    Args:
+        content: Raw RSS/Atom bytes
+
+    Yields:
+        Entry dictionaries with title, link, guid, published_at, author,
+        description, thumbnail_url, categories
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the document is not well-formed XML
+    """
+    context = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=True,
+    )
+    for _, el in context:
+        if _local(el.tag) not in ENTRY_TAGS:
+            continue
+        entry = _entry_from_element(el)
+        # Free the processed subtree and earlier siblings
+        el.clear()
+        parent = el.getparent()
+        if parent is not None:
+            while el.getprevious() is not None:
+                del parent[0]
+        yield entry
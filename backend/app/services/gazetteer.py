@@ -0,0 +1,170 @@
+"""Local gazetteer tagger: known entity names matched in one pass, no network.
+
+All names we already know are compiled into a single KeywordMatcher (token
+n-gram table, case-folded, hyphen/space-insensitive):
+
+- ``entities``: every stored name with its type
+- ``persons``: tracked people (type "person")
+- ``watch_rules`` of a person: keywords whose tokens all appear in the
+  person's name ("LeCun" for "Yann LeCun") become aliases of that person.
+  Other rule keywords ("JEPA", "Meta") carry no type and are only tagged when
+  they are stored entities themselves.
+
+RSSCollector tags new items right after inserting them and links the hits via
+``item_entities`` in the same transaction. Only items with low coverage (fewer
+than ``GAZETTEER_MIN_ENTITIES`` hits), plus a deterministic
+``GAZETTEER_LLM_SAMPLE_RATE`` sample of the rest for discovering new names,
+stay entity_status="pending" for the LLM EntityStage; the others are "done".
+
+The table is rebuilt from the DB periodically, so names the LLM discovers are
+matched locally from the next rebuild on.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import get_settings
+from backend.app.models.entity import Entity
+from backend.app.models.person import Person
+from backend.app.models.watch_rule import WatchRule
+from backend.app.services.keyword_matcher import KeywordMatcher, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Single-character names ("X", "R") match far too much prose
+_MIN_NAME_CHARS = 2
+# Longer names are almost never written verbatim and would widen every lookup
+_MAX_NAME_TOKENS = 6
+
+
+def _usable(name: str) -> bool:
+    tokens = tokenize(name)
+    return bool(tokens) and len(tokens) <= _MAX_NAME_TOKENS and len("".join(tokens)) >= _MIN_NAME_CHARS
+
+
+class Gazetteer:
+    """Known entity names (and aliases) compiled into one matcher."""
+
+    def __init__(self, names: Sequence[Tuple[str, str, Sequence[str]]]):
+        """Compile names.
+
+        Args:
+            names: (canonical name, type, aliases) tuples, type being
+                "person", "org" or "tech". The first canonical name wins when
+                two differ only in case/punctuation.
+        """
+        self.types: Dict[str, str] = {}
+        categories: Dict[str, List[str]] = {}
+        seen: Dict[Tuple[str, ...], str] = {}
+        for name, entity_type, aliases in names:
+            key = tuple(tokenize(name))
+            canonical = seen.setdefault(key, name) if key else name
+            if canonical not in categories:
+                if not _usable(name):
+                    continue
+                categories[canonical] = [name]
+                self.types[canonical] = entity_type
+            categories[canonical].extend(a for a in aliases if _usable(a))
+        self._matcher = KeywordMatcher(categories, fold_inflections=False)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def tag(self, text: str) -> List[Dict]:
+        """Known entities mentioned in a text, as [{"name", "type"}] in definition order."""
+        return [{"name": name, "type": self.types[name]} for name in self._matcher.hit_categories(text)]
+
+    def tag_many(self, texts: Sequence[str]) -> List[List[Dict]]:
+        return [self.tag(text) for text in texts]
+
+    @classmethod
+    def from_db(cls, db: Session) -> "Gazetteer":
+        """Build from entities, persons and person-linked watch rules."""
+        aliases: Dict[str, List[str]] = {}
+        person_names = dict(db.query(Person.id, Person.name).all())
+        for rule in db.query(WatchRule).filter(WatchRule.person_id != None).all():  # noqa: E711
+            person = person_names.get(rule.person_id)
+            if not person:
+                continue
+            name_tokens = set(tokenize(person))
+            for keyword in (rule.include_rules or []) + (rule.required_keywords or []) + (rule.optional_keywords or []):
+                tokens = tokenize(keyword)
+                if tokens and set(tokens) <= name_tokens:
+                    aliases.setdefault(person, []).append(keyword)
+
+        names: List[Tuple[str, str, Sequence[str]]] = []
+        for name, entity_type in db.query(Entity.name, Entity.type).order_by(Entity.id).all():
+            value = entity_type.value if hasattr(entity_type, "value") else str(entity_type)
+            names.append((name, value, aliases.pop(name, [])))
+        for person in person_names.values():
+            names.append((person, "person", aliases.pop(person, [])))
+        return cls(names)
+
+
+class GazetteerIndex:
+    """Process-wide Gazetteer with periodic rebuilds."""
+
+    def __init__(self, rebuild_minutes: float):
+        self.rebuild_seconds = rebuild_minutes * 60
+        self._gazetteer: Optional[Gazetteer] = None
+        self._built_at = 0.0
+        self._rebuild_lock = threading.Lock()
+
+    @property
+    def gazetteer(self) -> Optional[Gazetteer]:
+        return self._gazetteer
+
+    def is_stale(self) -> bool:
+        return self._gazetteer is None or time.monotonic() - self._built_at > self.rebuild_seconds
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Rebuild from the DB when stale; concurrent callers don't wait for it."""
+        if not self.is_stale() or not self._rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            if self.is_stale():
+                self.rebuild(db)
+        finally:
+            self._rebuild_lock.release()
+
+    def rebuild(self, db: Session) -> None:
+        started = time.perf_counter()
+        gazetteer = Gazetteer.from_db(db)
+        self._gazetteer = gazetteer
+        self._built_at = time.monotonic()
+        logger.info(
+            f"[Entities] Gazetteer rebuilt: {len(gazetteer)} names, "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+
+
+_index: Optional[GazetteerIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_gazetteer_index() -> Optional[GazetteerIndex]:
+    """Return this process's GazetteerIndex, or None when disabled."""
+    global _index
+    settings = get_settings()
+    if not settings.GAZETTEER_ENABLED:
+        return None
+    with _index_lock:
+        if _index is None:
+            _index = GazetteerIndex(rebuild_minutes=settings.GAZETTEER_REBUILD_MINUTES)
+        return _index
+
+
+def needs_llm(entities: Sequence[Dict], link_hash: int, min_entities: int, sample_rate: float) -> bool:
+    """Whether an item should still go through LLM extraction.
+
+    True for low gazetteer coverage, and for a deterministic ``sample_rate``
+    share of the rest (by link hash) so new names keep being discovered.
+    """
+    if len(entities) < min_entities:
+        return True
+    return (link_hash or 0) % 10000 < sample_rate * 10000
@@ -2,11 +2,14 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone, date
 from typing import Optional, List
 
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
+from backend.app.core.config import get_settings
 from backend.app.models.item import Item
 from backend.app.models.dup_group_meta import DupGroupMeta
 from backend.app.services.deduplicator import Deduplicator
+from backend.app.services.minhash_lsh import build_from_db, get_minhash_index, save_minhash_index
 
 
 class GroupBackfill:
@@ -46,7 +49,16 @@ class GroupBackfill:
         # This reduces DB queries in Deduplicator
         all_items_lookup = {it.id: it for it in items}
         
-        d = Deduplicator(self.db, similarity_threshold=0.2, lookback_days=days, verbose=verbose)
+        # Dedicated LSH index over the window and its lookback (None = brute-force scan)
+        settings = get_settings()
+        lsh = (
+            build_from_db(self.db, start_dt - timedelta(days=days), settings.DEDUP_LSH_BANDS, settings.DEDUP_LSH_ROWS)
+            if settings.DEDUP_LSH_ENABLED
+            else None
+        )
+        d = Deduplicator(self.db, similarity_threshold=0.2, lookback_days=days, verbose=verbose, lsh=lsh)
+        # Vectorize the whole window once; every item's candidates are scored against it
+        d.fit_window(items)
         processed = 0
         
         for idx, it in enumerate(items, 1):
@@ -62,19 +74,52 @@ class GroupBackfill:
         return processed
 
     def run_incremental(self, since_dt: datetime) -> int:
-        """Process items published after since_dt (incremental)."""
+        """Process items published after since_dt (incremental).
+
+        Also regroups older items whose content changed since since_dt
+        (collection clears their dup_group_id when it refreshes them).
+        """
+        since_naive = since_dt.astimezone(timezone.utc).replace(tzinfo=None) if since_dt.tzinfo else since_dt
         items: List[Item] = (
             self.db.query(Item)
             .filter(Item.published_at != None)  # noqa: E711
-            .filter(Item.published_at > since_dt)
+            .filter(
+                or_(
+                    Item.published_at > since_dt,
+                    and_(Item.dup_group_id == None, Item.updated_at > since_naive),  # noqa: E711
+                )
+            )
             .order_by(Item.published_at.asc())
             .all()
         )
-        d = Deduplicator(self.db, similarity_threshold=0.2, lookback_days=21)
+        d = Deduplicator(self.db, similarity_threshold=0.2, lookback_days=21, lsh=get_minhash_index(self.db))
         processed = 0
         for it in items:
             d.process_new_item(it)
             processed += 1
+        save_minhash_index()
         return processed
 
-
+    def run_items(self, item_ids: List[int], lookback_days: int = 21) -> int:
+        """Group the given items in published order (e.g. items from an archive replay)."""
+        if not item_ids:
+            return 0
+        items: List[Item] = (
+            self.db.query(Item)
+            .filter(Item.id.in_(item_ids))
+            .filter(Item.published_at != None)  # noqa: E711
+            .order_by(Item.published_at.asc())
+            .all()
+        )
+        # Replayed items can be older than the process index horizon: index their own window
+        settings = get_settings()
+        lsh = None
+        if settings.DEDUP_LSH_ENABLED and items:
+            since = items[0].published_at - timedelta(days=lookback_days)
+            lsh = build_from_db(self.db, since, settings.DEDUP_LSH_BANDS, settings.DEDUP_LSH_ROWS)
+        d = Deduplicator(self.db, similarity_threshold=0.2, lookback_days=lookback_days, lsh=lsh)
+        processed = 0
+        for it in items:
+            d.process_new_item(it)
+            processed += 1
+        return processed
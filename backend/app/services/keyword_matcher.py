@@ -0,0 +1,127 @@
+"""Precompiled keyword matcher for category inference.
+
+Keywords are grouped by category (field, custom tag, event type, ...) and
+compiled once into a table of token n-grams. Matching tokenizes the text once
+and looks up every n-gram up to the longest keyword, so all hits for all
+categories come out of a single pass, in O(tokens × max keyword length)
+regardless of how many keywords there are.
+
+Matching is on whole tokens (``[a-z0-9]+``), so "ml" no longer matches inside
+"html" and "eu" not inside "europe". Hyphens and spaces are equivalent
+("tool-use" == "tool use"). Common inflections of the last keyword token are
+folded in at compile time: plurals for every keyword, plus -ed/-d/-ing/-er
+forms for keywords whose last token has at least 4 letters ("launch" matches
+"launched", "hire" matches "hired").
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Last tokens shorter than this only get plural forms ("ai" -> "ais", not "aid")
+_MIN_INFLECT_LEN = 4
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of a text."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _inflections(token: str) -> Set[str]:
+    forms = {token, token + "s", token + "es"}
+    if token.endswith("y"):
+        forms.update({token[:-1] + "ies", token[:-1] + "ied"})
+    if len(token) >= _MIN_INFLECT_LEN:
+        forms.update({token + "ed", token + "d", token + "ing", token + "er", token + "ers"})
+        if token.endswith("e"):
+            forms.update({token[:-1] + "ing", token[:-1] + "er"})
+    return forms
+
+
+class KeywordMatcher:
+    """Match many keyword categories against text in one tokenized pass."""
+
+    def __init__(self, categories: Dict[str, Iterable[str]], fold_inflections: bool = True):
+        """Compile keyword lists.
+
+        Args:
+            categories: Category name -> keywords (phrases allowed)
+            fold_inflections: Also match plural/-ed/-ing forms of each keyword
+        """
+        self.categories: List[str] = list(categories)
+        self._index = {name: i for i, name in enumerate(self.categories)}
+        # n-gram tuple -> [(category index, canonical keyword)]
+        self._table: Dict[Tuple[str, ...], List[Tuple[int, str]]] = {}
+        self.max_ngram = 1
+        for name, keywords in categories.items():
+            cat = self._index[name]
+            for keyword in keywords:
+                tokens = tokenize(keyword)
+                if not tokens:
+                    continue
+                canonical = " ".join(tokens)
+                lasts = _inflections(tokens[-1]) if fold_inflections else {tokens[-1]}
+                for last in lasts:
+                    entry = self._table.setdefault(tuple(tokens[:-1]) + (last,), [])
+                    if (cat, canonical) not in entry:
+                        entry.append((cat, canonical))
+                self.max_ngram = max(self.max_ngram, len(tokens))
+
+    def _hits(self, tokens: Sequence[str]) -> Iterable[Tuple[int, str]]:
+        table = self._table
+        for i in range(len(tokens)):
+            for n in range(1, min(self.max_ngram, len(tokens) - i) + 1):
+                found = table.get(tuple(tokens[i : i + n]))
+                if found:
+                    yield from found
+
+    def match(self, text: str) -> Dict[str, Set[str]]:
+        """Return {category: set of matched keywords} for categories with hits."""
+        out: Dict[str, Set[str]] = {}
+        for cat, keyword in self._hits(tokenize(text)):
+            out.setdefault(self.categories[cat], set()).add(keyword)
+        return out
+
+    def scores(self, text: str) -> Dict[str, int]:
+        """Return {category: number of distinct keywords hit} for categories with hits."""
+        return {name: len(hits) for name, hits in self.match(text).items()}
+
+    def hit_categories(self, text: str) -> List[str]:
+        """Return the categories with any hit, in definition order."""
+        hit = {cat for cat, _ in self._hits(tokenize(text))}
+        return [self.categories[i] for i in sorted(hit)]
+
+    def first_match(self, text: str) -> str | None:
+        """Return the first category (in definition order) with any hit, or None."""
+        hit = {cat for cat, _ in self._hits(tokenize(text))}
+        return next((self.categories[i] for i in sorted(hit)), None)
+
+    def batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Score many texts at once.
+
+        Returns:
+            int32 array of shape (len(texts), len(categories)) with the number of
+            distinct keywords of each category found in each text
+        """
+        counts = np.zeros((len(texts), len(self.categories)), dtype=np.int32)
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, text in enumerate(texts):
+            seen = set(self._hits(tokenize(text)))
+            rows.extend(row for _ in seen)
+            cols.extend(cat for cat, _ in seen)
+        if rows:
+            np.add.at(counts, (np.asarray(rows), np.asarray(cols)), 1)
+        return counts
+
+    def best_categories(self, texts: Sequence[str], default: str | None = None) -> List[str | None]:
+        """Highest-scoring category per text (ties -> definition order), or ``default``."""
+        counts = self.batch(texts)
+        if not len(texts):
+            return []
+        best = counts.argmax(axis=1)
+        has_hit = counts.max(axis=1) > 0
+        return [self.categories[b] if hit else default for b, hit in zip(best, has_hit)]
@@ -0,0 +1,201 @@
+"""Process-wide Bloom filter of known item link hashes.
+
+Ingestion asks the filter before hitting the DB: a link whose hash is
+definitely absent is new and skips the existing-link lookup; only "maybe
+seen" links fall through to the indexed ``items.link_hash`` query.
+
+A negative is only trusted because the filter covers every stored row:
+
+- Rebuilds (periodic, or when it outgrows its capacity) load every
+  ``link_hash`` and hash the links of legacy rows whose ``link_hash`` is NULL.
+- Before each collection, ``ensure_fresh`` catches up on rows any process
+  inserted since the last sync (``id`` above the synced high-water mark).
+- Collectors add what they insert right after their commit.
+
+Only an insert by another worker between the catch-up and our own insert
+can be missed; ON CONFLICT (link_hash) still keeps such rows out and the
+entry's change detection runs on the next poll. False positives only cost a
+DB lookup.
+"""
+import logging
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import get_settings
+from backend.app.core.link_utils import link_hash
+from backend.app.models.item import Item
+
+logger = logging.getLogger(__name__)
+
+_MASK64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over signed 64-bit hashes (double hashing)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """Size the filter for ``capacity`` items at ``error_rate`` false positives."""
+        capacity = max(int(capacity), 1)
+        self.num_bits = max(64, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.capacity = capacity
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, value: int):
+        value &= _MASK64
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, value: int) -> None:
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= np.uint8(1 << (pos & 7))
+        self.count += 1
+
+    def add_many(self, values: Iterable[int]) -> None:
+        """Vectorized add for bulk loads."""
+        arr = np.fromiter((v & _MASK64 for v in values), dtype=np.uint64)
+        if arr.size == 0:
+            return
+        h1 = arr & np.uint64(0xFFFFFFFF)
+        h2 = (arr >> np.uint64(32)) | np.uint64(1)
+        m = np.uint64(self.num_bits)
+        for i in range(self.num_hashes):
+            pos = (h1 + np.uint64(i) * h2) % m
+            np.bitwise_or.at(self.bits, (pos >> np.uint64(3)).astype(np.int64),
+                             np.left_shift(np.uint8(1), (pos & np.uint64(7)).astype(np.uint8)))
+        self.count += int(arr.size)
+
+    def __contains__(self, value: int) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class KnownLinkIndex:
+    """Bloom filter of ``items.link_hash`` with periodic rebuilds."""
+
+    def __init__(self, capacity: int, error_rate: float, rebuild_minutes: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_minutes * 60
+        self._filter: Optional[BloomFilter] = None
+        self._built_at = 0.0
+        # Highest item id loaded into the filter (catch-up point)
+        self._max_id = 0
+        # Ids above _max_id this process already added (catch-up skips them;
+        # ids are not committed in order, so _max_id cannot jump past them)
+        self._added_ids: Set[int] = set()
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    def is_stale(self) -> bool:
+        f = self._filter
+        return f is None or time.monotonic() - self._built_at > self.rebuild_seconds or f.count > f.capacity
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Rebuild from the DB when stale, otherwise load rows inserted since the last sync.
+
+        Concurrent callers don't wait for a rebuild or catch-up in progress.
+        """
+        if not self._rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            if self.is_stale():
+                self.rebuild(db)
+            else:
+                self.catch_up(db)
+        finally:
+            self._rebuild_lock.release()
+
+    @staticmethod
+    def _row_hashes(rows) -> list:
+        # Legacy rows without link_hash are covered by the hash of their link
+        return [row.link_hash if row.link_hash is not None else link_hash(row.link) for row in rows]
+
+    def catch_up(self, db: Session) -> int:
+        """Add rows inserted (by any process) since the last rebuild or catch-up."""
+        rows = db.query(Item.id, Item.link_hash, Item.link).filter(Item.id > self._max_id).all()
+        if not rows:
+            return 0
+        with self._lock:
+            new_rows = [row for row in rows if row.id not in self._added_ids]
+            if self._filter is not None:
+                self._filter.add_many(self._row_hashes(new_rows))
+            self._max_id = max(self._max_id, max(row.id for row in rows))
+            self._added_ids = {i for i in self._added_ids if i > self._max_id}
+        return len(new_rows)
+
+    def rebuild(self, db: Session) -> None:
+        """Load every stored link hash into a new filter and swap it in."""
+        started = time.perf_counter()
+        total = db.query(Item.id).count()
+        bloom = BloomFilter(max(self.capacity, total * 2), self.error_rate)
+        max_id = 0
+        batch = []
+        for row in db.query(Item.id, Item.link_hash, Item.link).yield_per(50000):
+            batch.append(row)
+            if len(batch) >= 50000:
+                bloom.add_many(self._row_hashes(batch))
+                max_id = max(max_id, max(r.id for r in batch))
+                batch = []
+        if batch:
+            bloom.add_many(self._row_hashes(batch))
+            max_id = max(max_id, max(r.id for r in batch))
+        with self._lock:
+            self._filter = bloom
+            self._built_at = time.monotonic()
+            self._max_id = max_id
+            # Inserts recorded meanwhile went to the old filter: catch-up re-adds them
+            self._added_ids = set()
+        logger.info(
+            f"[RSS] Link Bloom filter rebuilt: {bloom.count} hashes, "
+            f"{bloom.num_bits // 8 // 1024} KiB, {(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+
+    def might_contain(self, value: int) -> bool:
+        """False only when the hash is definitely not stored (True before the first build)."""
+        f = self._filter
+        return True if f is None else value in f
+
+    def add_inserted(self, inserted: Dict[int, int]) -> None:
+        """Record rows this process just inserted.
+
+        Args:
+            inserted: {link_hash: item id} from RSSCollector.bulk_insert_items
+        """
+        if not inserted:
+            return
+        with self._lock:
+            if self._filter is None:
+                return
+            self._filter.add_many(inserted.keys())
+            self._added_ids.update(i for i in inserted.values() if i > self._max_id)
+
+
+_index: Optional[KnownLinkIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_known_link_index() -> Optional[KnownLinkIndex]:
+    """Return this process's KnownLinkIndex, or None when disabled."""
+    global _index
+    settings = get_settings()
+    if not settings.RSS_LINK_BLOOM_ENABLED:
+        return None
+    with _index_lock:
+        if _index is None:
+            _index = KnownLinkIndex(
+                capacity=settings.RSS_LINK_BLOOM_CAPACITY,
+                error_rate=settings.RSS_LINK_BLOOM_ERROR_RATE,
+                rebuild_minutes=settings.RSS_LINK_BLOOM_REBUILD_MINUTES,
+            )
+        return _index
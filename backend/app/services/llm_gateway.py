@@ -0,0 +1,316 @@
+"""Process-wide gateway for OpenAI chat completions.
+
+Every LLM user (classifier, entity extractor, backfill scripts) goes through
+one gateway per process instead of building its own client:
+
+- One pooled ``AsyncOpenAI`` client running on a background event loop thread.
+- Request-per-minute and token-per-minute token buckets shared by all callers.
+  Token cost is estimated from prompt length + ``max_tokens`` before the call
+  and corrected from ``usage.total_tokens`` afterwards.
+- Priority lanes: waiting "live" requests (ingestion) are admitted before
+  "backfill" requests (scripts, reprocessing).
+- A global concurrency cap.
+- Retries with jittered exponential backoff for 429/5xx/connection errors; a
+  429 pauses admission for everyone until its Retry-After has passed.
+
+Synchronous code gets a drop-in client through ``client(priority)``, which
+exposes ``chat.completions.create(**kwargs)`` and blocks until the response
+is ready. Non-retryable errors (bad request, unknown model) are raised to the
+caller unchanged.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+from backend.app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = {"live": 0, "backfill": 1}
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+# Rough chars-per-token ratio for pre-call token estimates
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(kwargs: Dict) -> int:
+    """Estimate the token cost of a chat completion request."""
+    chars = sum(len(str(m.get("content") or "")) for m in kwargs.get("messages") or [])
+    return chars // CHARS_PER_TOKEN + int(kwargs.get("max_tokens") or kwargs.get("max_completion_tokens") or 256)
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    return getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    try:
+        from openai import APIConnectionError, APITimeoutError
+
+        if isinstance(exc, (APIConnectionError, APITimeoutError)):
+            return True
+    except ImportError:  # pragma: no cover - openai is a hard dependency in production
+        pass
+    return _status_code(exc) in RETRYABLE_STATUS
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``per_minute`` / 60 per second."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(max(per_minute, 1))
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """Charge (positive) or refund (negative) tokens after the fact."""
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class LLMGateway:
+    """Shared, rate-limited, prioritized access to chat completions."""
+
+    def __init__(
+        self,
+        client=None,
+        rpm: int = 500,
+        tpm: int = 200_000,
+        max_concurrency: int = 8,
+        max_retries: int = 4,
+        retry_base_seconds: float = 1.0,
+        retry_max_seconds: float = 30.0,
+    ):
+        """Start the gateway loop.
+
+        Args:
+            client: AsyncOpenAI-compatible client (created from settings when None)
+            rpm: Requests per minute
+            tpm: Tokens per minute
+            max_concurrency: Requests in flight at once
+            max_retries: Retries per request for retryable errors
+            retry_base_seconds: First backoff step
+            retry_max_seconds: Backoff cap
+        """
+        self._client = client
+        self.requests_bucket = TokenBucket(rpm)
+        self.tokens_bucket = TokenBucket(tpm)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.stats_counters = {"requests": 0, "retries": 0, "errors": 0, "rate_limited": 0, "tokens": 0}
+
+        self._waiters: list = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._wake_handle = None
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-gateway", daemon=True)
+        self._thread.start()
+
+    # -------- Client --------
+    def _get_client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            settings = get_settings()
+            # Retries are handled here so they respect the shared limits
+            self._client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                max_retries=0,
+                timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+            )
+        return self._client
+
+    def client(self, priority: str = "live") -> "GatewayClient":
+        """Return a synchronous OpenAI-style client bound to a priority lane."""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown LLM priority: {priority}")
+        return GatewayClient(self, priority)
+
+    # -------- Admission (runs on the gateway loop) --------
+    def _dispatch(self) -> None:
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+        while self._waiters:
+            _, _, tokens, fut = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._in_flight >= self.max_concurrency:
+                return
+            now = time.monotonic()
+            delay = max(
+                self._paused_until - now,
+                self.requests_bucket.wait_time(1, now),
+                self.tokens_bucket.wait_time(tokens, now),
+            )
+            if delay > 0:
+                self._wake_handle = self._loop.call_later(delay, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            self.requests_bucket.take(1)
+            self.tokens_bucket.take(tokens)
+            self._in_flight += 1
+            fut.set_result(None)
+
+    async def _acquire(self, priority: str, tokens: int) -> None:
+        fut = self._loop.create_future()
+        heapq.heappush(self._waiters, (PRIORITIES[priority], next(self._seq), tokens, fut))
+        self._dispatch()
+        await fut
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._dispatch()
+
+    # -------- Requests --------
+    async def _create(self, priority: str, kwargs: Dict):
+        estimate = estimate_tokens(kwargs)
+        attempt = 0
+        while True:
+            await self._acquire(priority, estimate)
+            delay = None
+            try:
+                self.stats_counters["requests"] += 1
+                response = await self._get_client().chat.completions.create(**kwargs)
+            except Exception as e:
+                self.stats_counters["errors"] += 1
+                if not _is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                delay = random.uniform(0, min(self.retry_max_seconds, self.retry_base_seconds * 2 ** attempt))
+                if _status_code(e) == 429:
+                    self.stats_counters["rate_limited"] += 1
+                    retry_after = _retry_after_seconds(e)
+                    if retry_after is not None:
+                        delay = max(delay, retry_after)
+                    # Back everyone off, not just this caller
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                attempt += 1
+                self.stats_counters["retries"] += 1
+                logger.warning(
+                    f"[LLM] {kwargs.get('model')} request failed ({e.__class__.__name__}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+            finally:
+                self._release()
+            if delay is not None:
+                # The slot is already released: other requests run during the backoff
+                await asyncio.sleep(delay)
+                continue
+            used = getattr(getattr(response, "usage", None), "total_tokens", None)
+            if isinstance(used, int):
+                self.tokens_bucket.adjust(used - estimate)
+                self.stats_counters["tokens"] += used
+            return response
+
+    def create(self, priority: str = "live", **kwargs):
+        """Run a chat completion through the gateway, blocking the calling thread."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("LLMGateway.create must not be called from the gateway loop")
+        return asyncio.run_coroutine_threadsafe(self._create(priority, kwargs), self._loop).result()
+
+    def stats(self) -> Dict:
+        """Return request counters and current limiter state."""
+        return {
+            **self.stats_counters,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "rpm_available": round(self.requests_bucket.tokens, 1),
+            "tpm_available": round(self.tokens_bucket.tokens),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the loop thread (pending requests are abandoned)."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+class _Completions:
+    def __init__(self, gateway: LLMGateway, priority: str):
+        self._gateway = gateway
+        self._priority = priority
+
+    def create(self, **kwargs):
+        return self._gateway.create(self._priority, **kwargs)
+
+
+class _Chat:
+    def __init__(self, gateway: LLMGateway, priority: str):
+        self.completions = _Completions(gateway, priority)
+
+
+class GatewayClient:
+    """Synchronous stand-in for ``OpenAI`` exposing ``chat.completions.create``."""
+
+    def __init__(self, gateway: LLMGateway, priority: str):
+        self.priority = priority
+        self.chat = _Chat(gateway, priority)
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Return this process's LLMGateway, creating it from settings on first use."""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            settings = get_settings()
+            _gateway = LLMGateway(
+                rpm=settings.LLM_RPM_LIMIT,
+                tpm=settings.LLM_TPM_LIMIT,
+                max_concurrency=settings.LLM_MAX_CONCURRENCY,
+                max_retries=settings.LLM_MAX_RETRIES,
+                retry_base_seconds=settings.LLM_RETRY_BASE_SECONDS,
+                retry_max_seconds=settings.LLM_RETRY_MAX_SECONDS,
+            )
+        return _gateway
+
+
+def llm_gateway_stats() -> Optional[Dict]:
+    """Return the process gateway's stats, or None if it has not been started."""
+    gateway = _gateway
+    return gateway.stats() if gateway is not None else None
+
+
+def shutdown_llm_gateway() -> None:
+    """Stop the process gateway, if one was started."""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is not None:
+            _gateway.shutdown()
+            _gateway = None
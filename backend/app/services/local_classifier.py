@@ -0,0 +1,242 @@
+"""Local fast-tier classifier trained on labels the LLM already produced.
+
+Features are hashed word uni/bigrams (``HashingVectorizer``, stateless, so
+nothing but the linear models needs to be stored). Each label group
+(custom_tags, iptc_topics, iab_categories) gets a one-vs-rest logistic
+regression over the labels seen at least ``min_support`` times; a label
+present on every training item is simply always predicted.
+
+A prediction's confidence is the least certain binary decision across all
+labels: ``min(max(p, 1 - p))``. ClassifierService returns the local labels
+when that confidence reaches ``LOCAL_CLASSIFIER_THRESHOLD`` and escalates to
+the LLM otherwise. ``field`` is not learned: it is always keyword-inferred.
+
+Models are trained offline (``scripts/train_local_classifier.py``), saved
+with joblib and loaded once per process; a retrained file is picked up by
+the next ClassifierService created after its mtime changes.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+LABEL_GROUPS = ("custom_tags", "iptc_topics", "iab_categories")
+N_FEATURES = 2 ** 18
+MODEL_FORMAT_VERSION = 1
+
+
+def _vectorizer():
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(
+        n_features=N_FEATURES, ngram_range=(1, 2), alternate_sign=False, norm="l2", lowercase=True
+    )
+
+
+class LocalClassifier:
+    """Hashed n-gram features + per-group one-vs-rest logistic regression."""
+
+    def __init__(self, groups: Dict[str, Dict], trained_at: Optional[str] = None, metrics: Optional[Dict] = None):
+        """Wrap trained models.
+
+        Args:
+            groups: {group: {"classes": [label, ...], "model": fitted classifier or None,
+                "always": [labels present on every training item]}}
+            trained_at: ISO timestamp of training
+            metrics: Held-out evaluation report from training
+        """
+        self.groups = groups
+        self.trained_at = trained_at
+        self.metrics = metrics or {}
+        self._vectorizer = _vectorizer()
+
+    # -------- Training --------
+    @classmethod
+    def train(
+        cls,
+        texts: Sequence[str],
+        labels: Dict[str, Sequence[Sequence[str]]],
+        min_support: int = 5,
+        C: float = 4.0,
+    ) -> "LocalClassifier":
+        """Fit one model per label group.
+
+        Args:
+            texts: Lowercased "title summary" strings
+            labels: {group: per-text label lists}, groups from LABEL_GROUPS
+            min_support: Labels with fewer positive examples are not learned
+            C: Inverse regularization strength
+
+        Returns:
+            Trained LocalClassifier
+        """
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.multiclass import OneVsRestClassifier
+
+        X = _vectorizer().transform(texts)
+        n = len(texts)
+        groups: Dict[str, Dict] = {}
+        for group in LABEL_GROUPS:
+            label_lists = labels.get(group) or [[] for _ in range(n)]
+            counts: Dict[str, int] = {}
+            for row in label_lists:
+                for label in set(row):
+                    counts[label] = counts.get(label, 0) + 1
+            classes = sorted(label for label, c in counts.items() if min_support <= c < n)
+            always = sorted(label for label, c in counts.items() if c == n)
+            if not classes:
+                groups[group] = {"classes": [], "model": None, "always": always}
+                continue
+            index = {label: i for i, label in enumerate(classes)}
+            Y = np.zeros((n, len(classes)), dtype=np.int8)
+            for r, row in enumerate(label_lists):
+                for label in row:
+                    if label in index:
+                        Y[r, index[label]] = 1
+            model = OneVsRestClassifier(LogisticRegression(C=C, max_iter=1000, solver="liblinear"))
+            model.fit(X, Y)
+            groups[group] = {"classes": classes, "model": model, "always": always}
+        return cls(groups, trained_at=datetime.utcnow().isoformat())
+
+    # -------- Inference --------
+    def predict_many(self, texts: Sequence[str]) -> Tuple[List[Dict], np.ndarray]:
+        """Predict label groups for many texts.
+
+        Returns:
+            (list of {group: [labels]}, confidence array of shape (len(texts),))
+        """
+        n = len(texts)
+        predictions: List[Dict] = [{group: [] for group in LABEL_GROUPS} for _ in range(n)]
+        confidence = np.ones(n, dtype=np.float64)
+        if n == 0:
+            return predictions, confidence
+        X = self._vectorizer.transform(texts)
+        for group, entry in self.groups.items():
+            for labels in predictions:
+                labels[group].extend(entry.get("always", []))
+            model = entry.get("model")
+            if model is None:
+                continue
+            proba = np.asarray(model.predict_proba(X)).reshape(n, -1)
+            if proba.shape[1] != len(entry["classes"]):
+                # A single learned label is fit as a binary problem: keep P(label)
+                proba = proba[:, -1:]
+            confidence = np.minimum(confidence, np.maximum(proba, 1 - proba).min(axis=1))
+            positive = proba >= 0.5
+            classes = entry["classes"]
+            for r, c in zip(*np.nonzero(positive)):
+                predictions[r][group].append(classes[c])
+        return predictions, confidence
+
+    def predict(self, text: str) -> Tuple[Dict, float]:
+        """Predict label groups for one text. Returns (labels, confidence)."""
+        predictions, confidence = self.predict_many([text])
+        return predictions[0], float(confidence[0])
+
+    # -------- Evaluation --------
+    def evaluate(self, texts: Sequence[str], labels: Dict[str, Sequence[Sequence[str]]], threshold: float) -> Dict:
+        """Compare predictions with held-out LLM labels.
+
+        Returns:
+            Report with per-group micro precision/recall/F1 (all items and
+            confident items), coverage at ``threshold`` and exact-match
+            accuracy on the confident items
+        """
+        predictions, confidence = self.predict_many(texts)
+        confident = confidence >= threshold
+        report: Dict = {
+            "items": len(texts),
+            "threshold": threshold,
+            "coverage": round(float(confident.mean()), 4) if len(texts) else 0.0,
+            "groups": {},
+        }
+        exact = np.ones(len(texts), dtype=bool)
+        for group in LABEL_GROUPS:
+            truth = [set(row) for row in (labels.get(group) or [[] for _ in texts])]
+            pred = [set(p[group]) for p in predictions]
+            exact &= np.array([t == p for t, p in zip(truth, pred)], dtype=bool)
+            report["groups"][group] = {
+                "all": _micro_prf(truth, pred),
+                "confident": _micro_prf(
+                    [t for t, c in zip(truth, confident) if c], [p for p, c in zip(pred, confident) if c]
+                ),
+                "labels": len(self.groups.get(group, {}).get("classes", [])),
+            }
+        report["exact_match_confident"] = round(float(exact[confident].mean()), 4) if confident.any() else None
+        return report
+
+    # -------- Persistence --------
+    def save(self, path: str) -> None:
+        import joblib
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        joblib.dump(
+            {
+                "format": MODEL_FORMAT_VERSION,
+                "n_features": N_FEATURES,
+                "groups": self.groups,
+                "trained_at": self.trained_at,
+                "metrics": self.metrics,
+            },
+            tmp,
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "LocalClassifier":
+        import joblib
+
+        data = joblib.load(path)
+        if data.get("format") != MODEL_FORMAT_VERSION or data.get("n_features") != N_FEATURES:
+            raise ValueError(f"Incompatible local classifier file: {path}")
+        return cls(data["groups"], trained_at=data.get("trained_at"), metrics=data.get("metrics"))
+
+
+def _micro_prf(truth: List[set], pred: List[set]) -> Dict:
+    tp = sum(len(t & p) for t, p in zip(truth, pred))
+    fp = sum(len(p - t) for t, p in zip(truth, pred))
+    fn = sum(len(t - p) for t, p in zip(truth, pred))
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": round(precision, 4), "recall": round(recall, 4), "f1": round(f1, 4)}
+
+
+_model: Optional[LocalClassifier] = None
+_model_mtime: Optional[float] = None
+_model_lock = threading.Lock()
+
+
+def get_local_classifier() -> Optional[LocalClassifier]:
+    """Return the process's local model, or None when disabled or not trained yet.
+
+    The file is loaded on first use and reloaded when its mtime changes.
+    """
+    global _model, _model_mtime
+    path = get_settings().LOCAL_CLASSIFIER_PATH
+    if not path:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    with _model_lock:
+        if _model is None or _model_mtime != mtime:
+            try:
+                _model = LocalClassifier.load(path)
+                _model_mtime = mtime
+                logger.info(f"[Classify] Loaded local classifier from {path} (trained {_model.trained_at})")
+            except Exception as e:
+                logger.warning(f"[Classify] Could not load local classifier {path}: {e}")
+                _model, _model_mtime = None, None
+        return _model
@@ -0,0 +1,129 @@
+"""Per-model health memory for LLM fallback chains.
+
+Callers record the outcome and latency of every model call. A model that
+fails ``failure_threshold`` times in a row is skipped for ``cooldown_seconds``
+(circuit open); after the cooldown it gets one trial call (half-open) and is
+closed again on success. ``order`` returns the healthy models of a chain,
+measured-fastest first (EWMA latency), keeping the configured order for
+models with no samples yet.
+
+Only API errors count as failures; a reply that fails to parse is a success
+from the model's health point of view.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from backend.app.core.config import get_settings
+
+# Weight of the newest sample in the latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+
+
+class ModelHealth:
+    """Success/latency statistics and a circuit breaker per model name."""
+
+    def __init__(self, failure_threshold: int = 3, cooldown_seconds: float = 300):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self._stats: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, model: str) -> Dict:
+        entry = self._stats.get(model)
+        if entry is None:
+            entry = {
+                "successes": 0,
+                "failures": 0,
+                "consecutive_failures": 0,
+                "latency_ms": None,
+                "open_until": 0.0,
+                "last_error": None,
+            }
+            self._stats[model] = entry
+        return entry
+
+    def record_success(self, model: str, latency_ms: float) -> None:
+        with self._lock:
+            entry = self._entry(model)
+            entry["successes"] += 1
+            entry["consecutive_failures"] = 0
+            entry["open_until"] = 0.0
+            prev = entry["latency_ms"]
+            entry["latency_ms"] = latency_ms if prev is None else prev + LATENCY_EWMA_ALPHA * (latency_ms - prev)
+
+    def record_failure(self, model: str, error: Optional[str] = None, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._entry(model)
+            entry["failures"] += 1
+            entry["consecutive_failures"] += 1
+            entry["last_error"] = (error or "")[:200] or None
+            if entry["consecutive_failures"] >= self.failure_threshold:
+                entry["open_until"] = now + self.cooldown_seconds
+
+    def is_available(self, model: str, now: Optional[float] = None) -> bool:
+        """False while the model's circuit is open."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._stats.get(model)
+            return entry is None or entry["open_until"] <= now
+
+    def order(self, models: Sequence[str], now: Optional[float] = None) -> List[str]:
+        """Return available models, fastest measured first, then unmeasured in given order."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            available = [
+                (i, m) for i, m in enumerate(models)
+                if m not in self._stats or self._stats[m]["open_until"] <= now
+            ]
+
+            def key(pair):
+                latency = self._stats.get(pair[1], {}).get("latency_ms")
+                return (latency is None, latency or 0.0, pair[0])
+
+            return [m for _, m in sorted(available, key=key)]
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Dict]:
+        """Return per-model metrics for monitoring."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            out = {}
+            for model, entry in self._stats.items():
+                calls = entry["successes"] + entry["failures"]
+                if entry["open_until"] > now:
+                    state = "open"
+                elif entry["consecutive_failures"] >= self.failure_threshold:
+                    state = "half_open"
+                else:
+                    state = "closed"
+                out[model] = {
+                    "successes": entry["successes"],
+                    "failures": entry["failures"],
+                    "success_rate": round(entry["successes"] / calls, 4) if calls else None,
+                    "consecutive_failures": entry["consecutive_failures"],
+                    "latency_ms": round(entry["latency_ms"], 1) if entry["latency_ms"] is not None else None,
+                    "state": state,
+                    "retry_in_seconds": round(entry["open_until"] - now, 1) if state == "open" else 0,
+                    "last_error": entry["last_error"],
+                }
+            return out
+
+
+_health: Optional[ModelHealth] = None
+_health_lock = threading.Lock()
+
+
+def get_model_health() -> ModelHealth:
+    """Return this process's ModelHealth."""
+    global _health
+    with _health_lock:
+        if _health is None:
+            settings = get_settings()
+            _health = ModelHealth(
+                failure_threshold=settings.LLM_MODEL_FAILURE_THRESHOLD,
+                cooldown_seconds=settings.LLM_MODEL_COOLDOWN_SECONDS,
+            )
+        return _health
@@ -9,6 +9,16 @@ from backend.app.models.person_timeline import PersonTimeline
 from backend.app.models.watch_rule import WatchRule
 from backend.app.models.entity import Entity
 from backend.app.models.item_entity import item_entities
+from backend.app.services.keyword_matcher import KeywordMatcher
+
+# Event type keywords, most specific first (first matching type wins)
+EVENT_KEYWORDS = {
+    "organization": ["join", "leave", "move", "appoint", "hire", "depart", "resign", "hired", "joined"],
+    "investment": ["investment", "funding", "acquire", "raise", "fund", "series", "round", "acquired"],
+    "product": ["launch", "release", "announce", "product", "unveil", "introduce", "announced"],
+    "paper": ["paper", "published", "arxiv", "research paper", "study", "journal"],
+}
+EVENT_MATCHER = KeywordMatcher(EVENT_KEYWORDS)
 
 
 class PersonTracker:
@@ -179,27 +189,8 @@ class PersonTracker:
         Returns:
             Event type string: 'paper', 'product', 'investment', 'organization', or 'research_direction'
         """
-        text = f"{title} {summary}".lower()
-        
-        # Check for organization movement keywords first (more specific)
-        if any(kw in text for kw in ["join", "leave", "move", "appoint", "hire", "depart", "resign", "hired", "joined"]):
-            return "organization"
-        
-        # Check for investment/funding keywords
-        elif any(kw in text for kw in ["investment", "funding", "acquire", "raise", "fund", "series", "round", "acquired"]):
-            return "investment"
-        
-        # Check for product/launch keywords
-        elif any(kw in text for kw in ["launch", "release", "announce", "product", "unveil", "introduce", "announced"]):
-            return "product"
-        
-        # Check for paper/publication keywords (less specific, check last)
-        elif any(kw in text for kw in ["paper", "published", "arxiv", "research paper", "study", "journal"]):
-            return "paper"
-        
-        # Default to research_direction
-        else:
-            return "research_direction"
+        # First category with a keyword hit, in EVENT_KEYWORDS priority order
+        return EVENT_MATCHER.first_match(f"{title} {summary}") or "research_direction"
     
     def build_relationship_graph(self, person_id: int) -> Dict:
         """Build relationship graph for a person.
@@ -0,0 +1,176 @@
+"""Adaptive per-source polling policy.
+
+Each source gets its own next poll time derived from its observed publish
+cadence (median gap between its recent publish batches), stretched while polls
+keep returning nothing new (304 / no new items), clamped to [min, max] and
+jittered so requests spread out instead of firing all at once.
+
+Failing sources back off exponentially; after ``RSS_CIRCUIT_FAILURE_THRESHOLD``
+consecutive failures the circuit opens and the source is only probed once
+per ``RSS_CIRCUIT_OPEN_MINUTES`` (half-open) until a poll succeeds.
+"""
+import random
+from datetime import datetime, timedelta
+from statistics import median
+from typing import List, Optional
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import get_settings
+from backend.app.models.item import Item
+from backend.app.models.source import Source
+
+# Number of recent publish batches (distinct publish minutes) used to estimate
+# a source's cadence; counting items would see one arXiv drop of hundreds of
+# entries as a single instant
+CADENCE_HISTORY = 20
+# Publish times closer than this are treated as one batch (e.g. arXiv daily drops)
+BATCH_GAP_MINUTES = 1.0
+# Interval growth per consecutive empty poll, and the cap on the exponent
+EMPTY_POLL_GROWTH = 1.5
+MAX_EMPTY_STREAK = 10
+
+
+def compute_poll_interval(
+    publish_times: List[datetime],
+    unchanged_streak: int,
+    default_minutes: float,
+    min_minutes: float,
+    max_minutes: float,
+) -> float:
+    """Compute the polling interval (minutes) for a source.
+
+    Polls twice per typical inter-arrival gap, so busy feeds are polled often
+    and dormant ones rarely. Each consecutive empty poll multiplies the
+    interval by ``EMPTY_POLL_GROWTH``.
+
+    Args:
+        publish_times: Recent item publish times (any order)
+        unchanged_streak: Consecutive polls with no new items
+        default_minutes: Base interval when history is too short
+        min_minutes: Lower bound
+        max_minutes: Upper bound
+
+    Returns:
+        Interval in minutes within [min_minutes, max_minutes]
+    """
+    times = sorted(t for t in publish_times if t is not None)
+    gaps = [
+        (b - a).total_seconds() / 60.0
+        for a, b in zip(times, times[1:])
+    ]
+    gaps = [g for g in gaps if g >= BATCH_GAP_MINUTES]
+
+    base = median(gaps) / 2.0 if gaps else default_minutes
+    streak = min(max(unchanged_streak or 0, 0), MAX_EMPTY_STREAK)
+    interval = base * (EMPTY_POLL_GROWTH ** streak)
+    return max(min_minutes, min(max_minutes, interval))
+
+
+def next_poll_time(
+    now: datetime,
+    interval_minutes: float,
+    jitter_ratio: float = 0.1,
+    rng: Optional[random.Random] = None,
+) -> datetime:
+    """Return ``now + interval`` with ±``jitter_ratio`` random jitter."""
+    rng = rng or random
+    jitter = 1.0 + rng.uniform(-jitter_ratio, jitter_ratio) if jitter_ratio > 0 else 1.0
+    return now + timedelta(minutes=interval_minutes * jitter)
+
+
+def failure_backoff_minutes(
+    consecutive_failures: int,
+    base_minutes: float,
+    max_minutes: float,
+    circuit_threshold: int,
+    circuit_open_minutes: float,
+) -> float:
+    """Return the delay (minutes) before retrying a failing source.
+
+    Exponential backoff (base * 2^(n-1), capped at max) until the circuit
+    threshold is reached; after that the circuit is open and the source is
+    probed once per ``circuit_open_minutes``.
+    """
+    n = max(consecutive_failures, 1)
+    if n >= circuit_threshold:
+        return circuit_open_minutes
+    return min(max_minutes, base_minutes * (2 ** (n - 1)))
+
+
+def circuit_state(source: Source, now: Optional[datetime] = None) -> str:
+    """Return "closed", "open" (waiting for cooldown) or "half_open" (probe due)."""
+    threshold = get_settings().RSS_CIRCUIT_FAILURE_THRESHOLD
+    if (source.consecutive_failures or 0) < threshold:
+        return "closed"
+    now = now or datetime.utcnow()
+    if source.next_poll_at is not None and source.next_poll_at > now:
+        return "open"
+    return "half_open"
+
+
+def record_source_failure(source: Source, error: str, now: Optional[datetime] = None) -> None:
+    """Count a failed poll and push next_poll_at out by the backoff delay.
+
+    Args:
+        source: Source whose poll failed (caller commits)
+        error: Error message to keep for diagnostics
+        now: Current UTC time (naive), defaults to utcnow
+    """
+    settings = get_settings()
+    now = now or datetime.utcnow()
+    source.consecutive_failures = (source.consecutive_failures or 0) + 1
+    source.last_error = (error or "")[:2000]
+    source.last_failure_at = now
+    delay = failure_backoff_minutes(
+        source.consecutive_failures,
+        base_minutes=settings.RSS_FAILURE_BACKOFF_BASE_MINUTES,
+        max_minutes=settings.RSS_FAILURE_BACKOFF_MAX_MINUTES,
+        circuit_threshold=settings.RSS_CIRCUIT_FAILURE_THRESHOLD,
+        circuit_open_minutes=settings.RSS_CIRCUIT_OPEN_MINUTES,
+    )
+    source.next_poll_at = next_poll_time(now, delay, settings.RSS_POLL_JITTER_RATIO)
+
+
+def record_source_success(source: Source, now: Optional[datetime] = None) -> None:
+    """Reset failure tracking (closes the circuit) after a successful poll."""
+    source.consecutive_failures = 0
+    source.last_error = None
+    source.last_success_at = now or datetime.utcnow()
+
+
+def update_source_schedule(db: Session, source: Source, new_items: int, now: Optional[datetime] = None) -> None:
+    """Update a source's streak, interval and next_poll_at after a successful poll.
+
+    Args:
+        db: SQLAlchemy database session (caller commits)
+        source: Source that was just polled
+        new_items: Number of new items collected by the poll
+        now: Current UTC time (naive), defaults to utcnow
+    """
+    settings = get_settings()
+    now = now or datetime.utcnow()
+
+    source.unchanged_streak = 0 if new_items > 0 else (source.unchanged_streak or 0) + 1
+    # Literal unit: ORDER BY must repeat the DISTINCT expression verbatim
+    batch = func.date_trunc(literal_column("'minute'"), Item.published_at).label("batch")
+    publish_times = [
+        row[0]
+        for row in db.query(batch)
+        .filter(Item.source_id == source.id)
+        .filter(Item.published_at != None)  # noqa: E711
+        .distinct()
+        .order_by(batch.desc())
+        .limit(CADENCE_HISTORY)
+        .all()
+    ]
+    interval = compute_poll_interval(
+        publish_times,
+        source.unchanged_streak,
+        default_minutes=settings.RSS_COLLECTION_INTERVAL_MINUTES,
+        min_minutes=settings.RSS_POLL_MIN_MINUTES,
+        max_minutes=settings.RSS_POLL_MAX_MINUTES,
+    )
+    source.poll_interval_minutes = int(round(interval))
+    source.next_poll_at = next_poll_time(now, interval, settings.RSS_POLL_JITTER_RATIO)
@@ -0,0 +1,113 @@
+"""TF-IDF vectors of a grouping window, fitted once and queried many times.
+
+Deduplicator used to fit a fresh TfidfVectorizer on every candidate pair. This
+index vectorizes the window once instead: word uni/bigram counts are hashed
+(``HashingVectorizer``, no vocabulary to build), IDF comes from document
+frequencies over the whole window, and rows are L2-normalized, so a batch of
+candidate similarities is a single sparse matrix-vector product.
+
+Texts not seen at fit time (new items, items just outside the window) are
+vectorized on demand with the fitted IDF and kept for later queries; a
+document whose text changed since it was vectorized is re-vectorized.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+N_FEATURES = 2 ** 20
+
+
+def _vectorizer():
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    return HashingVectorizer(
+        n_features=N_FEATURES,
+        ngram_range=(1, 2),
+        stop_words="english",
+        alternate_sign=False,
+        norm=None,
+        lowercase=True,
+    )
+
+
+class TfidfIndex:
+    """Hashed TF-IDF rows of a fixed corpus plus on-demand rows for other texts."""
+
+    def __init__(self):
+        self._vectorizer = _vectorizer()
+        self._idf = np.ones(N_FEATURES, dtype=np.float64)
+        self._matrix = sp.csr_matrix((0, N_FEATURES), dtype=np.float64)
+        # doc id -> (row in _matrix, text it was built from)
+        self._rows: Dict[int, Tuple[int, str]] = {}
+        # doc id -> (1-row vector, text) for documents vectorized after fit
+        self._extra: Dict[int, Tuple[sp.csr_matrix, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._extra)
+
+    def fit(self, docs: Dict[int, str]) -> "TfidfIndex":
+        """Compute IDF over ``docs`` and store their normalized TF-IDF rows.
+
+        Args:
+            docs: {doc id: text}
+
+        Returns:
+            self
+        """
+        ids = list(docs)
+        texts = [(docs[i] or "").strip() for i in ids]
+        counts = self._vectorizer.transform(texts).tocsr()
+        df = np.bincount(counts.indices, minlength=N_FEATURES)
+        n = len(texts)
+        # Smoothed IDF, as TfidfVectorizer(smooth_idf=True)
+        self._idf = np.log((1 + n) / (1 + df)) + 1.0
+        self._matrix = self._weigh(counts)
+        self._rows = {doc_id: (row, text) for row, (doc_id, text) in enumerate(zip(ids, texts))}
+        self._extra = {}
+        return self
+
+    def _weigh(self, counts: sp.csr_matrix) -> sp.csr_matrix:
+        weighted = counts.multiply(self._idf).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sp.csr_matrix(sp.diags(1.0 / norms) @ weighted)
+
+    def vector(self, text: str) -> sp.csr_matrix:
+        """Normalized TF-IDF row (1 x N_FEATURES) of a text under the fitted IDF."""
+        return self._weigh(self._vectorizer.transform([(text or "").strip()]).tocsr())
+
+    def similarities(self, text: str, docs: Sequence[Tuple[int, str]]) -> np.ndarray:
+        """Cosine similarity of ``text`` to each (doc id, doc text), in order.
+
+        Returns:
+            float array of shape (len(docs),) clipped to [0, 1]
+        """
+        sims = np.zeros(len(docs), dtype=np.float64)
+        if not docs or not (text or "").strip():
+            return sims
+        query = self.vector(text).T
+        fitted_pos: List[int] = []
+        fitted_rows: List[int] = []
+        extra_pos: List[int] = []
+        extra_rows: List[sp.csr_matrix] = []
+        for pos, (doc_id, doc_text) in enumerate(docs):
+            doc_text = (doc_text or "").strip()
+            fitted = self._rows.get(doc_id)
+            if fitted is not None and fitted[1] == doc_text:
+                fitted_pos.append(pos)
+                fitted_rows.append(fitted[0])
+                continue
+            extra = self._extra.get(doc_id)
+            if extra is None or extra[1] != doc_text:
+                extra = (self.vector(doc_text), doc_text)
+                self._extra[doc_id] = extra
+            extra_pos.append(pos)
+            extra_rows.append(extra[0])
+        if fitted_rows:
+            sims[fitted_pos] = (self._matrix[fitted_rows] @ query).toarray().ravel()
+        if extra_rows:
+            sims[extra_pos] = (sp.vstack(extra_rows) @ query).toarray().ravel()
+        return np.clip(sims, 0.0, 1.0)
@@ -0,0 +1,48 @@
+"""Report items.link_hash coverage and canonical-link duplicates.
+
+The link_hash backfill runs in the migration that makes link_hash unique
+(f7c2a4e8b913). Rows left with a NULL link_hash are legacy items whose links
+collapse to the canonical link of an older item (e.g. differing only in utm_*
+params or a trailing slash); this script lists them.
+
+Usage:
+  poetry run python -m backend.scripts.backfill_link_hash
+  poetry run python -m backend.scripts.backfill_link_hash --limit 50
+"""
+import argparse
+
+from backend.app.core.database import SessionLocal
+from backend.app.core.link_utils import link_hash
+from backend.app.models.item import Item
+
+
+def main(limit: int = 20):
+    db = SessionLocal()
+    try:
+        total = db.query(Item.id).count()
+        missing = (
+            db.query(Item.id, Item.link)
+            .filter(Item.link_hash == None)  # noqa: E711
+            .order_by(Item.id.asc())
+            .all()
+        )
+        print(f"[LinkHash] items={total}, without link_hash={len(missing)}")
+        if not missing:
+            return
+        owners = dict(
+            db.query(Item.link_hash, Item.id)
+            .filter(Item.link_hash.in_({link_hash(r.link) for r in missing}))
+            .all()
+        )
+        for row in missing[:limit]:
+            owner = owners.get(link_hash(row.link))
+            print(f"[LinkHash] item#{row.id} {row.link} duplicates item#{owner}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=20, help="Duplicate rows to list")
+    args = parser.parse_args()
+    main(args.limit)
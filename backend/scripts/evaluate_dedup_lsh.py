@@ -0,0 +1,125 @@
+"""Measure MinHash LSH candidate recall against the brute-force grouping scan.
+
+For a sample of recent items, the brute-force path compares each item with
+every item of its lookback window (the same filters and augmented similarity
+as Deduplicator); pairs scoring at least --threshold are the reference
+near-duplicates. The LSH path looks the item up in an index of the same
+window. Nothing is written to the DB.
+
+Reports pair recall (reference pairs that LSH also returns), best-match recall
+(items whose brute-force best match is an LSH candidate), candidates compared
+per item and time per item for both paths.
+
+Usage:
+  poetry run python -m backend.scripts.evaluate_dedup_lsh
+  poetry run python -m backend.scripts.evaluate_dedup_lsh --sample 500 --bands 32 --rows 4
+"""
+import argparse
+import json
+import time
+from datetime import timedelta
+
+from backend.app.core.config import get_settings
+from backend.app.core.database import SessionLocal
+from backend.app.models.item import Item
+from backend.app.services.deduplicator import Deduplicator
+from backend.app.services.minhash_lsh import build_from_db
+
+
+def main(sample: int = 200, days: int = 21, threshold: float = 0.2, bands: int = None, rows: int = None):
+    settings = get_settings()
+    bands = bands or settings.DEDUP_LSH_BANDS
+    rows = rows or settings.DEDUP_LSH_ROWS
+    db = SessionLocal()
+    try:
+        targets = (
+            db.query(Item)
+            .filter(Item.published_at != None)  # noqa: E711
+            .order_by(Item.published_at.desc())
+            .limit(sample)
+            .all()
+        )
+        if not targets:
+            raise SystemExit("No items to evaluate")
+        since = min(t.published_at for t in targets) - timedelta(days=days)
+        window = (
+            db.query(Item)
+            .filter(Item.published_at != None)  # noqa: E711
+            .filter(Item.published_at >= since)
+            .all()
+        )
+        started = time.perf_counter()
+        lsh = build_from_db(db, since, bands, rows)
+        build_ms = (time.perf_counter() - started) * 1000
+        by_id = {it.id: it for it in window}
+
+        d = Deduplicator(db, similarity_threshold=threshold, lookback_days=days)
+        d.fit_window(window)
+        reference_pairs = found_pairs = 0
+        best_total = best_found = 0
+        brute_compared = lsh_compared = 0
+        brute_s = lsh_s = 0.0
+
+        for item in targets:
+            text = d._compose_text(item)
+            cutoff = item.published_at - timedelta(days=days)
+            recent = [it for it in window if it.published_at >= cutoff]
+
+            started = time.perf_counter()
+            candidates = d._filter_candidates(item, recent)
+            bases = d._base_similarities(text, candidates)
+            sims = {c.id: d._augmented_similarity(item, c, base=b) for c, b in zip(candidates, bases)}
+            brute_s += time.perf_counter() - started
+            brute_compared += len(candidates)
+
+            started = time.perf_counter()
+            hits = [by_id[i] for i in lsh.query(text, exclude=item.id) if i in by_id and by_id[i].published_at >= cutoff]
+            lsh_candidates = d._filter_candidates(item, hits)
+            bases = d._base_similarities(text, lsh_candidates)
+            for c, b in zip(lsh_candidates, bases):
+                d._augmented_similarity(item, c, base=b)
+            lsh_s += time.perf_counter() - started
+            lsh_compared += len(lsh_candidates)
+
+            reference = {i for i, s in sims.items() if s >= threshold}
+            found = {c.id for c in lsh_candidates}
+            reference_pairs += len(reference)
+            found_pairs += len(reference & found)
+            if reference:
+                best_total += 1
+                best_found += max(reference, key=lambda i: sims[i]) in found
+
+        n = len(targets)
+        report = {
+            "items": n,
+            "window_items": len(window),
+            "bands": bands,
+            "rows": rows,
+            "threshold": threshold,
+            "index_build_ms": round(build_ms, 1),
+            "pair_recall": round(found_pairs / reference_pairs, 4) if reference_pairs else None,
+            "reference_pairs": reference_pairs,
+            "best_match_recall": round(best_found / best_total, 4) if best_total else None,
+            "brute_force": {
+                "compared_per_item": round(brute_compared / n, 1),
+                "ms_per_item": round(brute_s * 1000 / n, 2),
+            },
+            "lsh": {
+                "compared_per_item": round(lsh_compared / n, 1),
+                "ms_per_item": round(lsh_s * 1000 / n, 2),
+            },
+        }
+    finally:
+        db.close()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare LSH grouping candidates with the brute-force scan")
+    parser.add_argument("--sample", type=int, default=200, help="Most recent items to evaluate")
+    parser.add_argument("--days", type=int, default=21, help="Lookback window in days")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Augmented similarity of a reference pair")
+    parser.add_argument("--bands", type=int, default=None, help="LSH bands (default: DEDUP_LSH_BANDS)")
+    parser.add_argument("--rows", type=int, default=None, help="Rows per band (default: DEDUP_LSH_ROWS)")
+    args = parser.parse_args()
+    main(sample=args.sample, days=args.days, threshold=args.threshold, bands=args.bands, rows=args.rows)
@@ -4,7 +4,7 @@ Run from project root:
   poetry run python -m backend.scripts.init_sources
 """
 from backend.app.core.config import get_settings
-from backend.app.core.constants import PRD_RSS_SOURCES
+from backend.app.core.constants import PRD_RSS_SOURCES, SOURCE_FILTER_PRESETS
 from backend.app.core.database import SessionLocal
 from backend.app.models.source import Source
 
@@ -26,6 +26,7 @@ def main():
                 title=s["title"],
                 feed_url=s["feed_url"],
                 site_url=s.get("site_url"),
+                filter_config=SOURCE_FILTER_PRESETS.get(s.get("filter_preset")),
                 is_active=True,
             )
             db.add(src)
@@ -0,0 +1,113 @@
+"""Train the local fast-tier classifier from LLM-written labels.
+
+Items classified by the LLM (classified_by = "llm") are split by id into a
+training set and a held-out set. The model is trained on the former, evaluated
+against the held-out LLM labels, and saved to LOCAL_CLASSIFIER_PATH (or
+--output) together with the report. Prints coverage at the confidence
+threshold and precision/recall/F1 per label group.
+
+Usage:
+  poetry run python -m backend.scripts.train_local_classifier
+  poetry run python -m backend.scripts.train_local_classifier --holdout 0.2 --min-support 10
+  poetry run python -m backend.scripts.train_local_classifier --report-only
+"""
+import argparse
+import json
+
+from backend.app.core.config import get_settings
+from backend.app.core.database import SessionLocal
+from backend.app.models.item import Item
+from backend.app.services.local_classifier import LABEL_GROUPS, LocalClassifier
+
+
+def load_labeled(limit: int = None, include_legacy: bool = False):
+    """Return (ids, texts, labels) for items whose labels came from the LLM."""
+    db = SessionLocal()
+    try:
+        query = db.query(
+            Item.id, Item.title, Item.summary_short, Item.custom_tags, Item.iptc_topics, Item.iab_categories
+        )
+        if include_legacy:
+            # Rows classified before classified_by existed (LLM-first, may include heuristic fallbacks)
+            query = query.filter((Item.classified_by == "llm") | (Item.classified_by == None))  # noqa: E711
+        else:
+            query = query.filter(Item.classified_by == "llm")
+        query = query.filter(Item.classification_status == "done").order_by(Item.id.desc())
+        if limit:
+            query = query.limit(limit)
+        rows = query.all()
+    finally:
+        db.close()
+    ids = [r.id for r in rows]
+    texts = [f"{r.title or ''} {r.summary_short or ''}".strip().lower() for r in rows]
+    labels = {group: [list(getattr(r, group) or []) for r in rows] for group in LABEL_GROUPS}
+    return ids, texts, labels
+
+
+def split(ids, texts, labels, holdout: float):
+    """Deterministic split by id so re-runs evaluate on the same held-out items."""
+    buckets = max(1, round(holdout * 100))
+    test = [i % 100 < buckets for i in ids]
+
+    def pick(values, flag):
+        return [v for v, t in zip(values, test) if t == flag]
+
+    train = (pick(texts, False), {g: pick(v, False) for g, v in labels.items()})
+    held = (pick(texts, True), {g: pick(v, True) for g, v in labels.items()})
+    return train, held
+
+
+def main(
+    output: str = None,
+    holdout: float = 0.2,
+    min_support: int = 5,
+    threshold: float = None,
+    limit: int = None,
+    include_legacy: bool = False,
+    report_only: bool = False,
+):
+    settings = get_settings()
+    output = output or settings.LOCAL_CLASSIFIER_PATH
+    threshold = settings.LOCAL_CLASSIFIER_THRESHOLD if threshold is None else threshold
+    if not output:
+        raise SystemExit("Set LOCAL_CLASSIFIER_PATH or pass --output")
+
+    ids, texts, labels = load_labeled(limit, include_legacy)
+    print(f"[LocalClassifier] Loaded {len(texts)} LLM-labeled items")
+    (train_texts, train_labels), (test_texts, test_labels) = split(ids, texts, labels, holdout)
+
+    if report_only:
+        model = LocalClassifier.load(output)
+        report = model.evaluate(test_texts, test_labels, threshold)
+    else:
+        if not train_texts:
+            raise SystemExit("No LLM-labeled items to train on")
+        model = LocalClassifier.train(train_texts, train_labels, min_support=min_support)
+        report = model.evaluate(test_texts, test_labels, threshold)
+        report["train_items"] = len(train_texts)
+        model.metrics = report
+        model.save(output)
+        print(f"[LocalClassifier] Saved model to {output}")
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train/evaluate the local classifier on LLM labels")
+    parser.add_argument("--output", default=None, help="Model file (default: LOCAL_CLASSIFIER_PATH)")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Fraction of items held out for the report")
+    parser.add_argument("--min-support", type=int, default=5, help="Minimum examples per learned label")
+    parser.add_argument("--threshold", type=float, default=None, help="Confidence cutoff for the report")
+    parser.add_argument("--limit", type=int, default=None, help="Use only the most recent N items")
+    parser.add_argument("--include-legacy", action="store_true", help="Also use rows with no classified_by")
+    parser.add_argument("--report-only", action="store_true", help="Evaluate the saved model without retraining")
+    args = parser.parse_args()
+    main(
+        output=args.output,
+        holdout=args.holdout,
+        min_support=args.min_support,
+        threshold=args.threshold,
+        limit=args.limit,
+        include_legacy=args.include_legacy,
+        report_only=args.report_only,
+    )
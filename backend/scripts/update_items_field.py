@@ -1,7 +1,6 @@
 """Update field for existing items using ClassifierService."""
 import sys
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Optional
 
 # Add parent directory to path
@@ -86,69 +85,55 @@ def update_items_field(
         print(f"[UpdateField] Found {total} items to update")
         print(f"[UpdateField] Mode: {'Parallel' if parallel else 'Sequential'} (workers: {max_workers if parallel else 1})")
         
-        classifier = ClassifierService()
+        classifier = ClassifierService(priority="backfill")
         updated = 0
         failed = 0
         
         if parallel:
-            # Parallel processing with ThreadPoolExecutor
+            # Batched LLM calls (several items per prompt), batches sent concurrently
             item_dict = {item.id: item for item in items}
-            
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all classification tasks
-                future_to_item = {
-                    executor.submit(classify_single_item, item, classifier): item.id
-                    for item in items
-                }
-                
-                # Process results as they complete
-                results = {}
-                completed = 0
+            rows = [
+                {"id": item.id, "title": item.title or "", "summary": item.summary_short or ""}
+                for item in items
+            ]
+            results = {}
+            for start in range(0, total, batch_size):
+                chunk = rows[start : start + batch_size]
+                try:
+                    batch_results = classifier.classify_batch(chunk, max_workers=max_workers)
+                    for row, result in zip(chunk, batch_results):
+                        results[row["id"]] = {"item_id": row["id"], "success": True, "result": result}
+                except Exception as e:
+                    print(f"[UpdateField] Batch classification failed, classifying per item: {e}")
+                    for row in chunk:
+                        results[row["id"]] = classify_single_item(item_dict[row["id"]], classifier)
+                print(f"[UpdateField] Classified {min(start + batch_size, total)}/{total} items...")
+
+            # Update items with classification results
+            print(f"[UpdateField] Updating database with classification results...")
+            for idx, (item_id, classification_result) in enumerate(results.items(), 1):
+                item = item_dict[item_id]
+                result = classification_result["result"]
                 
-                for future in as_completed(future_to_item):
-                    completed += 1
-                    item_id = future_to_item[future]
-                    
-                    try:
-                        classification_result = future.result()
-                        results[item_id] = classification_result
-                        
-                        # Log progress every 50 items
-                        if completed % 50 == 0:
-                            print(f"[UpdateField] Classified {completed}/{total} items...")
-                    except Exception as e:
-                        print(f"[UpdateField] Error classifying item {item_id}: {e}")
-                        results[item_id] = {
-                            "item_id": item_id,
-                            "success": False,
-                            "error": str(e),
-                            "result": {"field": "research", "iptc_topics": [], "iab_categories": [], "custom_tags": []}
-                        }
+                item.field = result.get("field")
+                item.iptc_topics = result.get("iptc_topics", [])
+                item.iab_categories = result.get("iab_categories", [])
+                item.custom_tags = result.get("custom_tags", [])
+                item.classified_by = result.get("classified_by")
                 
-                # Update items with classification results
-                print(f"[UpdateField] Updating database with classification results...")
-                for idx, (item_id, classification_result) in enumerate(results.items(), 1):
-                    item = item_dict[item_id]
-                    result = classification_result["result"]
-                    
-                    item.field = result.get("field")
-                    item.iptc_topics = result.get("iptc_topics", [])
-                    item.iab_categories = result.get("iab_categories", [])
-                    item.custom_tags = result.get("custom_tags", [])
-                    
-                    if classification_result["success"]:
-                        updated += 1
-                    else:
-                        failed += 1
-                    
-                    # Commit in batches
-                    if idx % batch_size == 0:
-                        db.commit()
-                        print(f"[UpdateField] Updated {idx}/{total} items (success: {updated}, failed: {failed})")
+                if classification_result["success"]:
+                    updated += 1
+                else:
+                    failed += 1
                 
-                # Final commit
-                db.commit()
-                print(f"[UpdateField] Completed: {updated}/{total} items updated successfully, {failed} failed")
+                # Commit in batches
+                if idx % batch_size == 0:
+                    db.commit()
+                    print(f"[UpdateField] Updated {idx}/{total} items (success: {updated}, failed: {failed})")
+            
+            # Final commit
+            db.commit()
+            print(f"[UpdateField] Completed: {updated}/{total} items updated successfully, {failed} failed")
         else:
             # Sequential processing (original method)
             for idx, item in enumerate(items, 1):
@@ -164,6 +149,7 @@ def update_items_field(
                     item.iptc_topics = result.get("iptc_topics", [])
                     item.iab_categories = result.get("iab_categories", [])
                     item.custom_tags = result.get("custom_tags", [])
+                    item.classified_by = result.get("classified_by")
                     updated += 1
                 except Exception as e:
                     print(f"[UpdateField] Error classifying item {item.id}: {e}")
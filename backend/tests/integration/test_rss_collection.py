@@ -169,3 +169,41 @@ class TestRSSCollectorIntegration:
             assert len(items) == 1
             assert items[0].title == "Existing Article"  # Original item
 
+    
+    def test_collect_source_bulk_insert_skips_known_and_repeated_links(self, test_db):
+        """Test bulk path: known links skipped, repeated links inserted once."""
+        unique_id = get_unique_string()
+        
+        source = Source(
+            title=f"Test Source {unique_id}",
+            feed_url=f"https://example.com/feed_{unique_id}.xml",
+            is_active=True
+        )
+        test_db.add(source)
+        test_db.flush()
+        
+        known_link = f"https://example.com/known_{unique_id}"
+        test_db.add(Item(
+            source_id=source.id,
+            title="Known Article",
+            link=known_link,
+            published_at=datetime.now(timezone.utc)
+        ))
+        test_db.commit()
+        
+        collector = RSSCollector(test_db)
+        assert collector.existing_links([known_link, f"https://example.com/other_{unique_id}"]) == {known_link}
+        
+        entries = [
+            {"title": "Known", "link": known_link, "published_at": datetime.now(timezone.utc)},
+            {"title": "New", "link": f"https://example.com/new_{unique_id}", "published_at": datetime.now(timezone.utc)},
+            {"title": "New again", "link": f"https://example.com/new_{unique_id}", "published_at": datetime.now(timezone.utc)},
+        ]
+        
+        from unittest.mock import patch
+        with patch.object(RSSCollector, "parse_feed", return_value=entries):
+            count = collector.collect_source(source)
+        
+        assert count == 1
+        items = test_db.query(Item).filter(Item.source_id == source.id).all()
+        assert sorted(i.title for i in items) == ["Known Article", "New"]
@@ -0,0 +1,18 @@
+"""Unit test fixtures: no network access and fresh process-wide singletons."""
+import pytest
+
+from backend.app.core.config import get_settings
+from backend.app.services import model_health
+
+
+@pytest.fixture(autouse=True)
+def offline_llm(monkeypatch):
+    """Run each unit test without an OpenAI key and with empty model health.
+
+    An empty key (rather than an unset one) also overrides a key in backend/.env.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    get_settings.cache_clear()
+    monkeypatch.setattr(model_health, "_health", None)
+    yield
+    get_settings.cache_clear()
@@ -0,0 +1,78 @@
+"""Unit tests for the persistent classification cache."""
+from unittest.mock import Mock
+
+from backend.app.services.classification_cache import ClassificationCache, cache_key
+from backend.app.services.classifier import ClassifierService
+
+LABELS = {"custom_tags": ["agents"], "iptc_topics": ["technology"], "iab_categories": ["Technology"]}
+
+
+def test_get_set_counts_hits_and_misses(tmp_path):
+    cache = ClassificationCache(str(tmp_path / "cache.sqlite3"), prompt_version="v1")
+    key = cache_key("v1", ["m"], "Title", "Summary")
+
+    assert cache.get(key) is None
+    cache.set(key, LABELS)
+    assert cache.get(key) == LABELS
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_prompt_version_bump_purges_old_entries(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    old = ClassificationCache(path, prompt_version="v1")
+    old.set(cache_key("v1", ["m"], "t", "s"), LABELS)
+    old.close()
+
+    new = ClassificationCache(path, prompt_version="v2")
+
+    assert new.stats()["entries"] == 0
+    assert cache_key("v1", ["m"], "t", "s") != cache_key("v2", ["m"], "t", "s")
+
+
+def test_ttl_and_lru_eviction(tmp_path):
+    cache = ClassificationCache(str(tmp_path / "cache.sqlite3"), prompt_version="v1", max_entries=2)
+    for name in ("a", "b"):
+        cache.set(name, LABELS)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", LABELS)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == LABELS
+
+    cache.ttl_seconds = -1
+    assert cache.get("a") is None
+
+
+def test_entry_count_tracked_without_rescans(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = ClassificationCache(path, prompt_version="v1", max_entries=3)
+    for name in ("a", "b", "a"):
+        first.set(name, LABELS)
+    first.close()
+
+    cache = ClassificationCache(path, prompt_version="v1", max_entries=3)
+    assert cache._count == 2
+    statements = []
+    cache._conn.set_trace_callback(statements.append)
+    cache.set("b", LABELS)
+    cache.set("c", LABELS)
+
+    assert cache._count == 3
+    assert not any("COUNT" in sql for sql in statements)
+    cache.set("d", LABELS)
+    assert cache.stats()["entries"] == cache._count == 3
+
+
+def test_classify_uses_cache_before_llm(tmp_path):
+    svc = ClassifierService()
+    svc.cache = ClassificationCache(str(tmp_path / "cache.sqlite3"), prompt_version="v1")
+    svc._client = Mock()
+    svc._classify_with_llm = Mock(return_value=dict(LABELS))
+
+    first = svc.classify("Agents ship", "")
+    second = svc.classify("Agents ship", "")
+    batch = svc.classify_batch([{"id": 1, "title": "Agents ship", "summary": ""}])
+
+    assert first == second == batch[0]
+    assert svc._classify_with_llm.call_count == 1
+    assert svc._client.chat.completions.create.call_count == 0
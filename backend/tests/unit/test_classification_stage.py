@@ -0,0 +1,69 @@
+"""Unit tests for ClassificationStage (mock session or in-memory SQLite)."""
+from datetime import datetime
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.models.base import Base
+from backend.app.models.item import Item
+from backend.app.models.source import Source
+from backend.app.services.classification_stage import ClassificationStage
+
+
+class FakeClassifier:
+    def classify(self, title, summary):
+        if title == "boom":
+            raise RuntimeError("LLM timeout")
+        return {"field": "industry", "iptc_topics": [], "iab_categories": ["Technology"], "custom_tags": ["agents"]}
+
+
+def test_classify_rows_keeps_order_and_marks_failures():
+    stage = ClassificationStage(Mock(), max_workers=3, classifier=FakeClassifier())
+    rows = [
+        {"id": 1, "title": "Agents ship", "summary": ""},
+        {"id": 2, "title": "boom", "summary": ""},
+        {"id": 3, "title": "More agents", "summary": ""},
+    ]
+
+    results = stage.classify_rows(rows)
+
+    assert [r["id"] for r in results] == [1, 2, 3]
+    assert [r["status"] for r in results] == ["done", "failed", "done"]
+    assert results[0]["result"]["custom_tags"] == ["agents"]
+    assert results[1]["result"]["field"] == "research"
+
+
+def test_run_stops_when_nothing_pending():
+    stage = ClassificationStage(Mock(), batch_size=2, classifier=FakeClassifier())
+    stage.claim_batch = Mock(side_effect=[[{"id": 1, "title": "a", "summary": ""}, {"id": 2, "title": "b", "summary": ""}], []])
+    stage.write_results = Mock()
+
+    assert stage.run() == 2
+    assert stage.claim_batch.call_count == 2
+    stage.write_results.assert_called_once()
+
+
+def test_items_re_enqueued_while_classifying_are_not_overwritten():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Source.__table__, Item.__table__])
+    db = sessionmaker(bind=engine)()
+    source = Source(title="Example", feed_url="https://example.com/feed.xml")
+    db.add(source)
+    db.flush()
+    for i in (1, 2):
+        db.add(Item(id=i, source_id=source.id, title=f"Agents {i}", link=f"https://example.com/{i}",
+                    published_at=datetime(2026, 10, 17)))
+    db.commit()
+    stage = ClassificationStage(db, classifier=FakeClassifier())
+
+    rows = stage.claim_batch()
+    # The feed entry of item 2 was edited meanwhile (RSSCollector.refresh_changed_items)
+    db.execute(update(Item).where(Item.id == 2).values(title="Edited", classification_status="pending"))
+    db.commit()
+    written = stage.write_results(stage.classify_rows(rows))
+
+    assert written == 1
+    statuses = dict(db.query(Item.id, Item.classification_status).all())
+    assert statuses == {1: "done", 2: "pending"}
+    assert db.get(Item, 2).custom_tags == []
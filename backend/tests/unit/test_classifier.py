@@ -1,5 +1,9 @@
-"""Unit tests for ClassifierService (heuristics)."""
+"""Unit tests for ClassifierService (heuristics and batched LLM calls)."""
+import json
+from unittest.mock import Mock
+
 from backend.app.services.classifier import ClassifierService
+from backend.app.services.model_health import ModelHealth
 
 
 def test_custom_tags_detection():
@@ -25,3 +29,44 @@ def test_defaults_when_no_keywords():
     out = svc.classify("Unrelated news", "Nothing about AI here.")
     assert out["custom_tags"] == []
     assert out["iab_categories"] == ["Technology"]
+
+
+def _completion(content):
+    resp = Mock()
+    resp.choices = [Mock(message=Mock(content=content))]
+    return resp
+
+
+def test_classify_batch_parses_array_and_falls_back_for_missing_ids():
+    svc = ClassifierService()
+    svc._health = ModelHealth()
+    svc._client = Mock()
+    batch_reply = json.dumps([
+        {"id": "1", "custom_tags": ["agents"], "iptc_topics": ["technology"], "iab_categories": ["Technology"]},
+        {"id": "3", "custom_tags": [], "iptc_topics": [], "iab_categories": []},
+    ])
+    svc._client.chat.completions.create.side_effect = [
+        _completion("Here you go: " + batch_reply),
+        _completion('{"custom_tags": ["world_models"], "iptc_topics": [], "iab_categories": []}'),
+    ]
+    items = [
+        {"id": 1, "title": "Agents ship", "summary": ""},
+        {"id": 2, "title": "JEPA update", "summary": ""},
+        {"id": 3, "title": "Mamba SSM results", "summary": ""},
+    ]
+
+    out = svc.classify_batch(items)
+
+    assert [o["custom_tags"] for o in out] == [["agents"], ["world_models"], ["non_transformer"]]
+    assert svc._client.chat.completions.create.call_count == 2
+
+
+def test_plan_batches_respects_token_budget():
+    svc = ClassifierService()
+    svc._settings = svc._settings.model_copy(update={"CLASSIFIER_BATCH_TOKEN_BUDGET": 400, "CLASSIFIER_BATCH_MAX_ITEMS": 3})
+    items = [{"id": i, "title": "t" * 400, "summary": ""} for i in range(5)]
+
+    batches = svc.plan_batches(items)
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [it["id"] for b in batches for it in b] == list(range(5))
@@ -0,0 +1,32 @@
+"""Unit tests for collection telemetry summaries."""
+from backend.app.models.collection_run import CollectionRun
+from backend.app.services.collection_stats import percentile, summarize_runs
+
+
+def test_percentile_interpolates():
+    values = [10, 20, 30, 40, 50]
+
+    assert percentile(values, 50) == 30
+    assert percentile(values, 95) == 48
+    assert percentile([7], 95) == 7
+    assert percentile([], 50) is None
+    assert percentile([None, 4, None], 50) == 4
+
+
+def test_summarize_runs_counts_and_percentiles():
+    runs = [
+        CollectionRun(source_id=1, status="success", fetch_ms=100.0 * i, total_ms=200.0 * i, new_items=i)
+        for i in range(1, 11)
+    ]
+    runs.append(CollectionRun(source_id=1, status="error", fetch_ms=5000.0, total_ms=5000.0, error="HTTP 500"))
+    runs.append(CollectionRun(source_id=1, status="not_modified", fetch_ms=50.0, total_ms=60.0, new_items=0))
+
+    summary = summarize_runs(runs)
+
+    assert summary["runs"] == 12
+    assert summary["errors"] == 1
+    assert summary["not_modified"] == 1
+    assert summary["timings"]["fetch_ms"]["p50"] == 550.0
+    assert summary["timings"]["total_ms"]["p95"] > summary["timings"]["total_ms"]["p50"]
+    assert set(summary["timings"]) == {"fetch_ms", "parse_ms", "commit_ms", "total_ms"}
+    assert summary["averages"]["new_items"] == 5.0
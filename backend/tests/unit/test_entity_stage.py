@@ -0,0 +1,47 @@
+"""Unit tests for EntityStage (no DB access needed)."""
+from unittest.mock import Mock
+
+from backend.app.services.entity_stage import EntityStage
+
+
+class FakeExtractor:
+    def __init__(self):
+        self.calls = []
+        self.saved = {}
+
+    def extract_entities_batch(self, items):
+        self.calls.append([it["id"] for it in items])
+        if any(it["title"] == "boom" for it in items):
+            raise RuntimeError("LLM timeout")
+        return {it["id"]: [{"name": it["title"], "type": "org"}] for it in items}
+
+    def save_entities_bulk(self, db, entities_by_item, commit=True):
+        self.saved.update(entities_by_item)
+
+
+def _rows(titles, attempts=1):
+    return [{"id": i + 1, "title": t, "summary": "", "attempts": attempts} for i, t in enumerate(titles)]
+
+
+def test_extract_rows_batches_calls_and_marks_failed_chunks():
+    extractor = FakeExtractor()
+    stage = EntityStage(Mock(), items_per_call=2, max_workers=2, extractor=extractor)
+
+    results = stage.extract_rows(_rows(["Meta", "OpenAI", "boom", "DeepMind"]))
+
+    assert sorted(extractor.calls) == [[1, 2], [3, 4]]
+    assert results == {1: [{"name": "Meta", "type": "org"}], 2: [{"name": "OpenAI", "type": "org"}], 3: None, 4: None}
+
+
+def test_write_results_retries_until_max_attempts():
+    extractor = FakeExtractor()
+    db = Mock()
+    stage = EntityStage(db, max_attempts=3, extractor=extractor)
+    rows = _rows(["Meta", "boom"], attempts=2) + [{"id": 3, "title": "boom", "summary": "", "attempts": 3}]
+
+    counts = stage.write_results(rows, {1: [{"name": "Meta", "type": "org"}], 2: None, 3: None})
+
+    assert counts == {"done": 1, "pending": 1, "failed": 1}
+    assert extractor.saved == {1: [{"name": "Meta", "type": "org"}]}
+    statuses = {u["id"]: u["entity_status"] for u in db.execute.call_args.args[1]}
+    assert statuses == {1: "done", 2: "pending", 3: "failed"}
@@ -0,0 +1,54 @@
+"""Unit tests for bulk entity persistence (statement counts on a mock session)."""
+from unittest.mock import Mock
+
+import pytest
+
+from backend.app.services.entity_store import EntityIdCache, save_entities_bulk
+
+
+def _result(rows):
+    result = Mock()
+    result.all.return_value = rows
+    return result
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = EntityIdCache(max_size=2)
+    cache.put_many({"a": 1, "b": 2})
+    cache.get_many(["a"])
+    cache.put_many({"c": 3})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_bulk_save_uses_constant_statements_and_cache():
+    db = Mock()
+    # INSERT ... RETURNING gets the new entity; SELECT finds the pre-existing one
+    db.execute.side_effect = [_result([(1, "Meta")]), _result([(2, "OpenAI")]), Mock()]
+    cache = EntityIdCache()
+    entities = {
+        10: [{"name": "Meta", "type": "org"}, {"name": "OpenAI", "type": "org"}],
+        11: [{"name": "Meta", "type": "org"}, {"name": "Nobody", "type": "unknown"}],
+    }
+
+    sent = save_entities_bulk(db, entities, cache=cache)
+
+    assert sent == 3
+    assert db.execute.call_count == 3
+    assert cache.get_many(["Meta", "OpenAI"]) == {"Meta": 1, "OpenAI": 2}
+
+    db.execute.reset_mock(side_effect=True)
+    assert save_entities_bulk(db, {12: [{"name": "Meta", "type": "org"}]}, cache=cache) == 1
+    assert db.execute.call_count == 1  # links only: ids came from the cache
+
+
+def test_bulk_save_without_commit_rolls_back_only_its_savepoint():
+    db = Mock()
+    db.execute.side_effect = RuntimeError("boom")
+    savepoint = db.begin_nested.return_value
+
+    with pytest.raises(RuntimeError):
+        save_entities_bulk(db, {10: [{"name": "Meta", "type": "org"}]}, cache=EntityIdCache(), commit=False)
+
+    savepoint.rollback.assert_called_once()
+    db.rollback.assert_not_called()
@@ -0,0 +1,56 @@
+"""Unit tests for declarative per-source entry filters."""
+import pytest
+
+from backend.app.core.constants import SOURCE_FILTER_PRESETS
+from backend.app.models.source import Source
+from backend.app.services.entry_filter import EntryFilter, get_entry_filter
+
+
+def _entry(title="", description="", link="https://example.com/post", categories=None):
+    return {"title": title, "description": description, "link": link, "categories": categories or []}
+
+
+def test_keywords_match_whole_words_only():
+    f = EntryFilter(SOURCE_FILTER_PRESETS["ai_keywords"])
+
+    assert f(_entry(title="New AI model ships"))
+    assert f(_entry(description="A large language model for code"))
+    assert f(_entry(categories=["Machine Learning"]))
+    # "ai" inside "said" / "ml" inside "html" must not match
+    assert not f(_entry(title="He said the HTML spec changed", link="https://example.com/web"))
+
+
+def test_google_deepmind_preset():
+    f = EntryFilter(SOURCE_FILTER_PRESETS["google_deepmind"])
+
+    assert f(_entry(categories=["Google DeepMind"]))
+    assert f(_entry(link="https://blog.google/technology/google-deepmind/gemini/"))
+    assert f(_entry(title="DeepMind's latest research"))
+    assert not f(_entry(title="Chrome update", link="https://blog.google/products/chrome/"))
+
+
+def test_exclude_keywords_win_and_empty_include_keeps_all():
+    f = EntryFilter({"exclude_keywords": ["sponsored"]})
+
+    assert f(_entry(title="Anything"))
+    assert not f(_entry(title="Sponsored: buy now"))
+
+
+def test_invalid_config_rejected():
+    with pytest.raises(ValueError):
+        EntryFilter({"include": ["ai"]})
+    with pytest.raises(ValueError):
+        EntryFilter({"keyword_fields": ["body"]})
+
+
+def test_compiled_filter_cached_until_config_changes():
+    source = Source(id=42, title="S", feed_url="https://example.com/feed", filter_config={"include_keywords": ["ai"]})
+
+    first = get_entry_filter(source)
+    assert get_entry_filter(source) is first
+
+    source.filter_config = {"include_keywords": ["robotics"]}
+    second = get_entry_filter(source)
+    assert second is not first
+    assert second(_entry(title="Robotics news"))
+    assert get_entry_filter(Source(id=43, title="T", feed_url="https://example.com/t")) is None
@@ -0,0 +1,61 @@
+"""Unit tests for the raw feed archive and offline replay."""
+from datetime import datetime
+from unittest.mock import Mock
+
+from backend.app.models.source import Source
+from backend.app.services.feed_archive import FeedArchive
+from backend.app.services.rss_collector import RSSCollector
+
+FEED = (
+    b"<rss version=\"2.0\"><channel>"
+    b"<item><title>A</title><link>https://example.com/a</link></item>"
+    b"<item><title>B</title><link>https://example.com/b</link></item>"
+    b"</channel></rss>"
+)
+
+
+def test_store_deduplicates_blobs_and_indexes_each_fetch(tmp_path):
+    archive = FeedArchive(str(tmp_path))
+
+    d1 = archive.store(1, FEED, fetched_at=datetime(2026, 10, 1, 12), etag='"v1"')
+    d2 = archive.store(1, FEED, fetched_at=datetime(2026, 10, 1, 13))
+    archive.store(2, b"<rss/>", fetched_at=datetime(2026, 10, 1, 12))
+
+    assert d1 == d2
+    assert len(list((tmp_path / "blobs").rglob("*.xml.gz"))) == 2
+    assert archive.load(d1) == FEED
+    assert archive.source_ids() == [1, 2]
+    records = archive.records(1, since=datetime(2026, 10, 1, 12, 30))
+    assert [r["fetched_at"].hour for r in records] == [13]
+
+
+def test_replay_archive_ingests_without_touching_fetch_metadata(tmp_path):
+    archive = FeedArchive(str(tmp_path))
+    archive.store(5, FEED, fetched_at=datetime(2026, 10, 1, 12), status=200)
+    source = Source(id=5, title="Example", feed_url="https://example.com/feed.xml")
+    collector = RSSCollector(Mock(), stop_after_known=3)
+    collector.known_items = Mock(return_value={})
+    collector.bulk_insert_items = Mock(side_effect=lambda rows: {r["link_hash"]: 10 + i for i, r in enumerate(rows)})
+
+    inserted = collector.replay_archive(archive, source)
+
+    assert inserted == [10, 11]
+    rows = collector.bulk_insert_items.call_args[0][0]
+    assert [r["link"] for r in rows] == ["https://example.com/a", "https://example.com/b"]
+    assert source.last_fetched_at is None
+
+
+def test_collect_source_archives_fetched_body(tmp_path):
+    archive = FeedArchive(str(tmp_path))
+    source = Source(id=7, title="Example", feed_url="https://example.com/feed.xml")
+    collector = RSSCollector(Mock(), archive=archive)
+    collector.known_items = Mock(return_value={})
+    collector.bulk_insert_items = Mock(return_value={})
+    fetched = {"url": source.feed_url, "status": 200, "content": FEED, "etag": None,
+               "last_modified": None, "elapsed_ms": 5.0, "error": None}
+
+    collector.collect_source(source, fetched=fetched)
+
+    records = archive.records(7)
+    assert len(records) == 1
+    assert archive.load(records[0]["sha256"]) == FEED
@@ -0,0 +1,77 @@
+"""Unit tests for the async feed fetcher (mock transport)."""
+import asyncio
+
+import httpx
+
+from backend.app.services.feed_fetcher import FeedFetcher
+
+
+async def test_fetch_returns_content_and_validators():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=b"<rss></rss>",
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 15 Jan 2025 12:00:00 GMT"},
+        )
+
+    async with FeedFetcher(transport=httpx.MockTransport(handler)) as fetcher:
+        result = await fetcher.fetch("https://example.com/feed.xml")
+
+    assert result["status"] == 200
+    assert result["content"] == b"<rss></rss>"
+    assert result["etag"] == '"v1"'
+    assert result["last_modified"] == "Wed, 15 Jan 2025 12:00:00 GMT"
+    assert result["error"] is None
+
+
+async def test_fetch_sends_conditional_headers_and_handles_304():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(request.headers)
+        return httpx.Response(304)
+
+    async with FeedFetcher(transport=httpx.MockTransport(handler)) as fetcher:
+        result = await fetcher.fetch(
+            "https://example.com/feed.xml",
+            etag='"v1"',
+            last_modified="Wed, 15 Jan 2025 12:00:00 GMT",
+        )
+
+    assert seen["if-none-match"] == '"v1"'
+    assert seen["if-modified-since"] == "Wed, 15 Jan 2025 12:00:00 GMT"
+    assert result["status"] == 304
+    assert result["content"] is None
+    assert result["error"] is None
+
+
+async def test_fetch_reports_http_errors_without_raising():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "down.example.com":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(500)
+
+    async with FeedFetcher(transport=httpx.MockTransport(handler)) as fetcher:
+        results = await fetcher.fetch_many(
+            [{"url": "https://example.com/feed.xml"}, {"url": "https://down.example.com/rss"}]
+        )
+
+    assert results[0]["error"] == "HTTP 500"
+    assert results[1]["status"] is None
+    assert "ConnectError" in results[1]["error"]
+
+
+async def test_per_host_limit_caps_concurrency():
+    active = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200, content=b"ok")
+
+    async with FeedFetcher(per_host_limit=2, transport=httpx.MockTransport(handler)) as fetcher:
+        await fetcher.fetch_many([{"url": f"https://example.com/feed{i}.xml"} for i in range(8)])
+
+    assert active["max"] == 2
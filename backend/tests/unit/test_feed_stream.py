@@ -0,0 +1,108 @@
+"""Unit tests for the streaming feed parser."""
+from datetime import datetime, timezone
+
+import pytest
+from lxml import etree
+
+from backend.app.services.feed_stream import iter_feed_entries
+from backend.app.services.rss_collector import RSSCollector
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>Example</title>
+    <item>
+      <title>First</title>
+      <link>https://example.com/1</link>
+      <guid>https://example.com/1</guid>
+      <pubDate>Wed, 15 Jan 2025 12:00:00 GMT</pubDate>
+      <dc:creator>Jane Doe</dc:creator>
+      <description>First description</description>
+      <category>AI</category>
+      <media:thumbnail url="https://example.com/1.jpg"/>
+    </item>
+    <item>
+      <title>Second</title>
+      <link>https://example.com/2</link>
+      <enclosure url="https://example.com/2.png" type="image/png"/>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example</title>
+  <entry>
+    <title>Atom entry</title>
+    <link rel="alternate" href="https://example.com/atom/1"/>
+    <id>tag:example.com,2025:1</id>
+    <published>2025-01-15T12:00:00+09:00</published>
+    <author><name>John Roe</name></author>
+    <summary>Atom summary</summary>
+    <category term="research"/>
+  </entry>
+</feed>
+"""
+
+
+def test_rss_entries():
+    entries = list(iter_feed_entries(RSS_FEED))
+
+    assert [e["title"] for e in entries] == ["First", "Second"]
+    first = entries[0]
+    assert first["link"] == "https://example.com/1"
+    assert first["published_at"] == datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+    assert first["author"] == "Jane Doe"
+    assert first["description"] == "First description"
+    assert first["categories"] == ["AI"]
+    assert first["thumbnail_url"] == "https://example.com/1.jpg"
+    assert entries[1]["thumbnail_url"] == "https://example.com/2.png"
+
+
+def test_atom_entries():
+    entries = list(iter_feed_entries(ATOM_FEED))
+
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry["link"] == "https://example.com/atom/1"
+    assert entry["guid"] == "tag:example.com,2025:1"
+    assert entry["published_at"] == datetime(2025, 1, 15, 3, 0, tzinfo=timezone.utc)
+    assert entry["author"] == "John Roe"
+    assert entry["categories"] == ["research"]
+
+
+def test_lazy_iteration_stops_early():
+    stream = iter_feed_entries(RSS_FEED)
+    assert next(stream)["title"] == "First"
+
+
+def test_malformed_feed_raises():
+    with pytest.raises(etree.XMLSyntaxError):
+        list(iter_feed_entries(b"<rss><channel><item><title>&nbsp;</title></item></channel></rss>"))
+
+
+def test_feedburner_origlink_preferred():
+    feed = (
+        b'<rss version="2.0" xmlns:feedburner="http://rssnamespace.org/feedburner/ext/1.0"><channel>'
+        b"<item><title>T</title><link>https://feedproxy.google.com/~r/example/~3/abc/</link>"
+        b"<feedburner:origLink>https://example.com/post</feedburner:origLink></item>"
+        b"</channel></rss>"
+    )
+
+    assert next(iter_feed_entries(feed))["link"] == "https://example.com/post"
+
+
+def test_description_sanitized_like_feedparser():
+    feed = (
+        b'<rss version="2.0"><channel><item><title>T</title><link>https://example.com/p</link>'
+        b"<guid>https://example.com/guid</guid>"
+        b"<description>&lt;p onclick=\"x\"&gt;Hi &lt;script&gt;bad()&lt;/script&gt;&lt;b&gt;there&lt;/b&gt;&lt;/p&gt;</description>"
+        b"</item></channel></rss>"
+    )
+
+    streamed = next(iter_feed_entries(feed))
+    parsed = RSSCollector._feed_entries(RSSCollector._parse_content(feed))[0]
+
+    assert streamed["description"] == parsed["description"] == "<p>Hi <b>there</b></p>"
+    assert streamed["guid"] == parsed["guid"] == "https://example.com/guid"
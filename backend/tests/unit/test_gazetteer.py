@@ -0,0 +1,71 @@
+"""Unit tests for the local gazetteer entity tagger."""
+from unittest.mock import Mock, patch
+
+from backend.app.services.gazetteer import Gazetteer, needs_llm
+from backend.app.services.rss_collector import RSSCollector
+
+
+def _gazetteer():
+    return Gazetteer(
+        [
+            ("OpenAI", "org", []),
+            ("GPT-4o", "tech", []),
+            ("Yann LeCun", "person", ["LeCun"]),
+            ("openai", "org", ["Open AI"]),
+            ("X", "org", []),
+        ]
+    )
+
+
+def test_tags_known_names_and_aliases_case_folded():
+    g = _gazetteer()
+
+    entities = g.tag("lecun says gpt 4o from Open AI is not AGI")
+
+    assert entities == [
+        {"name": "OpenAI", "type": "org"},
+        {"name": "GPT-4o", "type": "tech"},
+        {"name": "Yann LeCun", "type": "person"},
+    ]
+    # Duplicate spelling folded into the first name; single characters skipped
+    assert len(g) == 3
+    assert g.tag("Series X of OpenAIs") == []
+
+
+def test_needs_llm_for_low_coverage_and_samples():
+    two = [{"name": "a", "type": "org"}, {"name": "b", "type": "org"}]
+
+    assert needs_llm(two[:1], 123, min_entities=2, sample_rate=0.0)
+    assert not needs_llm(two, 123, min_entities=2, sample_rate=0.0)
+    assert needs_llm(two, 123, min_entities=2, sample_rate=1.0)
+    sampled = sum(needs_llm(two, h, min_entities=2, sample_rate=0.1) for h in range(-5000, 5000))
+    assert sampled == 1000
+
+
+def test_collector_tags_rows_before_insert():
+    collector = RSSCollector(Mock(), gazetteer=_gazetteer())
+    rows = [
+        {"title": "OpenAI ships GPT-4o", "summary_short": None, "link_hash": 5001},
+        {"title": "LeCun on world models", "summary_short": "No LLMs", "link_hash": 2},
+    ]
+
+    tagged = collector.tag_entities(rows)
+
+    assert [e["name"] for e in tagged[5001]] == ["OpenAI", "GPT-4o"]
+    assert [e["name"] for e in tagged[2]] == ["Yann LeCun"]
+    assert rows[1]["entity_status"] == "pending"
+    assert rows[0]["entity_status"] == "done"
+
+
+def test_link_entities_uses_inserted_ids_and_survives_failures():
+    db = Mock()
+    collector = RSSCollector(db, gazetteer=_gazetteer())
+    tagged = {5001: [{"name": "OpenAI", "type": "org"}], 2: [{"name": "Yann LeCun", "type": "person"}]}
+
+    with patch("backend.app.services.rss_collector.save_entities_bulk", return_value=1) as save:
+        assert collector.link_entities(tagged, {5001: 40}) == 1
+    assert save.call_args[0][1] == {40: tagged[5001]}
+
+    with patch("backend.app.services.rss_collector.save_entities_bulk", side_effect=RuntimeError("boom")):
+        assert collector.link_entities(tagged, {5001: 40, 2: 41}) == 0
+    db.rollback.assert_not_called()
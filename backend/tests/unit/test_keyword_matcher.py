@@ -0,0 +1,37 @@
+"""Unit tests for the compiled keyword matcher."""
+from backend.app.services.classifier import FIELD_MATCHER, ClassifierService
+from backend.app.services.keyword_matcher import KeywordMatcher
+
+
+def test_whole_token_matching_and_inflections():
+    m = KeywordMatcher({"ai": ["ai", "ml", "eu"], "launch": ["launch", "tool-use"]})
+
+    assert m.match("HTML tables in Europe said nothing") == {}
+    assert m.match("EU rules for AI and ML") == {"ai": {"ai", "ml", "eu"}}
+    assert m.match("Relaunched? No: launched, with tool use") == {"launch": {"launch", "tool use"}}
+
+
+def test_phrases_and_overlapping_keywords_all_hit():
+    m = KeywordMatcher({"paper": ["research paper", "paper"], "field": ["research"]})
+
+    assert m.scores("A research paper on agents") == {"paper": 2, "field": 1}
+    assert m.first_match("A research paper on agents") == "paper"
+
+
+def test_batch_matches_single_text_scores():
+    m = KeywordMatcher({"a": ["agent", "agentic"], "b": ["gpu", "inference"]})
+    texts = ["Agentic agents", "GPU inference at scale", "nothing", ""]
+
+    counts = m.batch(texts)
+
+    assert counts.tolist() == [[2, 0], [0, 2], [0, 0], [0, 0]]
+    assert m.best_categories(texts, default="none") == ["a", "b", "none", "none"]
+
+
+def test_classifier_fields_no_longer_match_inside_words():
+    svc = ClassifierService()
+    text = "european sunrise over a remodeled museum"
+
+    assert FIELD_MATCHER.scores(text) == {}
+    assert svc._infer_field(text) == "research"
+    assert svc.infer_fields([text, "startup raises seed funding round"]) == ["research", "funding"]
@@ -0,0 +1,82 @@
+"""Unit tests for the Bloom filter of known link hashes."""
+import time
+from unittest.mock import Mock
+
+from backend.app.services.link_bloom import BloomFilter, KnownLinkIndex
+from backend.app.core.link_utils import link_hash
+from backend.app.services.rss_collector import RSSCollector
+
+
+def test_bloom_has_no_false_negatives_and_low_false_positive_rate():
+    stored = [link_hash(f"https://example.com/a/{i}") for i in range(5000)]
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    bloom.add_many(stored[:2500])
+    for value in stored[2500:]:
+        bloom.add(value)
+
+    assert all(value in bloom for value in stored)
+    others = [link_hash(f"https://example.com/b/{i}") for i in range(5000)]
+    false_positives = sum(value in bloom for value in others)
+    assert false_positives < 150
+
+
+def test_index_reports_maybe_until_first_build():
+    index = KnownLinkIndex(capacity=1000, error_rate=0.01, rebuild_minutes=60)
+
+    assert not index.ready
+    assert index.might_contain(link_hash("https://example.com/x"))
+
+
+def test_existing_links_skips_db_for_definitely_new_links():
+    index = KnownLinkIndex(capacity=1000, error_rate=0.01, rebuild_minutes=60)
+    index._filter = BloomFilter(1000, 0.01)
+    index.add_inserted({link_hash("https://example.com/known"): 1})
+    db = Mock()
+    collector = RSSCollector(db, link_index=index)
+
+    assert collector.existing_links(["https://example.com/new-1", "https://example.com/new-2"]) == set()
+    db.query.assert_not_called()
+    assert collector.check_duplicate("https://example.com/new-3") is False
+    db.query.assert_not_called()
+
+    db.query.return_value.filter.return_value.all.return_value = [
+        Mock(id=1, link_hash=link_hash("https://example.com/known"), content_hash=None, dup_group_id=None)
+    ]
+    assert collector.existing_links(["https://example.com/known", "https://example.com/new-1"]) == {
+        "https://example.com/known"
+    }
+    db.query.assert_called_once()
+
+
+def test_catch_up_covers_other_writers_and_legacy_rows():
+    index = KnownLinkIndex(capacity=1000, error_rate=0.01, rebuild_minutes=60)
+    index._filter = BloomFilter(1000, 0.01)
+    index._built_at = time.monotonic()
+    db = Mock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        Mock(id=7, link_hash=link_hash("https://example.com/other-worker"), link="https://example.com/other-worker"),
+        Mock(id=8, link_hash=None, link="https://example.com/legacy?utm_source=x"),
+    ]
+
+    index.ensure_fresh(db)
+
+    assert index.might_contain(link_hash("https://example.com/other-worker"))
+    assert index.might_contain(link_hash("http://www.example.com/legacy/"))
+    assert index._max_id == 8
+
+
+def test_catch_up_does_not_recount_rows_added_by_this_process():
+    index = KnownLinkIndex(capacity=1000, error_rate=0.01, rebuild_minutes=60)
+    index._filter = BloomFilter(1000, 0.01)
+    index._built_at = time.monotonic()
+    index.add_inserted({link_hash("https://example.com/mine"): 9})
+    db = Mock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        Mock(id=8, link_hash=link_hash("https://example.com/other-worker"), link="https://example.com/other-worker"),
+        Mock(id=9, link_hash=link_hash("https://example.com/mine"), link="https://example.com/mine"),
+    ]
+
+    assert index.catch_up(db) == 1
+
+    assert index._filter.count == 2
+    assert index._max_id == 9 and not index._added_ids
@@ -0,0 +1,37 @@
+"""Unit tests for link canonicalization and link hashes."""
+from backend.app.core.link_utils import canonical_link, clean_link, link_hash
+
+
+def test_clean_link_strips_tracking_and_fragment():
+    url = "https://WWW.Example.com:443/post/?utm_source=rss&utm_medium=feed&id=7&fbclid=abc#comments"
+
+    assert clean_link(url) == "https://www.example.com/post/?id=7"
+
+
+def test_clean_link_keeps_query_encoding_and_custom_ports():
+    assert clean_link("https://example.com/search?q=a+b%2Fc&ref=rss") == "https://example.com/search?q=a+b%2Fc"
+    assert clean_link("http://example.com:8080/x") == "http://example.com:8080/x"
+    assert clean_link("urn:uuid:1234") == "urn:uuid:1234"
+
+
+def test_clean_link_unwraps_redirectors():
+    assert clean_link("https://www.google.com/url?q=https://example.com/a&sa=D") == "https://example.com/a"
+    assert clean_link("https://l.facebook.com/l.php?u=https%3A%2F%2Fexample.com%2Fb") == "https://example.com/b"
+
+
+def test_equivalent_links_share_a_hash():
+    variants = [
+        "https://www.example.com/post/?b=2&a=1",
+        "http://example.com/post?a=1&b=2&utm_campaign=x",
+        "https://example.com/post?a=1&b=2#top",
+    ]
+
+    assert {canonical_link(v) for v in variants} == {"https://example.com/post?a=1&b=2"}
+    assert len({link_hash(v) for v in variants}) == 1
+    assert link_hash("https://example.com/other") != link_hash(variants[0])
+
+
+def test_link_hash_fits_signed_bigint():
+    for i in range(200):
+        h = link_hash(f"https://example.com/{i}")
+        assert -(2 ** 63) <= h < 2 ** 63
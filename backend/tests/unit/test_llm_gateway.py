@@ -0,0 +1,132 @@
+"""Unit tests for the shared LLM gateway (fake async client, no network)."""
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.services import llm_gateway
+from backend.app.services.llm_gateway import LLMGateway, TokenBucket, estimate_tokens
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers={})
+
+
+class FakeAsyncClient:
+    def __init__(self, failures=(), delay=0.0):
+        self.failures = list(failures)
+        self.delay = delay
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            raise self.failures.pop(0)
+        return SimpleNamespace(model=kwargs["model"], usage=SimpleNamespace(total_tokens=10))
+
+
+@pytest.fixture
+def make_gateway():
+    gateways = []
+
+    def factory(client, **kwargs):
+        kwargs.setdefault("retry_base_seconds", 0.001)
+        gateway = LLMGateway(client=client, **kwargs)
+        gateways.append(gateway)
+        return gateway
+
+    yield factory
+    for gateway in gateways:
+        gateway.shutdown()
+
+
+def test_sync_client_proxies_create_and_counts_usage(make_gateway):
+    gateway = make_gateway(FakeAsyncClient())
+
+    resp = gateway.client("live").chat.completions.create(model="m", messages=[{"role": "user", "content": "hi"}])
+
+    assert resp.model == "m"
+    assert gateway.stats()["requests"] == 1
+    assert gateway.stats()["tokens"] == 10
+
+
+def test_retries_retryable_errors_and_raises_others(make_gateway):
+    fake = FakeAsyncClient(failures=[FakeStatusError(429), FakeStatusError(503)])
+    gateway = make_gateway(fake)
+
+    assert gateway.create(model="m", messages=[]).model == "m"
+    assert len(fake.calls) == 3
+    assert gateway.stats()["retries"] == 2
+
+    fake.failures = [FakeStatusError(400)]
+    with pytest.raises(FakeStatusError):
+        gateway.create(model="m", messages=[])
+
+
+def test_backoff_releases_the_concurrency_slot(make_gateway, monkeypatch):
+    backing_off = threading.Event()
+    release_retry = threading.Event()
+
+    async def held_backoff(delay):
+        # Backoff lasts until the test lets it end, whatever the random delay
+        backing_off.set()
+        while not release_retry.is_set():
+            await asyncio.sleep(0.001)
+
+    monkeypatch.setattr(llm_gateway, "asyncio", SimpleNamespace(
+        sleep=held_backoff,
+        new_event_loop=asyncio.new_event_loop,
+        run_coroutine_threadsafe=asyncio.run_coroutine_threadsafe,
+    ))
+    fake = FakeAsyncClient(failures=[FakeStatusError(503)])
+    gateway = make_gateway(fake, max_concurrency=1)
+
+    retrying = threading.Thread(target=gateway.create, kwargs={"model": "retrying", "messages": []})
+    retrying.start()
+    assert backing_off.wait(5)
+    other = threading.Thread(target=gateway.create, kwargs={"model": "other", "messages": []})
+    other.start()
+    other.join(5)
+    finished_during_backoff = not other.is_alive()
+    release_retry.set()
+    retrying.join(5)
+    other.join(5)
+
+    assert finished_during_backoff
+    assert [c["model"] for c in fake.calls] == ["retrying", "other", "retrying"]
+
+
+def test_live_requests_are_admitted_before_backfill(make_gateway):
+    fake = FakeAsyncClient(delay=0.05)
+    gateway = make_gateway(fake, max_concurrency=1)
+
+    def call(priority, name):
+        gateway.create(priority, model=name, messages=[])
+
+    first = threading.Thread(target=call, args=("backfill", "first"))
+    first.start()
+    while not fake.calls:
+        threading.Event().wait(0.001)
+    threads = [threading.Thread(target=call, args=("backfill", "backfill"))]
+    threads[0].start()
+    threading.Event().wait(0.01)
+    threads.append(threading.Thread(target=call, args=("live", "live")))
+    threads[1].start()
+    for t in [first, *threads]:
+        t.join()
+
+    assert [c["model"] for c in fake.calls] == ["first", "live", "backfill"]
+
+
+def test_token_bucket_wait_and_estimate():
+    bucket = TokenBucket(per_minute=60)
+    bucket.take(60)
+
+    assert bucket.wait_time(1, bucket._updated) == pytest.approx(1.0)
+    assert estimate_tokens({"messages": [{"content": "x" * 400}], "max_tokens": 100}) == 200
@@ -0,0 +1,82 @@
+"""Unit tests for the local fast-tier classifier."""
+from unittest.mock import Mock
+
+import numpy as np
+
+from backend.app.services.classifier import ClassifierService
+from backend.app.services.local_classifier import LocalClassifier
+
+
+def _corpus():
+    texts, tags = [], []
+    for i in range(30):
+        texts.append(f"agentic agent tool use benchmark {i}")
+        tags.append(["agents"])
+        texts.append(f"gpu accelerator inference chip {i}")
+        tags.append(["inference_infra"])
+    return texts, {"custom_tags": tags, "iptc_topics": [["technology"]] * len(texts), "iab_categories": [[]] * len(texts)}
+
+
+def test_train_predict_and_evaluate():
+    texts, labels = _corpus()
+    model = LocalClassifier.train(texts, labels, min_support=3)
+
+    predictions, confidence = model.predict_many(["new agentic agent for tool use", "inference chip"])
+
+    assert predictions[0]["custom_tags"] == ["agents"]
+    assert predictions[1]["custom_tags"] == ["inference_infra"]
+    # A label present on every item is not learned, just always predicted
+    assert model.groups["iptc_topics"]["model"] is None
+    assert predictions[0]["iptc_topics"] == ["technology"]
+    assert confidence.shape == (2,)
+    report = model.evaluate(texts, labels, threshold=0.5)
+    assert report["groups"]["custom_tags"]["all"]["f1"] == 1.0
+
+
+def test_save_load_roundtrip(tmp_path):
+    texts, labels = _corpus()
+    labels["custom_tags"] = [t if i % 2 else [] for i, t in enumerate(labels["custom_tags"])]  # single learned label
+    model = LocalClassifier.train(texts, labels, min_support=3)
+    path = str(tmp_path / "local.joblib")
+    model.save(path)
+
+    loaded = LocalClassifier.load(path)
+
+    assert loaded.predict("gpu inference chip")[0]["custom_tags"] == ["inference_infra"]
+    assert loaded.predict("agentic agent")[0]["custom_tags"] == []
+
+
+def test_classifier_uses_local_when_confident_and_escalates_otherwise():
+    svc = ClassifierService()
+    svc._local = Mock()
+    svc._client = Mock()
+    svc._classify_with_llm = Mock(return_value={"custom_tags": ["world_models"], "iptc_topics": [], "iab_categories": []})
+    threshold = svc._settings.LOCAL_CLASSIFIER_THRESHOLD
+
+    svc._local.predict.return_value = ({"custom_tags": ["agents"], "iptc_topics": [], "iab_categories": []}, threshold)
+    local = svc.classify("Agents ship", "")
+    svc._local.predict.return_value = ({"custom_tags": ["agents"], "iptc_topics": [], "iab_categories": []}, threshold - 0.1)
+    escalated = svc.classify("JEPA", "")
+
+    assert (local["custom_tags"], local["classified_by"]) == (["agents"], "local")
+    assert (escalated["custom_tags"], escalated["classified_by"]) == (["world_models"], "llm")
+    assert svc._classify_with_llm.call_count == 1
+
+
+def test_confident_empty_local_prediction_escalates():
+    svc = ClassifierService()
+    svc._local = Mock()
+    svc._client = Mock()
+    svc.cache = None
+    llm_labels = {"custom_tags": ["world_models"], "iptc_topics": [], "iab_categories": []}
+    svc._classify_with_llm = Mock(return_value=llm_labels)
+    svc._classify_batch_with_llm = Mock(return_value={"1": llm_labels})
+    empty = {"custom_tags": [], "iptc_topics": [], "iab_categories": []}
+    svc._local.predict.return_value = (empty, 1.0)
+    svc._local.predict_many.return_value = ([empty], np.array([1.0]))
+
+    single = svc.classify("JEPA", "")
+    batch = svc.classify_batch([{"id": 1, "title": "JEPA", "summary": ""}])
+
+    assert (single["custom_tags"], single["classified_by"]) == (["world_models"], "llm")
+    assert (batch[0]["custom_tags"], batch[0]["classified_by"]) == (["world_models"], "llm")
@@ -0,0 +1,63 @@
+"""Unit tests for the MinHash LSH grouping candidate index."""
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from backend.app.services.minhash_lsh import MinHashLSH, shingles
+from backend.app.services.rss_collector import RSSCollector
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+def _index():
+    index = MinHashLSH(bands=64, rows=2)
+    index.add(1, "OpenAI releases new GPT model for language tasks", NOW - timedelta(days=1))
+    index.add(2, "Nvidia unveils Blackwell GPUs for datacenter inference", NOW - timedelta(days=10))
+    index.add(3, "Rust 2.0 roadmap published by the language team", NOW)
+    return index
+
+
+def test_query_finds_near_duplicates_only():
+    index = _index()
+
+    assert 1 in index.query("New GPT language model released by OpenAI")
+    assert index.query("Nvidia unveils Blackwell GPUs for datacenter inference", exclude=2) == set()
+    assert 2 not in index.query("Sourdough bread recipes for beginners")
+    assert index.query("the and of") == set()
+    assert shingles("The GPT-5 model, a model") == {"gpt", "model"}
+
+
+def test_add_replaces_and_prune_drops_old_items():
+    index = _index()
+
+    index.add(1, "Sourdough bread recipes for beginners", NOW)
+    assert 1 not in index.query("OpenAI releases new GPT model for language tasks")
+    assert index.prune(NOW - timedelta(days=5)) == 1
+    assert 2 not in index and len(index) == 2
+    assert index.max_id == 3
+
+
+def test_edited_items_are_re_signed_in_the_process_index():
+    index = _index()
+    stored = {"id": 2, "content_hash": 1, "dup_group_id": None}
+    row = {"title": "Sourdough bread recipes", "summary_short": "for beginners", "thumbnail_url": None,
+           "author": None, "content_hash": 2}
+
+    with patch("backend.app.services.minhash_lsh._index", index):
+        assert RSSCollector(Mock()).refresh_changed_items([(stored, row)]) == 1
+
+    assert 2 in index.query("Sourdough bread recipes for beginners")
+    assert 2 not in index.query("Nvidia unveils Blackwell GPUs for datacenter inference")
+    assert index.prune(NOW - timedelta(days=5)) == 1  # published time kept
+    assert index.update(2, "anything") is False
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = _index()
+    path = str(tmp_path / "lsh.npz")
+
+    index.save(path)
+    loaded = MinHashLSH.load(path)
+
+    assert len(loaded) == 3 and loaded.max_id == 3
+    text = "Nvidia Blackwell GPUs for inference"
+    assert loaded.query(text) == index.query(text)
@@ -0,0 +1,45 @@
+"""Unit tests for per-model health tracking."""
+from unittest.mock import Mock
+
+from backend.app.services.classifier import LLM_MODELS, ClassifierService
+from backend.app.services.model_health import ModelHealth
+
+
+def test_circuit_opens_after_consecutive_failures_and_recovers():
+    health = ModelHealth(failure_threshold=2, cooldown_seconds=60)
+    health.record_failure("a", "429", now=0)
+    assert health.is_available("a", now=1)
+
+    health.record_failure("a", "429", now=1)
+    assert not health.is_available("a", now=2)
+    assert health.order(["a", "b"], now=2) == ["b"]
+    assert health.snapshot(now=2)["a"]["state"] == "open"
+
+    assert health.snapshot(now=62)["a"]["state"] == "half_open"
+    assert health.order(["a", "b"], now=62) == ["a", "b"]
+    health.record_success("a", 100)
+    assert health.snapshot(now=62)["a"]["state"] == "closed"
+
+
+def test_order_prefers_fastest_measured_then_configured_order():
+    health = ModelHealth()
+    health.record_success("b", 300)
+    health.record_success("c", 100)
+
+    assert health.order(["a", "b", "c"]) == ["c", "b", "a"]
+
+
+def test_classifier_skips_model_with_open_circuit():
+    svc = ClassifierService()
+    svc._health = ModelHealth(failure_threshold=1, cooldown_seconds=600)
+    svc._health.record_failure(LLM_MODELS[0], "rejected")
+    svc._client = Mock()
+    reply = Mock()
+    reply.choices = [Mock(message=Mock(content='{"custom_tags": ["agents"]}'))]
+    svc._client.chat.completions.create.return_value = reply
+
+    out = svc.classify("Agents ship", "")
+
+    assert out["custom_tags"] == ["agents"]
+    assert svc._client.chat.completions.create.call_args.kwargs["model"] == LLM_MODELS[1]
+    assert svc._health.snapshot()[LLM_MODELS[1]]["successes"] == 1
@@ -0,0 +1,104 @@
+"""Unit tests for the adaptive polling policy."""
+import random
+import uuid
+from datetime import datetime, timedelta
+
+from backend.app.models.item import Item
+from backend.app.models.source import Source
+from backend.app.services.poll_policy import (
+    circuit_state,
+    compute_poll_interval,
+    failure_backoff_minutes,
+    next_poll_time,
+    record_source_failure,
+    record_source_success,
+    update_source_schedule,
+)
+
+NOW = datetime(2025, 1, 15, 12, 0, 0)
+
+
+def _every(minutes: int, count: int):
+    return [NOW - timedelta(minutes=minutes * i) for i in range(count)]
+
+
+def test_busy_feed_polled_at_half_inter_arrival():
+    interval = compute_poll_interval(_every(60, 20), 0, default_minutes=20, min_minutes=10, max_minutes=720)
+    assert interval == 30
+
+
+def test_interval_clamped_to_bounds():
+    busy = compute_poll_interval(_every(2, 20), 0, default_minutes=20, min_minutes=10, max_minutes=720)
+    dormant = compute_poll_interval(_every(7 * 24 * 60, 5), 0, default_minutes=20, min_minutes=10, max_minutes=720)
+    assert busy == 10
+    assert dormant == 720
+
+
+def test_batched_publish_times_use_gap_between_batches():
+    # arXiv-style: many items share one timestamp per daily drop
+    times = [NOW] * 10 + [NOW - timedelta(days=1)] * 10 + [NOW - timedelta(days=2)] * 10
+    interval = compute_poll_interval(times, 0, default_minutes=20, min_minutes=10, max_minutes=10_000)
+    assert interval == 12 * 60
+
+
+def test_schedule_learns_daily_cadence_from_batched_items(test_db):
+    # 50 arXiv-style entries per daily drop: the latest 20 items all share one timestamp
+    unique_id = uuid.uuid4().hex[:8]
+    source = Source(title=f"arXiv {unique_id}", feed_url=f"https://example.com/arxiv_{unique_id}.xml")
+    test_db.add(source)
+    test_db.flush()
+    for day in range(4):
+        drop = NOW - timedelta(days=day)
+        test_db.add_all(
+            Item(source_id=source.id, title=f"Paper {day}-{i}", link=f"https://example.com/{unique_id}/{day}/{i}",
+                 published_at=drop)
+            for i in range(50)
+        )
+    test_db.flush()
+
+    update_source_schedule(test_db, source, new_items=50, now=NOW)
+
+    assert source.poll_interval_minutes == 720
+
+
+def test_empty_polls_stretch_interval_and_history_fallback():
+    base = compute_poll_interval([], 0, default_minutes=20, min_minutes=10, max_minutes=720)
+    stretched = compute_poll_interval([], 2, default_minutes=20, min_minutes=10, max_minutes=720)
+    assert base == 20
+    assert stretched == 20 * 1.5 ** 2
+
+
+def test_next_poll_time_jitter_within_bounds():
+    rng = random.Random(42)
+    for _ in range(50):
+        t = next_poll_time(NOW, 60, jitter_ratio=0.1, rng=rng)
+        assert NOW + timedelta(minutes=54) <= t <= NOW + timedelta(minutes=66)
+    assert next_poll_time(NOW, 60, jitter_ratio=0) == NOW + timedelta(minutes=60)
+
+
+def test_failure_backoff_is_exponential_then_circuit_opens():
+    delays = [
+        failure_backoff_minutes(n, base_minutes=10, max_minutes=360, circuit_threshold=5, circuit_open_minutes=720)
+        for n in range(1, 7)
+    ]
+    assert delays == [10, 20, 40, 80, 720, 720]
+    assert failure_backoff_minutes(4, 100, 150, 5, 720) == 150
+
+
+def test_record_failure_and_success_drive_circuit_state():
+    source = Source(title="Broken", feed_url="https://example.com/broken.xml")
+    source.consecutive_failures = 0
+
+    for _ in range(5):
+        record_source_failure(source, "HTTP 500", now=NOW)
+
+    assert source.consecutive_failures == 5
+    assert source.last_error == "HTTP 500"
+    assert source.next_poll_at > NOW + timedelta(hours=10)
+    assert circuit_state(source, now=NOW) == "open"
+    assert circuit_state(source, now=source.next_poll_at) == "half_open"
+
+    record_source_success(source, now=NOW)
+    assert source.consecutive_failures == 0
+    assert source.last_error is None
+    assert circuit_state(source, now=NOW) == "closed"
@@ -1,10 +1,13 @@
 """Unit tests for RSS collector service."""
+import multiprocessing
+import pickle
 import pytest
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
 import uuid
 
-from backend.app.services.rss_collector import RSSCollector
+from backend.app.services.rss_collector import ENTRY_FIELDS, RSSCollector, parse_feed_bytes
 from backend.app.models.source import Source
 from backend.app.models.item import Item
 
@@ -90,6 +93,236 @@ class TestRSSCollectorParseFeed:
         assert len(result) == 1
         assert isinstance(result[0]["published_at"], datetime)
         assert result[0]["published_at"].tzinfo == timezone.utc
+    
+    @patch('backend.app.services.rss_collector.feedparser')
+    def test_parse_feed_not_modified(self, mock_feedparser):
+        """Test conditional GET returning 304 skips parsing."""
+        mock_feed = MagicMock()
+        mock_feed.bozo = False
+        mock_feed.status = 304
+        mock_feed.etag = '"abc123"'
+        mock_feed.modified = "Wed, 15 Jan 2025 12:00:00 GMT"
+        mock_feed.entries = []
+        mock_feedparser.parse.return_value = mock_feed
+        
+        collector = RSSCollector(Mock())
+        result = collector.parse_feed(
+            "https://example.com/feed.xml",
+            etag='"abc123"',
+            modified="Wed, 15 Jan 2025 12:00:00 GMT",
+        )
+        
+        assert result == []
+        assert collector.last_fetch == {
+            "status": 304,
+            "etag": '"abc123"',
+            "last_modified": "Wed, 15 Jan 2025 12:00:00 GMT",
+        }
+        _, kwargs = mock_feedparser.parse.call_args
+        assert kwargs["etag"] == '"abc123"'
+        assert kwargs["modified"] == "Wed, 15 Jan 2025 12:00:00 GMT"
+
+
+class TestRSSCollectorStreamingParse:
+    """Test streaming parse with early stop."""
+    
+    FEED = (
+        "<rss version=\"2.0\"><channel>"
+        + "".join(
+            f"<item><title>Article {i}</title><link>https://example.com/{i}</link></item>"
+            for i in range(30)
+        )
+        + "</channel></rss>"
+    ).encode()
+    
+    def test_stops_after_run_of_known_entries(self):
+        """Test parsing stops once enough consecutive entries are known."""
+        collector = RSSCollector(Mock(), stop_after_known=3)
+        known_links = {f"https://example.com/{i}" for i in range(2, 30)}
+        collector.known_items = Mock(side_effect=lambda links: {link: {"id": 1} for link in links if link in known_links})
+        
+        entries, known = collector.parse_new_entries(self.FEED, chunk_size=5)
+        
+        assert [e["link"] for e in entries] == [f"https://example.com/{i}" for i in range(5)]
+        assert collector.known_items.call_count == 1
+        assert set(known) == {f"https://example.com/{i}" for i in range(2, 5)}
+    
+    def test_permalink_guid_counts_as_known(self):
+        """Test an entry whose link changed is known through its GUID permalink."""
+        feed = (
+            "<rss version=\"2.0\"><channel>"
+            + "".join(
+                f"<item><title>Article {i}</title><link>https://feeds.example.net/~r/{i}</link>"
+                f"<guid>https://example.com/{i}</guid></item>"
+                for i in range(10)
+            )
+            + "</channel></rss>"
+        ).encode()
+        collector = RSSCollector(Mock(), stop_after_known=3)
+        stored = {f"https://example.com/{i}": {"id": i} for i in range(1, 10)}
+        collector.known_items = Mock(side_effect=lambda links: {link: stored[link] for link in links if link in stored})
+        
+        entries, known = collector.parse_new_entries(feed, chunk_size=5)
+        
+        assert len(entries) == 4
+        assert known == {f"https://feeds.example.net/~r/{i}": {"id": i} for i in range(1, 4)}
+    
+    def test_filtered_entries_do_not_break_known_run(self):
+        """Test entries rejected by the source filter are skipped."""
+        collector = RSSCollector(Mock(), stop_after_known=2)
+        collector.known_items = Mock(side_effect=lambda links: {link: {"id": 1} for link in links})
+        only_even = lambda e: int(e["link"].rsplit("/", 1)[-1]) % 2 == 0
+        
+        entries, _ = collector.parse_new_entries(self.FEED, entry_filter=only_even, chunk_size=5)
+        
+        assert [e["link"] for e in entries] == ["https://example.com/0", "https://example.com/2"]
+    
+    @patch('backend.app.services.rss_collector.feedparser')
+    def test_malformed_feed_falls_back_to_feedparser(self, mock_feedparser):
+        """Test malformed XML is handed to feedparser."""
+        mock_feed = MagicMock()
+        mock_feed.bozo = False
+        mock_feed.entries = []
+        mock_feedparser.parse.return_value = mock_feed
+        collector = RSSCollector(Mock(), stop_after_known=3)
+        collector.known_items = Mock(return_value={})
+        
+        entries, known = collector.parse_new_entries(b"<rss><item>&nbsp;</item></rss>")
+        
+        assert entries == []
+        mock_feedparser.parse.assert_called_once()
+
+    
+    def test_collect_source_records_run_timings(self):
+        """Test collect_source fills last_run with counters and stage timings."""
+        collector = RSSCollector(Mock(), stop_after_known=3)
+        collector.known_items = Mock(return_value={})
+        collector.bulk_insert_items = Mock(side_effect=lambda rows: {r["link_hash"]: i for i, r in enumerate(rows)})
+        source = Source(id=1, title="Example", feed_url="https://example.com/feed.xml")
+        fetched = {"status": 200, "content": self.FEED, "etag": None, "last_modified": None,
+                   "elapsed_ms": 12.5, "error": None}
+        
+        count = collector.collect_source(source, fetched=fetched)
+        
+        run = collector.last_run
+        assert count == 30
+        assert run["http_status"] == 200
+        assert run["bytes"] == len(self.FEED)
+        assert run["entries_seen"] == 30
+        assert run["new_items"] == 30
+        assert run["fetch_ms"] == 12.5
+        assert run["parse_ms"] >= 0 and run["commit_ms"] >= 0
+
+
+class TestRSSCollectorProcessPoolParse:
+    """Test parsing pre-fetched bytes in a process pool."""
+    
+    FEED = (
+        b"<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>T</title>"
+        b"<item><title>First</title><link>https://example.com/1</link>"
+        b"<pubDate>Wed, 15 Jan 2025 12:00:00 GMT</pubDate><category>AI</category></item>"
+        b"<item><title>Second</title><link>https://example.com/2</link></item>"
+        b"</channel></rss>"
+    )
+    
+    def test_parse_feed_bytes_returns_picklable_tuples(self):
+        """Test the module-level parser returns compact tuples."""
+        entries = parse_feed_bytes(self.FEED)
+        
+        assert len(entries) == 2
+        assert all(isinstance(e, tuple) and len(e) == len(ENTRY_FIELDS) for e in entries)
+        assert pickle.loads(pickle.dumps(entries)) == entries
+    
+    def test_parse_feed_uses_process_pool(self):
+        """Test parse_feed(content=...) gives the same entries through a process pool."""
+        in_thread = RSSCollector(Mock()).parse_feed("https://example.com/feed", content=self.FEED)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            in_process = RSSCollector(Mock(), parse_executor=pool).parse_feed(
+                "https://example.com/feed", content=self.FEED
+            )
+        
+        assert [e["link"] for e in in_process] == ["https://example.com/1", "https://example.com/2"]
+        assert in_process[0]["categories"] == ["AI"]
+        assert in_process[0]["published_at"] == in_thread[0]["published_at"]
+
+
+class TestRSSCollectorChangeDetection:
+    """Test content-hash based refresh of already-stored entries."""
+    
+    def _row(self, collector, title):
+        source = Source(id=1, title="Example", feed_url="https://example.com/feed.xml")
+        entry = {"title": title, "link": "https://example.com/a", "published_at": datetime.now(timezone.utc),
+                 "description": "Summary", "author": None, "thumbnail_url": None}
+        return collector.normalize_item(entry, source)
+    
+    def test_unchanged_entries_are_not_written(self):
+        """Test identical payloads produce no UPDATE."""
+        db = Mock()
+        collector = RSSCollector(db)
+        row = self._row(collector, "Title")
+        stored = {"id": 1, "content_hash": row["content_hash"], "dup_group_id": 1}
+        
+        assert collector.refresh_changed_items([(stored, row)]) == 0
+        db.execute.assert_not_called()
+    
+    def test_changed_entry_is_updated_and_requeued(self):
+        """Test an edited entry is rewritten, re-classified and leaves its group."""
+        db = Mock()
+        collector = RSSCollector(db)
+        old = self._row(collector, "Old title")
+        row = self._row(collector, "New title")
+        stored = {"id": 5, "content_hash": old["content_hash"], "dup_group_id": 2}
+        
+        assert collector.refresh_changed_items([(stored, row)]) == 1
+        item_update = db.execute.call_args_list[0][0][1][0]
+        assert item_update["id"] == 5
+        assert item_update["title"] == "New title"
+        assert item_update["classification_status"] == "pending"
+        assert item_update["dup_group_id"] is None
+        # Group 2's member count is decremented
+        assert db.execute.call_count == 2
+    
+    def test_parser_markup_differences_are_not_changes(self):
+        """Test raw (lxml) and sanitized (feedparser) descriptions hash the same."""
+        collector = RSSCollector(Mock())
+        source = Source(id=1, title="Example", feed_url="https://example.com/feed.xml")
+        base = {"title": "Title", "link": "https://example.com/a", "published_at": datetime.now(timezone.utc),
+                "author": None, "thumbnail_url": None}
+        raw = collector.normalize_item({**base, "description": "<p>Fast &amp; cheap\n <b>models</b></p>"}, source)
+        clean = collector.normalize_item({**base, "description": "<p>Fast &amp; cheap <b>models</b></p>"}, source)
+        
+        assert raw["content_hash"] == clean["content_hash"]
+    
+    def test_collect_source_reuses_known_lookup(self):
+        """Test known entries are looked up once and refreshed from that lookup."""
+        feed = (
+            "<rss version=\"2.0\"><channel>"
+            "<item><title>New</title><link>https://example.com/new</link></item>"
+            "<item><title>Old</title><link>https://example.com/old</link></item>"
+            "</channel></rss>"
+        ).encode()
+        collector = RSSCollector(Mock())
+        stored = {"id": 3, "content_hash": None, "dup_group_id": 3}
+        collector.known_items = Mock(return_value={"https://example.com/old": stored})
+        collector.refresh_changed_items = Mock(return_value=0)
+        collector.bulk_insert_items = Mock(side_effect=lambda rows: {r["link_hash"]: i for i, r in enumerate(rows)})
+        source = Source(id=1, title="Example", feed_url="https://example.com/feed.xml")
+        fetched = {"status": 200, "content": feed, "etag": None, "last_modified": None,
+                   "elapsed_ms": 1.0, "error": None}
+        
+        assert collector.collect_source(source, fetched=fetched) == 1
+        collector.known_items.assert_called_once()
+        pairs = collector.refresh_changed_items.call_args[0][0]
+        assert [(s, r["title"]) for s, r in pairs] == [(stored, "Old")]
+    
+    def test_legacy_rows_only_get_hash_filled(self):
+        """Test items stored before hashing are not treated as changed."""
+        db = Mock()
+        collector = RSSCollector(db)
+        row = self._row(collector, "Title")
+        
+        assert collector.refresh_changed_items([({"id": 9, "content_hash": None, "dup_group_id": 9}, row)]) == 0
+        assert db.execute.call_args[0][1] == [{"id": 9, "content_hash": row["content_hash"]}]
 
 
 class TestRSSCollectorCheckDuplicate:
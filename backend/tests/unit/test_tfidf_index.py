@@ -0,0 +1,43 @@
+"""Unit tests for the window TF-IDF index used by Deduplicator."""
+from backend.app.models.item import Item
+from backend.app.services.deduplicator import Deduplicator
+from backend.app.services.tfidf_index import TfidfIndex
+
+DOCS = {
+    1: "OpenAI releases new GPT model for language tasks",
+    2: "New GPT language model released by OpenAI",
+    3: "GPU shortage hits datacenter buildout",
+    4: "",
+}
+
+
+def test_similarities_rank_near_duplicates_first():
+    index = TfidfIndex().fit(DOCS)
+
+    sims = index.similarities(DOCS[1], list(DOCS.items()))
+
+    assert abs(sims[0] - 1.0) < 1e-9
+    assert sims[1] > 0.3 > sims[2]
+    assert sims[3] == 0.0
+    assert index.similarities("", list(DOCS.items())).tolist() == [0.0] * 4
+
+
+def test_unfitted_and_changed_docs_are_vectorized_on_demand():
+    index = TfidfIndex().fit(DOCS)
+
+    before = index.similarities(DOCS[1], [(5, DOCS[2]), (3, DOCS[3])])
+    after = index.similarities(DOCS[1], [(3, DOCS[2])])
+
+    assert abs(before[0] - after[0]) < 1e-9
+    assert len(index) == 6
+
+
+def test_deduplicator_scores_candidates_with_one_index():
+    items = [Item(id=i, title=t, link=f"https://example.com/{i}") for i, t in DOCS.items()]
+    d = Deduplicator(db=None)
+
+    bases = d._base_similarities(DOCS[1], items[1:], items)
+
+    assert d.index is not None and len(d.index) == 4
+    assert bases[0] > 0.3 > bases[1]
+    assert d._augmented_similarity(items[0], items[1], base=bases[0]) >= bases[0]